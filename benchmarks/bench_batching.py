@@ -0,0 +1,103 @@
+"""
+benchmarks/bench_batching.py
+────────────────────────────────────────────────────────────
+대량 재생성 시뮬레이션: 요청마다 바로 전송 vs GeminiBatcher 창 단위 묶음 전송
+
+    python -m benchmarks.bench_batching --reports 64 --threads 24 --dup 0.25 --window 0.05
+    python -m benchmarks.bench_batching --rpm 1200        # 쿼터가 병목인 백필
+
+· 보고서 1건 = Gemini 호출 3회 (요약 · 액션 · 통합 분석 프롬프트)
+· --dup 비율의 보고서는 앞선 보고서와 같은 회의록 (재전송 · 동일 회의 반복 백필)
+· direct  : GeminiClient – 스레드 --threads 개가 요청마다 바로 전송
+· batched : BatchedGeminiClient – 같은 스레드 수로 제출, 창 안의 같은 바디는 1회만 전송
+            (배치 모드의 호출 스레드는 결과만 기다리므로 CLI 는 스레드를 --jobs × 3 으로 늘린다)
+항목별 경과 시간 · reports/h · 목 서버 Gemini 호출 수 출력. 응답 캐시는 끈다.
+쿼터 제한이 없으면 창 대기만큼 느려질 수 있고, --rpm 으로 쿼터가 병목이 되면
+줄어든 호출 수만큼 reports/h 가 늘어난다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Tuple
+
+from benchmarks import mock_gemini
+from benchmarks.common import Results, add_gate_args, report, use_mock
+
+_SYS = ("SUMMARY: summarize the meeting.", "ACTIONS: list action items.", "ANALYSIS: relate docs.")
+
+
+def _workload(reports: int, dup: float, seed: int = 7) -> List[Tuple[str, str]]:
+    rnd = random.Random(seed)
+    meetings: List[str] = []
+    calls = []
+    for n in range(reports):
+        if meetings and rnd.random() < dup:
+            text = rnd.choice(meetings)
+        else:
+            text = f"meeting {n}: we agreed to move the launch review to next sprint."
+            meetings.append(text)
+        calls.extend((sys, text) for sys in _SYS)
+    return calls
+
+
+def _run(generate: Callable[[str, str], str], calls: List[Tuple[str, str]], threads: int) -> float:
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(lambda c: generate(*c), calls))
+    return time.perf_counter() - t0
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser("Gemini batching benchmark")
+    ap.add_argument("--reports", type=int, default=64)
+    ap.add_argument("--threads", type=int, default=24, help="동시에 요청을 넣는 호출 스레드 수")
+    ap.add_argument("--dup", type=float, default=0.25, help="앞선 회의록을 다시 보내는 보고서 비율")
+    ap.add_argument("--window", type=float, default=0.05, help="배치 창(초)")
+    ap.add_argument("--max-batch", type=int, default=32)
+    ap.add_argument("--latency", type=float, default=0.3)
+    ap.add_argument("--rpm", type=int, default=0, help="클라이언트 쪽 GEMINI_RPM (0 = 제한 없음)")
+    add_gate_args(ap)
+    a = ap.parse_args()
+
+    srv = mock_gemini.start(latency=a.latency)
+    use_mock(srv)
+    os.environ["LLM_CACHE_ENABLED"] = "false"
+    os.environ["GEMINI_RPM"] = str(a.rpm)
+
+    from src.api_clients.batching import BatchedGeminiClient, GeminiBatcher
+    from src.api_clients.gemini_client import AsyncGeminiClient, GeminiClient
+    from src.api_clients.rate_limit import get_rate_limiter, get_retry_policy
+
+    url = os.environ["LLM_API"]
+    calls = _workload(a.reports, a.dup)
+    direct = GeminiClient(url, limiter=get_rate_limiter(), retry=get_retry_policy())
+    batcher = GeminiBatcher(
+        AsyncGeminiClient(url, limiter=get_rate_limiter(), retry=get_retry_policy(), http2=True),
+        window=a.window, max_batch=a.max_batch,
+    )
+    batched = BatchedGeminiClient(batcher)
+
+    results: Results = {}
+    print(f"reports={a.reports} calls={len(calls)} threads={a.threads} "
+          f"latency={a.latency}s rpm={a.rpm or '-'}")
+    print(f"{'path':<8} {'seconds':>8} {'reports/h':>10} {'gemini':>7}")
+    for name, client in (("direct", direct), ("batched", batched)):
+        before = srv.stats["calls"]  # type: ignore[attr-defined]
+        elapsed = _run(client.generate, calls, a.threads)
+        sent = srv.stats["calls"] - before  # type: ignore[attr-defined]
+        rph = a.reports / elapsed * 3600
+        print(f"{name:<8} {elapsed:7.2f}s {rph:10.0f} {sent:7d}")
+        results[name] = {"seconds": elapsed, "rps": a.reports / elapsed, "gemini_calls": float(sent)}
+
+    batcher.close()
+    srv.shutdown()
+    report(results, a)
+
+
+if __name__ == "__main__":
+    main()
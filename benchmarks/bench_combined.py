@@ -0,0 +1,67 @@
+"""
+benchmarks/bench_combined.py
+────────────────────────────────────────────────────────────
+분리 호출(3회) vs 1회 구조화 출력 호출: 토큰 · 지연 비교
+
+    python -m benchmarks.bench_combined --latency 0.5 --per-kchar 0.05
+
+목 서버가 입력 길이에 비례한 prefill 지연과 usageMetadata 를 흉내 내므로
+호출 수 · 입력 토큰 · 벽시계 시간을 함께 보고한다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import time
+from pathlib import Path
+
+from benchmarks import mock_gemini
+
+_ROOT = Path(__file__).resolve().parent.parent
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser("Combined vs split benchmark")
+    ap.add_argument("--latency", type=float, default=0.5)
+    ap.add_argument("--per-kchar", type=float, default=0.05)
+    ap.add_argument("--rounds", type=int, default=3)
+    a = ap.parse_args()
+
+    srv = mock_gemini.start(latency=a.latency, per_kchar=a.per_kchar)
+    os.environ["LLM_API"] = f"http://127.0.0.1:{srv.server_port}/v1beta/models/mock"
+    os.environ.setdefault("PIPELINE_API", "http://127.0.0.1:9/")
+    os.environ.setdefault("API_KEY", "benchmark-dummy-key")
+    os.environ["LLM_CACHE_ENABLED"] = "false"
+
+    from src.models.schemas import PipelineRequest
+    from src.service import report_service as svc
+
+    raw = json.loads((_ROOT / "data" / "sample_pipeline.json").read_text(encoding="utf-8"))
+    raw["text_stt"] = (_ROOT / "data" / "sample_meeting.txt").read_text(encoding="utf-8")[:18000]
+    p = PipelineRequest.model_validate(raw)
+
+    from src.processors.combined_processor import CombinedReportProcessor
+
+    flows = {
+        "split": lambda: svc._run_processors(p),
+        "combined": lambda: CombinedReportProcessor(svc._gem()).run(p.text_stt, p.all_documents),
+    }
+    print(f"{'flow':<9} {'calls':>5} {'in_chars':>9} {'in_tokens':>9} {'mean_s':>7}")
+    for name, fn in flows.items():
+        mock_gemini.reset_stats(srv)
+        laps = []
+        for _ in range(a.rounds):
+            t0 = time.perf_counter()
+            fn()
+            laps.append(time.perf_counter() - t0)
+        st = srv.stats
+        print(f"{name:<9} {st['calls'] // a.rounds:>5} {st['input_chars'] // a.rounds:>9} "
+              f"{st['prompt_tokens'] // a.rounds:>9} {sum(laps) / len(laps):>7.3f}")
+
+    srv.shutdown()
+
+
+if __name__ == "__main__":
+    main()
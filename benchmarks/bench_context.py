@@ -0,0 +1,114 @@
+"""
+benchmarks/bench_context.py
+────────────────────────────────────────────────────────────
+통합 분석 프롬프트의 '문서' 구역: 기존 방식 vs ContextBuilder
+
+    python -m benchmarks.bench_context --chunks 12 --docs-per-chunk 6
+
+청크마다 related_docs 를 붙인 합성 PipelineRequest 를 만든다.
+· 문서 절반은 다른 청크 문서의 거의-복제본 (문장 1개만 다름)
+· all_documents 는 허브처럼 점수와 무관한 순서로 섞음
+
+· legacy  : all_documents 앞 10개 × 800자
+· builder : ContextBuilder.select → pack (CONTEXT_TOKEN_BUDGET)
+
+항목: 근사 토큰 수 · 포함된 '상위 점수 문서'(원본 기준) 비율 · 근거가 들어간 청크 비율 · 구성 시간
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import statistics
+import time
+from typing import List
+
+
+def _words(rng: random.Random, n: int) -> str:
+    vocab = [f"term{i}" for i in range(400)]
+    return " ".join(rng.choice(vocab) for _ in range(n))
+
+
+def _payload(n_chunks: int, per_chunk: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    originals: List[dict] = []
+    chunks = []
+    for c in range(n_chunks):
+        related = []
+        for _ in range(per_chunk):
+            if originals and rng.random() < 0.5:
+                src = rng.choice(originals)
+                text = src["page_content"] + " " + _words(rng, 6)  # 거의 같은 문서
+                doc = {**src, "page_content": text, "score": src["score"] - 0.01}
+            else:
+                doc = {
+                    "page_content": _words(rng, rng.randint(150, 600)),
+                    "metadata": {"src": f"doc-{len(originals)}"},
+                    "score": round(rng.uniform(0.5, 0.95), 3),
+                }
+                originals.append(doc)
+            related.append(doc)
+        chunks.append({"chunk_index": c, "chunk_en": _words(rng, 50), "related_docs": related})
+
+    all_docs = [d for ch in chunks for d in ch["related_docs"]]
+    rng.shuffle(all_docs)
+    return {
+        "meeting_meta": {"title": "bench", "datetime": "2025-01-01T00:00:00Z",
+                         "author": "-", "participants": ["-"]},
+        "meeting_purpose": "-", "insights": [], "text_stt": "-",
+        "chunks": chunks, "all_documents": all_docs, "elapsed_time": 0.0,
+        "_originals": originals,
+    }
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser("document context benchmark")
+    ap.add_argument("--chunks", type=int, default=12)
+    ap.add_argument("--docs-per-chunk", type=int, default=6)
+    ap.add_argument("--top", type=int, default=5, help="'상위 점수 문서' 기준 개수")
+    ap.add_argument("--rounds", type=int, default=20)
+    ap.add_argument("--seed", type=int, default=7)
+    a = ap.parse_args()
+
+    os.environ.setdefault("LLM_API", "http://127.0.0.1:9/v1beta/models/mock")
+    os.environ.setdefault("PIPELINE_API", "http://127.0.0.1:9/")
+    os.environ.setdefault("API_KEY", "benchmark-dummy-key")
+
+    from src.models.schemas import PipelineRequest
+    from src.processors.context_builder import get_context_builder
+    from src.utils import approx_tokens
+
+    raw = _payload(a.chunks, a.docs_per_chunk, a.seed)
+    originals = raw.pop("_originals")
+    p = PipelineRequest.model_validate(raw)
+    builder = get_context_builder()
+
+    top = sorted(originals, key=lambda d: d["score"], reverse=True)[: a.top]
+    heads = [d["page_content"][:200] for d in top]
+    chunk_heads = [
+        {d.page_content[:200] for d in ch.related_docs} for ch in p.chunks
+    ]
+
+    def legacy() -> str:
+        return "\n\n".join(d.page_content[:800] for d in p.all_documents[:10])
+
+    def built() -> str:
+        return builder.pack(builder.select(p))
+
+    print(f"chunks={a.chunks} docs={len(p.all_documents)} budget={builder.token_budget}")
+    print(f"{'path':<8} {'tokens':>7} {'top-hit':>8} {'chunks':>7} {'median':>9}")
+    for name, fn in (("legacy", legacy), ("builder", built)):
+        laps = []
+        for _ in range(a.rounds):
+            t0 = time.perf_counter()
+            text = fn()
+            laps.append(time.perf_counter() - t0)
+        top_hit = sum(h[:120] in text for h in heads) / len(heads)
+        covered = sum(any(h[:120] in text for h in hs) for hs in chunk_heads) / len(chunk_heads)
+        print(f"{name:<8} {approx_tokens(text):>7} {top_hit:>7.0%} {covered:>7.0%} "
+              f"{statistics.median(laps) * 1000:7.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
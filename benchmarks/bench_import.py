@@ -0,0 +1,99 @@
+"""
+benchmarks/bench_import.py
+────────────────────────────────────────────────────────────
+콜드 스타트: 진입점 모듈 임포트 시간 (-X importtime) + CLI --help 실행 시간
+
+    python -m benchmarks.bench_import --json import.json
+    python -m benchmarks.bench_import --baseline import.json      # 15% 넘게 느려지면 종료 코드 1
+
+· 항목마다 새 인터프리터로 --repeat 회 실행해 최솟값을 쓴다 (디스크 캐시 · 잡음 제외)
+· import.<모듈> : importtime 마지막 줄의 누적 시간 (해당 모듈이 끌어온 임포트 전체)
+· cli.help      : `python -m src.cli --help` 프로세스 전체 경과 시간
+· 임포트만으로 끌려오면 안 되는 모듈(weasyprint · rich · yaml …)이 보이면 회귀로 보고 종료 코드 1
+  ─ weasyprint 는 PDF 를 렌더하는 프로세스에서, 로깅 설정은 진입점 실행 시에만 로드되어야 한다
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List, Sequence, Set, Tuple
+
+from benchmarks.common import Results, add_gate_args, report, use_mock
+
+# 모듈 → 임포트만으로는 로드되면 안 되는 최상위 패키지
+# (httpx 는 rich 가 설치돼 있으면 자체 CLI 용으로 rich 를 임포트하므로 httpx 를 쓰는 모듈은 rich 제외)
+_TARGETS: Dict[str, Tuple[str, ...]] = {
+    "src.cli": ("weasyprint", "rich", "yaml", "httpx", "fastapi"),
+    "src.service.report_service": ("weasyprint", "yaml", "fastapi"),
+    "src.server.main": ("weasyprint",),
+}
+
+
+def _importtime(module: str) -> Tuple[float, Set[str]]:
+    """(누적 임포트 시간 초, 로드된 최상위 패키지)"""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, env=os.environ.copy(),
+    )
+    if proc.returncode != 0:
+        raise SystemExit(f"{module} 임포트 실패:\n{proc.stderr[-2000:]}")
+    loaded: Set[str] = set()
+    total_us = 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # 헤더 줄
+        loaded.add(name.strip().split(".")[0])
+        if name.strip() == module:
+            total_us = int(cumulative)
+    return total_us / 1e6, loaded
+
+
+def _wall(cmd: Sequence[str]) -> float:
+    t0 = time.perf_counter()
+    subprocess.run(cmd, capture_output=True, check=True, env=os.environ.copy())
+    return time.perf_counter() - t0
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser("Import-time benchmark")
+    ap.add_argument("--repeat", type=int, default=5, help="항목별 실행 횟수 (최솟값 사용)")
+    ap.add_argument("--modules", nargs="+", default=list(_TARGETS), help="측정할 모듈")
+    add_gate_args(ap)
+    a = ap.parse_args()
+
+    use_mock()  # 서버 모듈은 임포트 시 Settings 를 읽는다 (닿지 않는 주소로 충분)
+
+    results: Results = {}
+    leaks: List[str] = []
+    print(f"{'item':<32} {'min':>9} {'max':>9}")
+    for module in a.modules:
+        runs = [_importtime(module) for _ in range(a.repeat)]
+        secs = [s for s, _ in runs]
+        print(f"{'import.' + module:<32} {min(secs) * 1e3:7.1f}ms {max(secs) * 1e3:7.1f}ms")
+        results[f"import.{module}"] = {"seconds": min(secs)}
+        for pkg in _TARGETS.get(module, ()):
+            if pkg in runs[0][1]:
+                leaks.append(f"{module} → {pkg}")
+
+    laps = [_wall([sys.executable, "-m", "src.cli", "--help"]) for _ in range(a.repeat)]
+    print(f"{'cli.help':<32} {min(laps) * 1e3:7.1f}ms {max(laps) * 1e3:7.1f}ms")
+    results["cli.help"] = {"seconds": min(laps)}
+
+    if leaks:
+        print("❌ 임포트만으로 로드된 무거운 모듈:")
+        for line in leaks:
+            print(f"   {line}")
+    report(results, a)
+    if leaks:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
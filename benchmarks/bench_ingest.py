@@ -0,0 +1,93 @@
+"""
+benchmarks/bench_ingest.py
+────────────────────────────────────────────────────────────
+큰 PipelineRequest 본문 파싱 + 검증: 기존 경로 vs fast-path
+
+    python -m benchmarks.bench_ingest --scales 1 10 100
+
+sample_pipeline.json 의 text_stt · chunks · all_documents 를 배수만큼 복제해
+(허브가 같은 문서를 반복해 싣는 상황 재현) 다음을 비교한다.
+
+· stdlib : json.loads → model_validate → 문서 model_dump (이전 FastAPI + report_service 경로)
+· jiter  : model_validate_json(bytes)                    (orjson 미설치 시 서버 경로)
+· orjson : PipelineRequest.from_json_bytes(bytes)        (현재 서버 경로, orjson 설치 시)
+
+각 항목은 반복 측정 중앙값(ms)과 tracemalloc 최대 메모리(MiB).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict
+
+_SAMPLE = Path(__file__).resolve().parent.parent / "data" / "sample_pipeline.json"
+
+
+def _scaled(base: Dict, n: int) -> bytes:
+    doc = dict(base)
+    doc["text_stt"] = " ".join([base["text_stt"]] * n)
+    doc["chunks"] = base["chunks"] * n
+    doc["all_documents"] = base["all_documents"] * n
+    return json.dumps(doc, ensure_ascii=False).encode("utf-8")
+
+
+def _measure(fn: Callable[[], object], rounds: int) -> tuple[float, float]:
+    laps = []
+    for _ in range(rounds):
+        t0 = time.perf_counter()
+        fn()
+        laps.append(time.perf_counter() - t0)
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(laps) * 1000, peak / 2 ** 20
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser("PipelineRequest ingest benchmark")
+    ap.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+    ap.add_argument("--rounds", type=int, default=5)
+    a = ap.parse_args()
+
+    os.environ.setdefault("LLM_API", "http://127.0.0.1:9/v1beta/models/mock")
+    os.environ.setdefault("PIPELINE_API", "http://127.0.0.1:9/")
+    os.environ.setdefault("API_KEY", "benchmark-dummy-key")
+
+    from src.models.schemas import PipelineRequest
+
+    try:
+        import orjson
+    except ImportError:  # 선택 비교 대상
+        orjson = None
+
+    base = json.loads(_SAMPLE.read_text(encoding="utf-8"))
+
+    print(f"{'scale':>5}  {'body':>8}  {'path':<7} {'median':>9}  {'peak':>9}  docs")
+    for n in a.scales:
+        body = _scaled(base, n)
+
+        def stdlib():
+            p = PipelineRequest.model_validate(json.loads(body))
+            return [d.model_dump() for d in p.all_documents]
+
+        paths = {"stdlib": stdlib, "jiter": lambda: PipelineRequest.model_validate_json(body)}
+        if orjson is not None:
+            paths["orjson"] = lambda: PipelineRequest.from_json_bytes(body)
+
+        p = PipelineRequest.model_validate_json(body)
+        docs = f"{len(base['all_documents']) * n}→{len(p.all_documents)}"
+        for name, fn in paths.items():
+            ms, mib = _measure(fn, a.rounds)
+            print(f"{n:>4}×  {len(body) / 2 ** 20:6.2f}Mi  {name:<7} {ms:7.2f}ms  {mib:7.2f}Mi  {docs}")
+
+
+if __name__ == "__main__":
+    main()
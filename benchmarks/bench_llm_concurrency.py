@@ -0,0 +1,65 @@
+"""
+benchmarks/bench_llm_concurrency.py
+────────────────────────────────────────────────────────────
+요약 / 액션 / 통합 분석 3개 Gemini 호출: 순차 vs 동시 실행 비교
+
+    python -m benchmarks.bench_llm_concurrency --latency 1.0 --rounds 3
+
+목 서버 지연이 L 초일 때 순차 ≈ 3L, 동시 ≈ L 이 나와야 한다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import time
+from pathlib import Path
+
+from benchmarks import mock_gemini
+
+_SAMPLE = Path(__file__).resolve().parent.parent / "data" / "sample_pipeline.json"
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser("LLM concurrency benchmark")
+    ap.add_argument("--latency", type=float, default=1.0)
+    ap.add_argument("--rounds", type=int, default=3)
+    a = ap.parse_args()
+
+    srv = mock_gemini.start(latency=a.latency)
+    os.environ["LLM_API"] = f"http://127.0.0.1:{srv.server_port}/v1beta/models/mock"
+    os.environ.setdefault("PIPELINE_API", "http://127.0.0.1:9/")
+    os.environ.setdefault("API_KEY", "benchmark-dummy-key")
+    os.environ["LLM_CACHE_ENABLED"] = "false"  # 반복 라운드가 캐시에 적중하지 않도록
+
+    # 환경 변수 주입 후 임포트해야 Settings 가 목 서버를 바라본다
+    from src.models.schemas import PipelineRequest
+    from src.processors.action_processor import ActionProcessor
+    from src.processors.integrated_analysis_processor import IntegratedAnalysisProcessor
+    from src.processors.summary_processor import SummaryProcessor
+    from src.service import report_service as svc
+
+    p = PipelineRequest.model_validate(json.loads(_SAMPLE.read_text(encoding="utf-8")))
+    docs = p.all_documents
+
+    def sequential() -> None:
+        SummaryProcessor(svc._gem()).run(p.text_stt)
+        ActionProcessor(svc._gem()).run(p.text_stt)
+        IntegratedAnalysisProcessor(svc._gem()).run(p.text_stt, docs)
+
+    for name, fn in (("sequential", sequential),
+                     ("concurrent", lambda: svc._run_processors(p))):
+        laps = []
+        for _ in range(a.rounds):
+            t0 = time.perf_counter()
+            fn()
+            laps.append(time.perf_counter() - t0)
+        print(f"{name:<11} mean={sum(laps) / len(laps):.3f}s  "
+              f"min={min(laps):.3f}s  max={max(laps):.3f}s")
+
+    srv.shutdown()
+
+
+if __name__ == "__main__":
+    main()
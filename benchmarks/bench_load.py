@@ -0,0 +1,182 @@
+"""
+benchmarks/bench_load.py
+────────────────────────────────────────────────────────────
+엔드투엔드 부하 생성기 – uvicorn 으로 띄운 src.server.main:app 에 동시 요청
+
+    python -m benchmarks.bench_load --concurrency 1 4 16 --requests 64 --latency 1.0
+    python -m benchmarks.bench_load --endpoint report-pdf --json load.json
+    python -m benchmarks.bench_load --baseline load.json          # 회귀 시 종료 코드 1
+
+· 목 서버(Gemini + /pipeline-run)를 이 프로세스 스레드로, 서버는 별도 프로세스로 기동
+  (부하 생성기 CPU 가 서버 측정에 섞이지 않도록)
+· 동시성 단계마다 closed-loop: 워커 c 개가 응답을 받는 즉시 다음 요청
+· 요청마다 text_stt 에 번호를 붙여 보고서 · Gemini 캐시에 적중하지 않게 한다
+  (--repeat 이면 같은 payload 반복 → 캐시 적중 경로 측정)
+· 단계별 p50 · p95 · p99 지연(초) · 초당 보고서 수 · 실패 수 출력
+
+서버 설정은 환경 변수로 그대로 넘어간다 (예: REPORT_MODE=split, PDF_WORKERS=4).
+GEMINI_RPM 은 지정하지 않으면 0(제한 없음)으로 둔다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import httpx
+
+from benchmarks import mock_gemini
+from benchmarks.common import Results, add_gate_args, percentiles, report, use_mock
+
+_ROOT = Path(__file__).resolve().parent.parent
+_SAMPLE = _ROOT / "data" / "sample_pipeline.json"
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _start_server(port: int, workers: int, tmp: Path) -> subprocess.Popen:
+    env = dict(os.environ)
+    env.setdefault("OUT_DIR", str(tmp / "out"))
+    env.setdefault("REPORT_CACHE_DIR", str(tmp / "out" / ".cache"))
+    env.setdefault("LLM_CACHE_PATH", str(tmp / "out" / ".cache" / "llm.sqlite3"))
+    env.setdefault("GEMINI_RPM", "0")
+    cmd = [
+        sys.executable, "-m", "uvicorn", "src.server.main:app",
+        "--host", "127.0.0.1", "--port", str(port),
+        "--workers", str(workers), "--log-level", "warning",
+    ]
+    return subprocess.Popen(cmd, cwd=_ROOT, env=env)
+
+
+def _wait_ready(base: str, proc: subprocess.Popen, timeout: float = 60.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"서버 프로세스 종료 (code={proc.returncode})")
+        try:
+            if httpx.get(f"{base}/health", timeout=1.0).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise TimeoutError("서버 기동 대기 시간 초과")
+
+
+async def _run_level(
+    client: httpx.AsyncClient,
+    path: str,
+    payload: Dict[str, Any],
+    *,
+    concurrency: int,
+    requests: int,
+    repeat: bool,
+    seq: List[int],
+) -> Tuple[List[float], int, float]:
+    """(성공 지연 목록, 실패 수, 경과 시간)"""
+    laps: List[float] = []
+    failures = 0
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining, failures
+        while remaining > 0:
+            remaining -= 1
+            seq[0] += 1
+            body = payload if repeat else dict(payload, text_stt=f"{payload['text_stt']} [load {seq[0]}]")
+            t0 = time.perf_counter()
+            try:
+                r = await client.post(path, json=body)
+                ok = r.status_code == 200
+            except httpx.HTTPError:
+                ok = False
+            if ok:
+                laps.append(time.perf_counter() - t0)
+            else:
+                failures += 1
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return laps, failures, time.perf_counter() - t0
+
+
+async def _drive(base: str, a: argparse.Namespace) -> Results:
+    payload = json.loads(_SAMPLE.read_text(encoding="utf-8"))
+    path = f"/{a.endpoint}"
+    limits = httpx.Limits(max_connections=max(a.concurrency), max_keepalive_connections=max(a.concurrency))
+    results: Results = {}
+    seq = [0]
+    async with httpx.AsyncClient(base_url=base, timeout=a.timeout, limits=limits) as client:
+        await client.post(path, json=payload)  # 예열 (측정 제외)
+        print(f"{'endpoint':<11} {'conc':>4} {'ok':>5} {'fail':>4} "
+              f"{'p50':>7} {'p95':>7} {'p99':>7} {'rps':>7}")
+        for c in a.concurrency:
+            laps, failures, wall = await _run_level(
+                client, path, payload,
+                concurrency=c, requests=a.requests, repeat=a.repeat, seq=seq,
+            )
+            q = percentiles(laps)
+            rps = len(laps) / wall if wall else 0.0
+            print(f"{a.endpoint:<11} {c:>4} {len(laps):>5} {failures:>4} "
+                  f"{q['p50']:6.3f}s {q['p95']:6.3f}s {q['p99']:6.3f}s {rps:7.2f}")
+            results[f"{a.endpoint}@c{c}"] = {
+                "p50_s": q["p50"], "p95_s": q["p95"], "p99_s": q["p99"],
+                "rps": rps, "failures": float(failures),
+            }
+    return results
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser("end-to-end load benchmark")
+    ap.add_argument("--endpoint", choices=("report-json", "report-pdf"), default="report-json")
+    ap.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    ap.add_argument("--requests", type=int, default=32, help="동시성 단계별 요청 수")
+    ap.add_argument("--repeat", action="store_true", help="같은 payload 반복 (캐시 적중 경로)")
+    ap.add_argument("--workers", type=int, default=1, help="uvicorn 워커 프로세스 수")
+    ap.add_argument("--timeout", type=float, default=120.0)
+    # 목 서버 지연 · 장애 분포
+    ap.add_argument("--latency", type=float, default=1.0)
+    ap.add_argument("--jitter", type=float, default=0.2)
+    ap.add_argument("--error-rate", type=float, default=0.0)
+    ap.add_argument("--slow-rate", type=float, default=0.0)
+    ap.add_argument("--slow-latency", type=float, default=0.0)
+    add_gate_args(ap)
+    a = ap.parse_args()
+
+    srv = mock_gemini.start(
+        latency=a.latency, jitter=a.jitter, error_rate=a.error_rate,
+        slow_rate=a.slow_rate, slow_latency=a.slow_latency,
+    )
+    use_mock(srv)
+    port = _free_port()
+    base = f"http://127.0.0.1:{port}"
+
+    with tempfile.TemporaryDirectory(prefix="bench-load-") as tmp:
+        proc = _start_server(port, a.workers, Path(tmp))
+        try:
+            _wait_ready(base, proc)
+            results = asyncio.run(_drive(base, a))
+        finally:
+            proc.terminate()
+            proc.wait(timeout=30)
+            srv.shutdown()
+
+    stats = srv.stats  # type: ignore[attr-defined]
+    print(f"gemini calls={stats['calls']} throttled={stats['throttled']} errors={stats['errors']}")
+    report(results, a)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+benchmarks/bench_micro.py
+────────────────────────────────────────────────────────────
+CPU 구간 마이크로벤치마크 (네트워크 · Gemini 없음)
+
+    python -m benchmarks.bench_micro --rounds 50 --json micro.json
+    python -m benchmarks.bench_micro --baseline micro.json      # 회귀 시 종료 코드 1
+
+· parse        : PipelineRequest.from_json_bytes (sample × --scale)
+· split_chunks : utils.split_chunks (sample 문장 × --scale)
+· render_html  : ReportBuilder._render_html
+· write_pdf    : WeasyPrint write_pdf 인-프로세스 (pdf_renderer._render, 폰트 예열 후)
+
+각 항목은 예열 1회 후 --rounds 회 측정한 median · p95 (ms).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import time
+from pathlib import Path
+from typing import Callable, Dict
+
+from benchmarks.common import Results, add_gate_args, percentiles, report, use_mock
+
+_SAMPLE = Path(__file__).resolve().parent.parent / "data" / "sample_pipeline.json"
+
+
+def _measure(fn: Callable[[], object], rounds: int) -> Dict[str, float]:
+    fn()  # 예열
+    laps = []
+    for _ in range(rounds):
+        t0 = time.perf_counter()
+        fn()
+        laps.append(time.perf_counter() - t0)
+    return {
+        "median_ms": statistics.median(laps) * 1000,
+        "p95_ms": percentiles(laps, (95,))["p95"] * 1000,
+    }
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser("CPU microbenchmarks")
+    ap.add_argument("--rounds", type=int, default=30)
+    ap.add_argument("--scale", type=int, default=100, help="parse · split_chunks 입력 배수")
+    ap.add_argument("--skip-pdf", action="store_true", help="write_pdf 측정 생략")
+    add_gate_args(ap)
+    a = ap.parse_args()
+
+    use_mock()
+    from src.models.schemas import PipelineRequest, ReportSchema
+    from src.processors.report_builder import ReportBuilder
+    from src.utils import split_chunks, split_sentences
+
+    base = json.loads(_SAMPLE.read_text(encoding="utf-8"))
+    scaled = dict(base, text_stt=" ".join([base["text_stt"]] * a.scale),
+                  chunks=base["chunks"] * a.scale, all_documents=base["all_documents"] * a.scale)
+    body = json.dumps(scaled, ensure_ascii=False).encode("utf-8")
+    lines = split_sentences(scaled["text_stt"])
+
+    p = PipelineRequest.from_json_bytes(body)
+    report_m = ReportSchema(
+        meeting_title=p.meeting_meta.title,
+        executive_summary=p.meeting_purpose * 4,
+        agenda_keypoints=p.insights,
+        decisions=p.insights[:2],
+        action_items=p.insights,
+        risks=p.insights[:1],
+        appendix=[p.meeting_purpose * 3],
+    )
+    builder = ReportBuilder()
+
+    def render_html() -> str:
+        return builder._render_html(
+            report=report_m, meta=p.meeting_meta, purpose=p.meeting_purpose, docs=p.all_documents,
+        )
+
+    cases: Dict[str, Callable[[], object]] = {
+        "parse": lambda: PipelineRequest.from_json_bytes(body),
+        "split_chunks": lambda: split_chunks(lines, 1500),
+        "render_html": render_html,
+    }
+    if not a.skip_pdf:
+        from src.processors.pdf_renderer import _render
+
+        html_str = render_html()
+        cases["write_pdf"] = lambda: _render(html_str)
+
+    print(f"body={len(body) / 1024:.0f}KiB lines={len(lines)} rounds={a.rounds}")
+    print(f"{'case':<13} {'median':>10} {'p95':>10}")
+    results: Results = {}
+    for name, fn in cases.items():
+        results[name] = _measure(fn, a.rounds)
+        r = results[name]
+        print(f"{name:<13} {r['median_ms']:8.2f}ms {r['p95_ms']:8.2f}ms")
+    report(results, a)
+
+
+if __name__ == "__main__":
+    main()
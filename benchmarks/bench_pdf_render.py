@@ -0,0 +1,65 @@
+"""
+benchmarks/bench_pdf_render.py
+────────────────────────────────────────────────────────────
+sample_pipeline.json 기반 보고서 N 건 PDF 렌더: 인-프로세스 순차 vs 프로세스 풀
+
+    python -m benchmarks.bench_pdf_render -n 16 --workers 4
+
+풀 처리량은 코어 수에 비례해 늘어야 한다 (워커 예열 시간은 측정에서 제외).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import time
+from pathlib import Path
+
+_SAMPLE = Path(__file__).resolve().parent.parent / "data" / "sample_pipeline.json"
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser("PDF render benchmark")
+    ap.add_argument("-n", type=int, default=16, help="렌더할 보고서 수")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    a = ap.parse_args()
+
+    os.environ.setdefault("LLM_API", "http://127.0.0.1:9/v1beta/models/mock")
+    os.environ.setdefault("PIPELINE_API", "http://127.0.0.1:9/")
+    os.environ.setdefault("API_KEY", "benchmark-dummy-key")
+
+    from src.models.schemas import PipelineRequest, ReportSchema
+    from src.processors.pdf_renderer import PdfRenderPool
+    from src.processors.report_builder import ReportBuilder
+
+    p = PipelineRequest.model_validate(json.loads(_SAMPLE.read_text(encoding="utf-8")))
+    report = ReportSchema(
+        meeting_title=p.meeting_meta.title,
+        executive_summary=p.meeting_purpose * 4,
+        agenda_keypoints=p.insights,
+        decisions=[],
+        action_items=p.insights,
+        risks=[],
+        appendix=[p.meeting_purpose * 3],
+    )
+    html_str = ReportBuilder()._render_html(
+        report=report, meta=p.meeting_meta, purpose=p.meeting_purpose, docs=p.all_documents,
+        for_pdf=True,
+    )
+
+    for label, workers in (("serial", 0), (f"pool×{a.workers}", a.workers)):
+        pool = PdfRenderPool(workers, queue_size=a.n)
+        pool.render(html_str)  # 예열 (측정 제외)
+
+        t0 = time.perf_counter()
+        futures = [pool.submit(html_str) for _ in range(a.n)]
+        for f in futures:
+            f.result()
+        dt = time.perf_counter() - t0
+        pool.shutdown()
+        print(f"{label:<10} {a.n} reports in {dt:.2f}s  → {a.n / dt:.2f} reports/s")
+
+
+if __name__ == "__main__":
+    main()
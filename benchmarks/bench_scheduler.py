@@ -0,0 +1,140 @@
+"""
+benchmarks/bench_scheduler.py
+────────────────────────────────────────────────────────────
+우선순위 스케줄러: batch 요청이 서버를 포화시키는 동안 interactive 요청 지연
+
+    python -m benchmarks.bench_scheduler --batch 16 --interactive 2 --requests 20 --rpm 300
+    python -m benchmarks.bench_scheduler --json sched.json
+    python -m benchmarks.bench_scheduler --baseline sched.json   # 회귀 시 종료 코드 1
+
+· 모드마다 서버를 새로 띄운다 (bench_load 와 같은 uvicorn 별도 프로세스 + 목 Gemini)
+  ─ fifo  : SCHED_ENABLED=false – 먼저 온 요청부터 자원을 나눠 쓴다
+  ─ sched : SCHED_ENABLED=true  – interactive 우선 + 전용 슬롯
+· batch       : 테넌트 bulk, X-Priority: batch, --batch 개 closed-loop (측정 내내 포화 유지)
+· interactive : 테넌트 ui, X-Priority: interactive, --interactive 개 closed-loop, 총 --requests 건
+· 요청마다 text_stt 에 번호를 붙여 캐시에 적중하지 않게 한다
+· --rpm 으로 Gemini 쿼터를 병목으로 만든다 (목 서버 지연만으로는 자원 경쟁이 없다)
+모드별 interactive p50 · p95 · p99(초) · batch 처리량 · 503(마감 폐기) 수 출력.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import httpx
+
+from benchmarks import mock_gemini
+from benchmarks.bench_load import _SAMPLE, _free_port, _start_server, _wait_ready
+from benchmarks.common import Results, add_gate_args, percentiles, report, use_mock
+
+
+async def _drive(base: str, a: argparse.Namespace) -> Dict[str, float]:
+    payload = json.loads(_SAMPLE.read_text(encoding="utf-8"))
+    path = f"/{a.endpoint}"
+    seq = [0]
+    laps: List[float] = []
+    counts = {"batch_ok": 0, "batch_503": 0, "interactive_503": 0}
+    done = asyncio.Event()
+
+    def body(tag: str) -> Dict[str, Any]:
+        seq[0] += 1
+        return dict(payload, text_stt=f"{payload['text_stt']} [{tag} {seq[0]}]")
+
+    async def batch(client: httpx.AsyncClient) -> None:
+        headers = {"X-Tenant": "bulk", "X-Priority": "batch"}
+        while not done.is_set():
+            try:
+                r = await client.post(path, json=body("batch"), headers=headers)
+            except httpx.HTTPError:
+                continue
+            if r.status_code == 200:
+                counts["batch_ok"] += 1
+            elif r.status_code == 503:
+                counts["batch_503"] += 1
+
+    async def interactive(client: httpx.AsyncClient, remaining: List[int]) -> None:
+        headers = {"X-Tenant": "ui", "X-Priority": "interactive"}
+        while remaining[0] > 0:
+            remaining[0] -= 1
+            t0 = time.perf_counter()
+            r = await client.post(path, json=body("ui"), headers=headers)
+            if r.status_code == 200:
+                laps.append(time.perf_counter() - t0)
+            elif r.status_code == 503:
+                counts["interactive_503"] += 1
+
+    conns = a.batch + a.interactive
+    limits = httpx.Limits(max_connections=conns, max_keepalive_connections=conns)
+    async with httpx.AsyncClient(base_url=base, timeout=a.timeout, limits=limits) as client:
+        await client.post(path, json=payload)  # 예열 (측정 제외)
+        flood = [asyncio.create_task(batch(client)) for _ in range(a.batch)]
+        await asyncio.sleep(a.ramp)  # batch 가 자원을 다 채운 뒤 측정 시작
+        t0 = time.perf_counter()
+        remaining = [a.requests]
+        await asyncio.gather(*(interactive(client, remaining) for _ in range(a.interactive)))
+        wall = time.perf_counter() - t0
+        done.set()
+        await asyncio.gather(*flood, return_exceptions=True)
+
+    q = percentiles(laps)
+    return {
+        "p50_s": q["p50"], "p95_s": q["p95"], "p99_s": q["p99"],
+        "batch_rps": counts["batch_ok"] / (wall + a.ramp),
+        "interactive_503": float(counts["interactive_503"]),
+        "batch_503": float(counts["batch_503"]),
+    }
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser("priority scheduler benchmark")
+    ap.add_argument("--endpoint", choices=("report-json", "report-pdf"), default="report-json")
+    ap.add_argument("--modes", nargs="+", choices=("fifo", "sched"), default=["fifo", "sched"])
+    ap.add_argument("--batch", type=int, default=16, help="batch closed-loop 동시성")
+    ap.add_argument("--interactive", type=int, default=2, help="interactive closed-loop 동시성")
+    ap.add_argument("--requests", type=int, default=20, help="interactive 요청 수")
+    ap.add_argument("--ramp", type=float, default=3.0, help="측정 전 batch 포화 시간(초)")
+    ap.add_argument("--rpm", type=int, default=300, help="서버 GEMINI_RPM (0 = 제한 없음)")
+    ap.add_argument("--latency", type=float, default=0.5)
+    ap.add_argument("--timeout", type=float, default=300.0)
+    add_gate_args(ap)
+    a = ap.parse_args()
+
+    srv = mock_gemini.start(latency=a.latency)
+    use_mock(srv)
+    os.environ["GEMINI_RPM"] = str(a.rpm)
+    os.environ.setdefault("LLM_CACHE_ENABLED", "false")
+
+    results: Results = {}
+    print(f"endpoint={a.endpoint} batch={a.batch} interactive={a.interactive} "
+          f"requests={a.requests} rpm={a.rpm or '-'} latency={a.latency}s")
+    print(f"{'mode':<6} {'p50':>7} {'p95':>7} {'p99':>7} {'batch/s':>8} {'503 i/b':>8}")
+    try:
+        for mode in a.modes:
+            os.environ["SCHED_ENABLED"] = "true" if mode == "sched" else "false"
+            port = _free_port()
+            base = f"http://127.0.0.1:{port}"
+            with tempfile.TemporaryDirectory(prefix="bench-sched-") as tmp:
+                proc = _start_server(port, 1, Path(tmp))
+                try:
+                    _wait_ready(base, proc)
+                    r = asyncio.run(_drive(base, a))
+                finally:
+                    proc.terminate()
+                    proc.wait(timeout=30)
+            print(f"{mode:<6} {r['p50_s']:6.2f}s {r['p95_s']:6.2f}s {r['p99_s']:6.2f}s "
+                  f"{r['batch_rps']:8.2f} {r['interactive_503']:>3.0f}/{r['batch_503']:<3.0f}")
+            results[f"interactive.{mode}"] = r
+    finally:
+        srv.shutdown()
+    report(results, a)
+
+
+if __name__ == "__main__":
+    main()
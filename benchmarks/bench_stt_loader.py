@@ -0,0 +1,91 @@
+"""
+benchmarks/bench_stt_loader.py
+────────────────────────────────────────────────────────────
+대용량 JSONL STT 읽기 + 청크 분할: 리스트 방식 vs 스트리밍 제너레이터
+
+    python -m benchmarks.bench_stt_loader --mb 10 50
+
+· eager  : read_text().splitlines() → 줄 리스트 → 청크 리스트 (이전 load_lines + split_chunks)
+· stream : iter_chunks(iter_lines(path))            (청크를 하나씩 소비)
+· mmap   : iter_chunks(iter_lines(path, use_mmap=True))
+
+항목별 소요 시간과 tracemalloc 최대 메모리(MiB) – 스트리밍은 파일 크기와 무관해야 한다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, List
+
+from src.utils import iter_chunks, iter_lines
+
+_LINE = "Speaker {n}: we agreed to move the launch review to next sprint and revisit the budget."
+
+
+def _write_jsonl(path: Path, mb: int) -> None:
+    target = mb * 2 ** 20
+    with path.open("w", encoding="utf-8") as f:
+        n = 0
+        while f.tell() < target:
+            for _ in range(1000):
+                f.write(json.dumps({"speaker": n % 7, "text": _LINE.format(n=n % 7)}) + "\n")
+                n += 1
+
+
+def _eager(path: Path, max_chars: int) -> int:
+    lines: List[str] = []
+    for ln in path.read_text(encoding="utf-8").splitlines():
+        if ln.strip():
+            lines.append(json.loads(ln)["text"])
+    chunks: List[str] = []
+    buf: List[str] = []
+    size = 0
+    for text in lines:
+        if size + len(text) > max_chars and buf:
+            chunks.append("\n".join(buf))
+            buf, size = [], 0
+        buf.append(text)
+        size += len(text)
+    if buf:
+        chunks.append("\n".join(buf))
+    return len(chunks)
+
+
+def _measure(fn: Callable[[], int]) -> tuple[float, float, int]:
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    n = fn()
+    dt = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return dt, peak / 2 ** 20, n
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser("STT loader benchmark")
+    ap.add_argument("--mb", type=int, nargs="+", default=[10, 50], help="생성할 JSONL 크기(MiB)")
+    ap.add_argument("--max-chars", type=int, default=6000)
+    a = ap.parse_args()
+
+    paths = {
+        "eager": lambda p: _eager(p, a.max_chars),
+        "stream": lambda p: sum(1 for _ in iter_chunks(iter_lines(p), a.max_chars)),
+        "mmap": lambda p: sum(1 for _ in iter_chunks(iter_lines(p, use_mmap=True), a.max_chars)),
+    }
+    print(f"{'file':>6}  {'path':<7} {'time':>8}  {'peak':>9}  chunks")
+    with tempfile.TemporaryDirectory(prefix="bench-stt-") as tmp:
+        for mb in a.mb:
+            path = Path(tmp) / f"stt-{mb}.jsonl"
+            _write_jsonl(path, mb)
+            for name, fn in paths.items():
+                dt, peak, n = _measure(lambda: fn(path))
+                print(f"{mb:>4}Mi  {name:<7} {dt:7.2f}s  {peak:7.2f}Mi  {n}")
+
+
+if __name__ == "__main__":
+    main()
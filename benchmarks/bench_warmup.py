@@ -0,0 +1,98 @@
+"""
+benchmarks/bench_warmup.py
+────────────────────────────────────────────────────────────
+콜드 vs 웜 보고서 렌더 지연 (HTML + PDF, LLM 제외)
+
+    python -m benchmarks.bench_warmup -n 20
+
+· cold   : 새 프로세스의 첫 요청 (템플릿 컴파일 · 렌더 풀 기동 · 폰트 로드 포함)
+· warm-up: 서버 lifespan 이 하는 예열 호출 시간
+· warm   : 예열 이후 요청 평균 / 최대
+· legacy : 요청마다 ReportBuilder() 를 새로 만들던 방식 (템플릿 재컴파일)
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+_SAMPLE = Path(__file__).resolve().parent.parent / "data" / "sample_pipeline.json"
+
+
+def _setup():
+    os.environ.setdefault("LLM_API", "http://127.0.0.1:9/v1beta/models/mock")
+    os.environ.setdefault("PIPELINE_API", "http://127.0.0.1:9/")
+    os.environ.setdefault("API_KEY", "benchmark-dummy-key")
+
+    from src.models.schemas import PipelineRequest, ReportSchema
+
+    p = PipelineRequest.model_validate(json.loads(_SAMPLE.read_text(encoding="utf-8")))
+    report = ReportSchema(
+        meeting_title=p.meeting_meta.title, executive_summary=p.meeting_purpose,
+        agenda_keypoints=p.insights, decisions=[], action_items=p.insights, risks=[],
+        appendix=[p.meeting_purpose],
+    )
+    return p, report
+
+
+def _one(builder, p, report) -> float:
+    from src.processors.pdf_renderer import get_render_pool
+
+    t0 = time.perf_counter()
+    html_str = builder._render_html(
+        report=report, meta=p.meeting_meta, purpose=p.meeting_purpose, docs=p.all_documents,
+        for_pdf=True,
+    )
+    get_render_pool().render(html_str)
+    return time.perf_counter() - t0
+
+
+def _child(mode: str, n: int) -> None:
+    """별도 프로세스에서 실행되어 결과를 JSON 한 줄로 출력"""
+    p, report = _setup()
+    from src.processors.report_builder import ReportBuilder, get_report_builder
+
+    out = {}
+    if mode == "cold":
+        out["cold"] = _one(get_report_builder(), p, report)
+    elif mode == "warm":
+        t0 = time.perf_counter()
+        get_report_builder().warm_up()
+        out["warm_up"] = time.perf_counter() - t0
+        laps = [_one(get_report_builder(), p, report) for _ in range(n)]
+        out["warm_mean"], out["warm_max"] = sum(laps) / n, max(laps)
+    else:  # legacy
+        get_report_builder().warm_up()  # 렌더 풀은 동일 조건으로 예열
+        laps = [_one(ReportBuilder(), p, report) for _ in range(n)]
+        out["legacy_mean"] = sum(laps) / n
+    print(json.dumps(out))
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser("Cold vs warm render benchmark")
+    ap.add_argument("-n", type=int, default=20)
+    ap.add_argument("--child", choices=("cold", "warm", "legacy"))
+    a = ap.parse_args()
+
+    if a.child:
+        _child(a.child, a.n)
+        return
+
+    results = {}
+    for mode in ("cold", "warm", "legacy"):
+        proc = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_warmup", "--child", mode, "-n", str(a.n)],
+            capture_output=True, text=True, check=True,
+        )
+        results.update(json.loads(proc.stdout.strip().splitlines()[-1]))
+    for k, v in results.items():
+        print(f"{k:<12} {v * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+benchmarks/common.py
+────────────────────────────────────────────────────────────
+벤치마크 공용 유틸 – 목 서버 환경 변수 · 분위수 · 결과 저장 · 회귀 게이트
+
+· use_mock(srv)      → LLM_API · PIPELINE_API 를 목 서버로 (Settings 임포트 전에 호출)
+· percentiles(laps)  → {"p50", "p95", "p99"} (초)
+· report(...)        → --json 저장 + --baseline 대비 회귀 검사 (초과 시 종료 코드 1)
+
+결과 JSON 형식: {"<항목>": {"<지표>": 값, ...}, ...}
+지표 이름이 "rps" 로 끝나면 클수록 좋은 값, 나머지(지연 · 시간)는 작을수록 좋은 값으로 본다.
+"failures" 는 허용 비율과 무관하게 기준보다 늘면 회귀.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Sequence
+
+Results = Dict[str, Dict[str, float]]
+
+
+def use_mock(srv=None) -> None:
+    """목 서버(없으면 닿지 않는 주소)를 바라보도록 환경 변수 설정"""
+    base = f"http://127.0.0.1:{srv.server_port}" if srv is not None else "http://127.0.0.1:9"
+    os.environ["LLM_API"] = f"{base}/v1beta/models/mock"
+    os.environ["PIPELINE_API"] = f"{base}/"
+    os.environ.setdefault("API_KEY", "benchmark-dummy-key")
+
+
+def percentiles(laps: Sequence[float], qs: Iterable[int] = (50, 95, 99)) -> Dict[str, float]:
+    """nearest-rank 분위수"""
+    ordered = sorted(laps)
+    if not ordered:
+        return {f"p{q}": float("nan") for q in qs}
+    return {f"p{q}": ordered[max(0, math.ceil(q / 100 * len(ordered)) - 1)] for q in qs}
+
+
+def add_gate_args(ap: argparse.ArgumentParser) -> None:
+    ap.add_argument("--json", type=Path, help="결과를 JSON 으로 저장")
+    ap.add_argument("--baseline", type=Path, help="이 결과 JSON 대비 회귀 검사")
+    ap.add_argument("--tolerance", type=float, default=0.15,
+                    help="허용 회귀 비율 (기본 0.15 = 15%%)")
+
+
+def _regressions(results: Results, baseline: Results, tolerance: float) -> List[str]:
+    out = []
+    for name, metrics in results.items():
+        for metric, value in metrics.items():
+            base = baseline.get(name, {}).get(metric)
+            if metric == "failures" and base is not None and value > base:
+                out.append(f"{name}.{metric}: {base:.4g} → {value:.4g}")
+                continue
+            if base is None or base == 0 or math.isnan(base) or math.isnan(value):
+                continue
+            if metric.endswith("rps"):
+                worse = value < base * (1 - tolerance)
+            else:
+                worse = value > base * (1 + tolerance)
+            if worse:
+                out.append(f"{name}.{metric}: {base:.4g} → {value:.4g}")
+    return out
+
+
+def report(results: Results, a: argparse.Namespace) -> None:
+    """add_gate_args 로 받은 옵션 처리 – 회귀가 있으면 종료 코드 1"""
+    if a.json:
+        a.json.write_text(json.dumps(results, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"💾 결과 저장 → {a.json}")
+    if a.baseline:
+        baseline = json.loads(a.baseline.read_text(encoding="utf-8"))
+        bad = _regressions(results, baseline, a.tolerance)
+        if bad:
+            print(f"❌ 기준 대비 {a.tolerance:.0%} 넘게 나빠진 항목:")
+            for line in bad:
+                print(f"   {line}")
+            sys.exit(1)
+        print(f"✅ 기준({a.baseline}) 대비 회귀 없음 (허용 {a.tolerance:.0%})")
@@ -0,0 +1,239 @@
+"""
+benchmarks/mock_gemini.py
+────────────────────────────────────────────────────────────
+로컬 Gemini · Pipeline 목 서버 (표준 라이브러리만 사용)
+
+· POST …:generateContent → 지연 후 candidates + usageMetadata 응답
+  ─ 지연 = latency + per_kchar × (입력 글자 수 / 1000)  (prefill 근사)
+  ─ generationConfig.responseMimeType 이 JSON 이면 구조화 응답 반환
+· POST …:streamGenerateContent?alt=sse → 같은 응답을 SSE 조각으로 나눠 전송
+· 장애 주입 (선택)
+  ─ rpm        : 최근 window_s(기본 60)초 호출 수가 넘치면 429 + Retry-After
+  ─ error_rate : 해당 비율로 429 / 503 무작위 응답
+  ─ slow_rate  : 해당 비율로 slow_latency 만큼 추가 지연 (꼬리 지연)
+  ─ jitter     : 지연에 lognormal(0, jitter) 배수 적용 (중앙값 유지, 분산만 증가)
+· POST /pipeline-run → pipeline_latency 후 sample_pipeline.json 에 요청 text_stt 를 넣어 응답
+  (PipelineClient.run 과 같은 요청 · 응답 형태)
+· server.stats 에 호출 수 · 입력 글자 수 · 토큰 추정치 · 주입 오류 수를 누적
+· 벤치마크 스크립트가 스레드로 띄워 실제 쿼터 없이 측정한다
+
+단독 실행:
+    python -m benchmarks.mock_gemini --port 8765 --latency 1.0 --error-rate 0.1 --jitter 0.3
+    → LLM_API=http://127.0.0.1:8765/v1beta/models/mock  PIPELINE_API=http://127.0.0.1:8765/
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Deque, Dict
+
+_SAMPLE = Path(__file__).resolve().parent.parent / "data" / "sample_pipeline.json"
+
+_TEXT = "• 목 응답 항목\n• 두 번째 항목"
+_STRUCTURED = {
+    "executive_summary": "목 요약 문장입니다.",
+    "action_items": ["목 응답 항목", "두 번째 항목"],
+    "decisions": ["목 결정 사항"],
+    "risks": ["목 리스크"],
+    "analysis": "목 통합 분석입니다.",
+}
+
+
+def _tokens(chars: int) -> int:
+    return max(1, chars // 4)
+
+
+def _make_handler(
+    latency: float,
+    per_kchar: float,
+    stats: Dict[str, Any],
+    *,
+    rpm: int = 0,
+    window_s: float = 60.0,
+    error_rate: float = 0.0,
+    slow_rate: float = 0.0,
+    slow_latency: float = 0.0,
+    jitter: float = 0.0,
+    pipeline_latency: float = 0.0,
+):
+    lock = threading.Lock()
+    window: Deque[float] = deque()
+    sample = json.loads(_SAMPLE.read_text(encoding="utf-8"))
+
+    def _jittered(delay: float) -> float:
+        return delay * random.lognormvariate(0, jitter) if jitter else delay
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:  # noqa: N802
+            length = int(self.headers.get("Content-Length", 0))
+            req = json.loads(self.rfile.read(length) or b"{}")
+            if self.path.rstrip("/").endswith("/pipeline-run"):
+                self._pipeline(req)
+                return
+
+            prompt = "".join(
+                part.get("text", "")
+                for content in req.get("contents", [])
+                for part in content.get("parts", [])
+            )
+            cfg = req.get("generationConfig", {})
+            structured = cfg.get("responseMimeType") == "application/json"
+            text = json.dumps(_STRUCTURED, ensure_ascii=False) if structured else _TEXT
+
+            with lock:
+                now = time.monotonic()
+                while window and now - window[0] > window_s:
+                    window.popleft()
+                if rpm and len(window) >= rpm:
+                    stats["throttled"] += 1
+                    self._fail(429, retry_after=window_s - (now - window[0]))
+                    return
+                window.append(now)
+                if random.random() < error_rate:
+                    stats["errors"] += 1
+                    self._fail(random.choice((429, 503)), retry_after=1)
+                    return
+                stats["calls"] += 1
+                stats["input_chars"] += len(prompt)
+                stats["prompt_tokens"] += _tokens(len(prompt))
+                stats["output_tokens"] += _tokens(len(text))
+
+            delay = _jittered(latency + per_kchar * len(prompt) / 1000)
+            if random.random() < slow_rate:
+                delay += slow_latency
+            if ":streamGenerateContent" in self.path:
+                self._stream(text, delay)
+                return
+
+            time.sleep(delay)
+
+            body = json.dumps({
+                "candidates": [{"content": {"parts": [{"text": text}]}}],
+                "usageMetadata": {
+                    "promptTokenCount": _tokens(len(prompt)),
+                    "candidatesTokenCount": _tokens(len(text)),
+                    "totalTokenCount": _tokens(len(prompt)) + _tokens(len(text)),
+                },
+            }, ensure_ascii=False).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _pipeline(self, req: Dict[str, Any]) -> None:
+            with lock:
+                stats["pipeline_calls"] += 1
+            time.sleep(_jittered(pipeline_latency))
+            doc = dict(sample, text_stt=req.get("text_stt") or sample["text_stt"])
+            self._json(200, doc)
+
+        def _json(self, status: int, doc: Dict[str, Any]) -> None:
+            body = json.dumps(doc, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _fail(self, status: int, *, retry_after: float) -> None:
+            body = json.dumps({"error": {"code": status, "status": "RESOURCE_EXHAUSTED"}}).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Retry-After", f"{max(retry_after, 0):.2f}")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _stream(self, text: str, delay: float, pieces: int = 4) -> None:
+            """첫 조각까지 delay 의 1/4, 이후 조각마다 나머지를 균등 분배"""
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.end_headers()
+            step = max(1, len(text) // pieces)
+            for i in range(0, len(text), step):
+                time.sleep(delay / pieces)
+                event = {"candidates": [{"content": {"parts": [{"text": text[i:i + step]}]}}]}
+                self.wfile.write(f"data: {json.dumps(event, ensure_ascii=False)}\r\n\r\n".encode("utf-8"))
+                self.wfile.flush()
+            self.close_connection = True
+
+        def log_message(self, *args) -> None:  # 콘솔 소음 억제
+            pass
+
+    return _Handler
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128  # 동시 접속이 몰리는 배치 · 부하 벤치마크에서 연결 거부 방지
+
+    def handle_error(self, request, client_address) -> None:
+        # 헤징 · 취소로 클라이언트가 먼저 끊은 연결은 정상 상황
+        import sys
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+def start(
+    port: int = 0,
+    latency: float = 1.0,
+    per_kchar: float = 0.0,
+    *,
+    rpm: int = 0,
+    window_s: float = 60.0,
+    error_rate: float = 0.0,
+    slow_rate: float = 0.0,
+    slow_latency: float = 0.0,
+    jitter: float = 0.0,
+    pipeline_latency: float = 0.0,
+) -> ThreadingHTTPServer:
+    """백그라운드 스레드로 서버 기동 후 반환 (server.server_port 로 포트 확인)"""
+    stats: Dict[str, Any] = {
+        "calls": 0, "input_chars": 0, "prompt_tokens": 0, "output_tokens": 0,
+        "throttled": 0, "errors": 0, "pipeline_calls": 0,
+    }
+    handler = _make_handler(
+        latency, per_kchar, stats,
+        rpm=rpm, window_s=window_s,
+        error_rate=error_rate, slow_rate=slow_rate, slow_latency=slow_latency,
+        jitter=jitter, pipeline_latency=pipeline_latency,
+    )
+    server = _Server(("127.0.0.1", port), handler)
+    server.stats = stats  # type: ignore[attr-defined]
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def reset_stats(server: ThreadingHTTPServer) -> None:
+    for k in server.stats:  # type: ignore[attr-defined]
+        server.stats[k] = 0  # type: ignore[attr-defined]
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser("Mock Gemini server")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--latency", type=float, default=1.0)
+    ap.add_argument("--per-kchar", type=float, default=0.0, help="입력 1000자당 추가 지연(초)")
+    ap.add_argument("--rpm", type=int, default=0, help="분당 허용 호출 수 (초과 시 429)")
+    ap.add_argument("--error-rate", type=float, default=0.0, help="429/503 무작위 응답 비율")
+    ap.add_argument("--slow-rate", type=float, default=0.0, help="꼬리 지연 응답 비율")
+    ap.add_argument("--slow-latency", type=float, default=0.0, help="꼬리 지연 추가 시간(초)")
+    ap.add_argument("--jitter", type=float, default=0.0, help="지연 lognormal 분산(sigma)")
+    ap.add_argument("--pipeline-latency", type=float, default=0.0, help="/pipeline-run 지연(초)")
+    a = ap.parse_args()
+    srv = start(
+        a.port, a.latency, a.per_kchar,
+        rpm=a.rpm, error_rate=a.error_rate, slow_rate=a.slow_rate, slow_latency=a.slow_latency,
+        jitter=a.jitter, pipeline_latency=a.pipeline_latency,
+    )
+    print(f"mock gemini   → http://127.0.0.1:{srv.server_port}/v1beta/models/mock")
+    print(f"mock pipeline → http://127.0.0.1:{srv.server_port}/")
+    threading.Event().wait()
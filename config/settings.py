@@ -1,7 +1,8 @@
 from functools import lru_cache
 from pathlib import Path
+from typing import Dict, Literal, Optional
 
-from pydantic import AnyUrl, Field, ValidationError
+from pydantic import AnyUrl, Field, PositiveFloat, ValidationError
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 _ROOT = Path(__file__).resolve().parent.parent
@@ -15,6 +16,76 @@ class Settings(BaseSettings):
 
     # ───────── 선택 ────────────────
     TEMPLATE_DIR: Path = Field(default=_ROOT / "src" / "templates")
+    OUT_DIR: Path = Field(default=Path("/opt/app/out"))   # HTML / PDF 결과 루트
+
+    # ───────── 성능 튜닝 ──────────────
+    LLM_CONCURRENCY: int = Field(default=3, ge=1)   # 동시 Gemini 호출 상한 (동기 경로 · map 스레드 포함)
+    RENDER_CONCURRENCY: int = Field(default=2, ge=1)  # 동시 HTML·PDF 렌더 상한
+    REPORT_MODE: Literal["combined", "split"] = "split"  # 3회 분리 호출 vs Gemini 1회 구조화 호출 (bench_combined 로 비교)
+    MAP_REDUCE_THRESHOLD: int = Field(default=20000, ge=0)  # 이 글자 수 초과 시 map-reduce (0 = 끔)
+    MAP_CHUNK_CHARS: int = Field(default=6000, ge=500)      # map 청크 · reduce 묶음 크기
+    MAP_CHUNK_OVERLAP: int = Field(default=0, ge=0)         # 이웃 map 청크 간 겹치는 글자 수
+    MAP_FANOUT: int = Field(default=4, ge=1)                # 보고서별 동시 map · reduce 호출 상한 (비동기 경로)
+    PDF_WORKERS: int = Field(default=2, ge=0)         # PDF 렌더 프로세스 수 (0 = 인-프로세스)
+    PDF_QUEUE_SIZE: int = Field(default=16, ge=0)     # 렌더 대기열 상한
+    PDF_WARMUP: bool = True   # 서버 기동 시 렌더 풀 · 폰트 예열 (false = 첫 PDF 요청 때 기동, 빠른 기동)
+
+    # ───────── 문서 컨텍스트 ──────────
+    CONTEXT_TOKEN_BUDGET: int = Field(default=1200, ge=0)   # 프롬프트 '문서' 구역 토큰 상한(≈글자/4)
+    CONTEXT_MMR_LAMBDA: float = Field(default=0.7, ge=0, le=1)  # 1 = 점수만, 0 = 다양성만
+
+    # ───────── Gemini 쿼터 · 재시도 ─────
+    GEMINI_RPM: int = Field(default=1000, ge=0)        # 분당 요청 상한 (0 = 제한 없음)
+    GEMINI_TPM: int = Field(default=4_000_000, ge=0)   # 분당 입력 토큰 상한 (0 = 제한 없음)
+    GEMINI_QUOTA_SHARE: int = Field(default=1, ge=1)   # 쿼터를 나눠 쓰는 프로세스 수 (gunicorn 워커 수, redis 면 무시)
+    LLM_MAX_RETRIES: int = Field(default=4, ge=0)      # 429 · 5xx · 전송 오류 재시도 횟수
+    LLM_BACKOFF_BASE: float = Field(default=1.0, gt=0) # 지수 백오프 기본 간격(초)
+    LLM_BACKOFF_MAX: float = Field(default=30.0, gt=0) # 백오프 · Retry-After 상한(초)
+    LLM_HEDGE_ENABLED: bool = False                    # p95 초과 요청 중복 전송 (비동기 경로)
+    LLM_HEDGE_MIN_DELAY: float = Field(default=5.0, gt=0)  # 헤징 최소 대기(초)
+    LLM_BATCH_WINDOW: float = Field(default=0.0, ge=0)  # 여러 보고서 요청을 모으는 창(초), 0 = 배치 끔
+    LLM_BATCH_MAX: int = Field(default=32, ge=1)        # 배치당 최대 요청 수 (도달 시 창을 기다리지 않음)
+
+    # ───────── 스케줄러 (우선순위 · 테넌트 공정 큐) ─────
+    SCHED_ENABLED: bool = True
+    SCHED_LLM_SLOTS: int = Field(default=4, ge=1)      # LLM 단계(ReportSchema 생성)를 동시에 진행하는 보고서 수
+    SCHED_PDF_SLOTS: int = Field(default=0, ge=0)      # 동시 PDF 렌더 수, 0 = PDF_WORKERS (최소 1)
+    SCHED_INTERACTIVE_RESERVED: int = Field(default=1, ge=0)  # 자원별로 batch 가 쓸 수 없는 슬롯 수
+    SCHED_INTERACTIVE_DEADLINE: float = Field(default=120.0, ge=0)  # 요청 도착 후 초, 0 = 없음
+    SCHED_BATCH_DEADLINE: float = Field(default=0.0, ge=0)          # 작업 제출 후 초, 0 = 없음
+    SCHED_TENANT_WEIGHTS: Dict[str, PositiveFloat] = Field(default_factory=dict)  # JSON, 없는 테넌트 = 1
+
+    # ───────── 관측 ───────────────
+    SERVER_TIMING_ENABLED: bool = False   # 응답에 단계별 Server-Timing 헤더 추가
+
+    # ───────── 비동기 작업 큐 ──────────
+    JOB_WORKERS: int = Field(default=4, ge=1)          # 동시 실행 작업 수
+    JOB_QUEUE_SIZE: int = Field(default=32, ge=1)      # 대기열 상한 (초과 시 429)
+    JOB_RETENTION: float = Field(default=3600, ge=0)   # 완료 작업 보존 시간(초)
+
+    # ───────── 서버 산출물 보관 ────────
+    ARTIFACT_PERSIST: bool = False                               # OUT_DIR/<id>/ 에 HTML·PDF 사본 저장
+    ARTIFACT_RETENTION: float = Field(default=24 * 3600, ge=0)   # 초, 0 = 무제한
+    ARTIFACT_MAX_BYTES: int = Field(default=1024 * 1024 * 1024, ge=0)
+
+    # ───────── 보고서 캐시 ────────────
+    REPORT_CACHE_ENABLED: bool = True
+    REPORT_CACHE_DIR: Optional[Path] = None   # 비우면 <OUT_DIR>/.cache
+    REPORT_CACHE_MAX_BYTES: int = Field(default=512 * 1024 * 1024, ge=0)
+    REPORT_CACHE_TTL: float = Field(default=7 * 24 * 3600, ge=0)  # 초, 0 = 무제한
+    REPORT_INCREMENTAL: bool = True  # 같은 회의록 재전송 시 입력이 그대로인 LLM 섹션 재사용
+
+    # ───────── Gemini 응답 캐시 ───────
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_PATH: Optional[Path] = None   # 비우면 <OUT_DIR>/.cache/completions.sqlite3
+    LLM_CACHE_MAX_BYTES: int = Field(default=64 * 1024 * 1024, ge=0)
+    LLM_CACHE_TTL: float = Field(default=7 * 24 * 3600, ge=0)     # 초, 0 = 무제한
+
+    # ───────── 멀티 워커 · 공유 저장소 ─────
+    WEB_WORKERS: int = Field(default=0, ge=0)   # gunicorn 워커 수, 0 = CPU 코어 ÷ PDF_WORKERS
+    SHARED_BACKEND: Literal["local", "redis"] = "local"  # local = SQLite · 파일 (같은 볼륨끼리 공유)
+    REDIS_URL: str = "redis://localhost:6379/0"  # Redis 호환 서버 (Valkey · KeyDB 등)
+    REDIS_PREFIX: str = "reportgen:"            # 키 접두사 (한 서버를 여러 배포가 공유할 때)
 
     # ───────── Pydantic 설정 ────────
     model_config = SettingsConfigDict(
@@ -30,6 +101,14 @@ class Settings(BaseSettings):
             raise FileNotFoundError(self.TEMPLATE_DIR)
         return self.TEMPLATE_DIR
 
+    @property
+    def report_cache_dir(self) -> Path:
+        return self.REPORT_CACHE_DIR or self.OUT_DIR / ".cache"
+
+    @property
+    def llm_cache_path(self) -> Path:
+        return self.LLM_CACHE_PATH or self.OUT_DIR / ".cache" / "completions.sqlite3"
+
 
 # 싱글턴 캐시
 @lru_cache
@@ -0,0 +1,43 @@
+"""
+docker/gunicorn.conf.py
+────────────────────────────────────────────────────────────
+Gunicorn + UvicornWorker 멀티 워커 설정 (컨테이너 기본 CMD)
+
+    gunicorn -c docker/gunicorn.conf.py src.server.main:app
+
+· workers = WEB_WORKERS, 0 이면 CPU 코어 ÷ PDF_WORKERS (최소 1)
+  ─ 워커마다 PDF 렌더 프로세스를 PDF_WORKERS 개씩 띄우므로 렌더 프로세스 총합 ≈ 코어 수,
+    Gemini 대기는 각 워커 이벤트 루프가 맡는다
+· preload_app 을 쓰지 않는다 – 렌더 풀 · HTTP 세션 · 배처 스레드는 워커마다 fork 이후 생성
+· 워커 간 공유 상태(보고서 · Gemini 캐시, 작업 상태 · 산출물)는 SHARED_BACKEND 가 맡는다
+· Gemini 쿼터(GEMINI_RPM · TPM) – local 이면 워커마다 1/workers 씩 (GEMINI_QUOTA_SHARE),
+  redis 면 모든 워커 · 레플리카가 Redis 토큰 버킷 하나를 나눠 쓴다
+  ─ local : OUT_DIR · REPORT_CACHE_DIR · LLM_CACHE_PATH 가 같은 볼륨 (컨테이너 1개)
+  ─ redis : REDIS_URL (레플리카 여러 개)
+· /metrics 는 요청을 받은 워커의 값만 보여준다
+"""
+
+import os
+
+from config.settings import get_settings
+
+_cfg = get_settings()
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = _cfg.WEB_WORKERS or max(1, (os.cpu_count() or 1) // max(_cfg.PDF_WORKERS, 1))
+# 워커는 fork 로 마스터의 설정 캐시를 물려받으므로 환경 변수를 바꾼 뒤 다시 읽게 한다
+os.environ.setdefault("GEMINI_QUOTA_SHARE", str(workers))
+get_settings.cache_clear()
+
+timeout = 300            # 긴 회의록 map-reduce · PDF 변환 요청
+graceful_timeout = 60    # 종료 시 진행 중 요청 · 백그라운드 저장 마무리
+keepalive = 5
+accesslog = "-"
+
+
+def on_starting(server) -> None:  # noqa: ANN001
+    server.log.info(
+        "🚀 워커 %d개 (PDF 렌더 프로세스 워커당 %d개, 공유 저장소 %s)",
+        workers, _cfg.PDF_WORKERS, _cfg.SHARED_BACKEND,
+    )
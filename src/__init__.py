@@ -1,11 +1,18 @@
 """
-패키지 초기화: 로깅 설정 적용
+패키지 초기화 – 임포트만으로는 아무것도 설정하지 않는다
+
+· setup_logging → config/logging.yaml 적용 (Rich 핸들러)
+  진입점(CLI main · 서버 앱 모듈)에서 한 번 호출한다
 """
-import logging.config
 from pathlib import Path
-import yaml
 
 _LOG_CFG = Path(__file__).resolve().parent.parent / "config" / "logging.yaml"
 
-with _LOG_CFG.open("r", encoding="utf-8") as fh:
-    logging.config.dictConfig(yaml.safe_load(fh))
+
+def setup_logging() -> None:
+    import logging.config
+
+    import yaml  # rich 는 dictConfig 가 핸들러를 만들 때 임포트된다
+
+    with _LOG_CFG.open("r", encoding="utf-8") as fh:
+        logging.config.dictConfig(yaml.safe_load(fh))
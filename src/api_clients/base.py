@@ -1,28 +1,54 @@
 """
 src/api_clients/base.py
 ────────────────────────────────────────────────────────────
-· 각 REST 클라이언트가 httpx.Client 하나씩 보유
+· 각 REST 클라이언트가 httpx.Client 하나씩 보유 (keep-alive 풀 _LIMITS, http2=True 면 h2 설치 시 HTTP/2)
+· AsyncBaseClient → 동일 규약의 httpx.AsyncClient 버전 (FastAPI async 경로)
 · add_auth      → Authorization 헤더 추가 여부
 · extra_headers → 서비스 전용 헤더(dict) 주입
 """
 from __future__ import annotations
 
+import importlib.util
+
 import httpx
 from typing import Any, Final, Dict, Union
 from pydantic import AnyUrl
 
 from config.settings import get_settings
 
-_settings = get_settings()
 _TIMEOUT: Final = httpx.Timeout(180.0, connect=10.0)
+_LIMITS: Final = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60.0)
+_HAS_H2: Final = importlib.util.find_spec("h2") is not None
 
 
-def _build_session(add_auth: bool, extra_headers: Dict[str, str] | None) -> httpx.Client:
+def _build_headers(add_auth: bool, extra_headers: Dict[str, str] | None) -> Dict[str, str]:
     headers = extra_headers.copy() if extra_headers else {}
     if add_auth:
         # 모든 내부 서비스가 Google-Gemini Key 로 인증
-        headers["Authorization"] = f"Bearer {_settings.API_KEY}"
-    return httpx.Client(timeout=_TIMEOUT, headers=headers)
+        headers["Authorization"] = f"Bearer {get_settings().API_KEY}"
+    return headers
+
+
+def _build_session(
+    add_auth: bool, extra_headers: Dict[str, str] | None, http2: bool = False
+) -> httpx.Client:
+    return httpx.Client(
+        timeout=_TIMEOUT,
+        limits=_LIMITS,
+        http2=http2 and _HAS_H2,
+        headers=_build_headers(add_auth, extra_headers),
+    )
+
+
+def _build_async_session(
+    add_auth: bool, extra_headers: Dict[str, str] | None, http2: bool = False
+) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        timeout=_TIMEOUT,
+        limits=_LIMITS,
+        http2=http2 and _HAS_H2,
+        headers=_build_headers(add_auth, extra_headers),
+    )
 
 
 class BaseClient:
@@ -32,9 +58,10 @@ class BaseClient:
         *,
         add_auth: bool = True,
         extra_headers: Dict[str, str] | None = None,
+        http2: bool = False,
     ) -> None:
         self.base_url = str(base_url).rstrip("/")
-        self.session = _build_session(add_auth, extra_headers)
+        self.session = _build_session(add_auth, extra_headers, http2)
 
     # --------------------------------------------------
     def _post(self, path: str, json: Dict[str, Any]) -> Dict[str, Any]:
@@ -42,3 +69,28 @@ class BaseClient:
         resp = self.session.post(url, json=json)
         resp.raise_for_status()
         return resp.json()
+
+
+class AsyncBaseClient:
+    """BaseClient 의 비동기 버전 – 이벤트 루프를 막지 않는다."""
+
+    def __init__(
+        self,
+        base_url: Union[str, AnyUrl],
+        *,
+        add_auth: bool = True,
+        extra_headers: Dict[str, str] | None = None,
+        http2: bool = False,
+    ) -> None:
+        self.base_url = str(base_url).rstrip("/")
+        self.session = _build_async_session(add_auth, extra_headers, http2)
+
+    # --------------------------------------------------
+    async def _post(self, path: str, json: Dict[str, Any]) -> Dict[str, Any]:
+        url = f"{self.base_url}{path}"
+        resp = await self.session.post(url, json=json)
+        resp.raise_for_status()
+        return resp.json()
+
+    async def aclose(self) -> None:
+        await self.session.aclose()
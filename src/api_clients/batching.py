@@ -0,0 +1,183 @@
+"""
+src/api_clients/batching.py
+────────────────────────────────────────────────────────────
+여러 보고서의 Gemini 요청을 짧은 창(LLM_BATCH_WINDOW) 동안 모아 한꺼번에 내보내는 배치 계층
+(대량 재생성 · 백필처럼 지연보다 처리량이 중요한 실행용, 기본 꺼짐)
+
+· GeminiBatcher          → 전용 이벤트 루프 스레드 1개 + AsyncGeminiClient(HTTP/2) 1개
+  ─ 창 안에 모인 요청 중 바디가 같은 것은 1회만 전송하고 결과를 대기자 모두에게 나눠 준다
+  ─ 모인 요청은 같은 연결 위에서 동시에 전송 (h2 가 있으면 스트림 다중화, 없으면 keep-alive 풀)
+  ─ LLM_BATCH_MAX 개가 모이면 창이 끝나기 전에 바로 전송
+  ─ 쿼터 대기 · 재시도 · 응답 캐시는 AsyncGeminiClient 규약 그대로
+    (submit 은 메모리 캐시만 확인하고, 2차 계층 조회는 배처 루프에서 스레드로)
+· BatchedGeminiClient      → GeminiClient.generate 와 같은 동기 규약 (CLI · 스레드 풀)
+· AsyncBatchedGeminiClient → AsyncGeminiClient 와 같은 비동기 규약 (스트리밍은 배치 없이 그대로)
+
+Gemini 의 batchGenerateContent 는 수 분 ~ 수 시간 뒤 결과를 받는 비동기 작업 API 라
+요청을 기다리는 프로세서에 바로 돌려줄 수 없으므로 여기서는 쓰지 않는다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from config.settings import get_settings
+from src.metrics import GEMINI_BATCH_SIZE
+from .gemini_client import AsyncGeminiClient, CompletionCache, _build_body, get_completion_cache
+from .rate_limit import get_rate_limiter, get_retry_policy
+
+log = logging.getLogger(__name__)
+
+
+class GeminiBatcher:
+    def __init__(self, client: AsyncGeminiClient, *, window: float, max_batch: int) -> None:
+        self.client = client  # 배처 루프에서만 사용
+        self.window = window
+        self.max_batch = max_batch
+        self._pending: Dict[str, Tuple[Dict[str, Any], List["Future[str]"]]] = {}
+        self._waiters = 0
+        self._lock = threading.Lock()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="gemini-batch", daemon=True)
+        self._thread.start()
+
+    # --------------------------------------------------
+    def submit(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        *,
+        max_tokens: int = 1024,
+        temperature: float = 0.8,
+        top_p: float = 0.95,
+        response_mime_type: Optional[str] = None,
+        response_schema: Optional[Dict[str, Any]] = None,
+    ) -> "Future[str]":
+        """요청을 현재 창에 넣고 결과 Future 반환 (캐시 적중이면 이미 완료된 Future)"""
+        body = _build_body(
+            system_prompt, user_prompt,
+            max_tokens=max_tokens, temperature=temperature, top_p=top_p,
+            response_mime_type=response_mime_type, response_schema=response_schema,
+        )
+        cache = self.client.cache
+        key = CompletionCache.key(self.client.base_url, body)
+        fut: "Future[str]" = Future()
+        # 호출 측에서는 메모리 LRU 만 본다 – 2차 계층(SQLite · Redis) 조회는 배처 루프의 _send 에서
+        if cache and (hit := cache.peek(key)) is not None:
+            fut.set_result(hit)
+            return fut
+
+        with self._lock:
+            slot = self._pending.setdefault(key, (body, []))
+            slot[1].append(fut)
+            self._waiters += 1
+            opened = self._waiters == 1
+            full = len(self._pending) >= self.max_batch
+        if full:
+            self._loop.call_soon_threadsafe(self._flush)
+        elif opened:
+            self._loop.call_soon_threadsafe(self._arm)
+        return fut
+
+    def _arm(self) -> None:
+        if self._timer is None:
+            self._timer = self._loop.call_later(self.window, self._flush)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        with self._lock:
+            batch, self._pending = self._pending, {}
+            waiters, self._waiters = self._waiters, 0
+        if not batch:
+            return
+        GEMINI_BATCH_SIZE.observe(waiters, kind="requests")
+        GEMINI_BATCH_SIZE.observe(len(batch), kind="sent")
+        log.debug("📦 Gemini 배치 전송 – 요청 %d건 → %d건", waiters, len(batch))
+        for key, (body, futs) in batch.items():
+            self._loop.create_task(self._send(key, body, futs))
+
+    async def _send(self, key: str, body: Dict[str, Any], futs: List["Future[str]"]) -> None:
+        cache = self.client.cache
+        try:
+            if cache is None or (text := await cache.aget(key)) is None:
+                text = await self.client.complete(body, cache_key=key if cache else None)
+        except BaseException as exc:  # RuntimeError(_abort) · 취소 – 대기자 모두에게 전달
+            for f in futs:
+                f.set_exception(exc)
+            if not isinstance(exc, Exception):
+                raise
+        else:
+            for f in futs:
+                f.set_result(text)
+
+    # --------------------------------------------------
+    def close(self) -> None:
+        """남은 창을 내보내고 HTTP 세션 정리 후 루프 종료"""
+        if not self._loop.is_running():
+            return
+
+        async def _shutdown() -> None:
+            self._flush()
+            tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self.client.aclose()
+
+        asyncio.run_coroutine_threadsafe(_shutdown(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+
+class BatchedGeminiClient:
+    """GeminiClient 대체 – 호출 스레드는 배치 결과가 나올 때까지 기다린다"""
+
+    def __init__(self, batcher: GeminiBatcher) -> None:
+        self.batcher = batcher
+
+    def generate(self, system_prompt: str, user_prompt: str, **opts: Any) -> str:
+        return self.batcher.submit(system_prompt, user_prompt, **opts).result()
+
+    def forget(self, system_prompt: str, user_prompt: str, **opts: Any) -> None:
+        client = self.batcher.client
+        if (key := client.cache_key(system_prompt, user_prompt, **opts)) is not None:
+            client.cache.discard(key)  # type: ignore[union-attr]
+
+
+class AsyncBatchedGeminiClient:
+    """AsyncGeminiClient 대체 – generate 만 배치, stream_generate 는 stream_client 로 바로 보낸다"""
+
+    def __init__(self, batcher: GeminiBatcher, stream_client: AsyncGeminiClient) -> None:
+        self.batcher = batcher
+        self.stream_client = stream_client
+
+    async def generate(self, system_prompt: str, user_prompt: str, **opts: Any) -> str:
+        return await asyncio.wrap_future(self.batcher.submit(system_prompt, user_prompt, **opts))
+
+    def stream_generate(self, system_prompt: str, user_prompt: str, **opts: Any) -> AsyncIterator[str]:
+        return self.stream_client.stream_generate(system_prompt, user_prompt, **opts)
+
+    async def forget(self, system_prompt: str, user_prompt: str, **opts: Any) -> None:
+        await self.stream_client.forget(system_prompt, user_prompt, **opts)
+
+    async def aclose(self) -> None:
+        await self.stream_client.aclose()
+
+
+@lru_cache
+def get_gemini_batcher() -> Optional[GeminiBatcher]:
+    """LLM_BATCH_WINDOW=0 이면 None (배치 없이 요청마다 바로 전송)"""
+    cfg = get_settings()
+    if not cfg.LLM_BATCH_WINDOW:
+        return None
+    client = AsyncGeminiClient(
+        cfg.LLM_API, cache=get_completion_cache(),
+        limiter=get_rate_limiter(), retry=get_retry_policy(), http2=True,
+    )
+    return GeminiBatcher(client, window=cfg.LLM_BATCH_WINDOW, max_batch=cfg.LLM_BATCH_MAX)
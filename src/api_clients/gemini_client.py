@@ -2,32 +2,368 @@
 src/api_clients/gemini_client.py
 ────────────────────────────────────────────────────────────
 Google Generative Language API – Gemini 1.5 Flash 전용 클라이언트
+
+· GeminiClient       → 동기 (CLI · 스레드 풀)
+· AsyncGeminiClient  → 비동기 (FastAPI 이벤트 루프)
+· CompletionCache    → (선택) 동일 요청 바디 응답 재사용
+                       메모리 LRU + SQLite 영속 저장, TTL · 용량 제한
+                       (SHARED_BACKEND=redis 면 RedisCompletionCache – 워커 · 레플리카 공유)
+· limiter · retry    → (선택) RPM/TPM 토큰 버킷 대기, 429 · 5xx 백오프 재시도
+                       (rate_limit.py, 비동기 클라이언트는 hedger 도 지원)
+· 여러 보고서의 요청을 모아 보내는 배치 계층은 batching.py
 """
 
 from __future__ import annotations
 
+import contextlib
+import hashlib
+import json
 import logging
-from typing import Any, Dict, Optional
+import sqlite3
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Optional
 
 import httpx
 from pydantic import AnyUrl
 
 from config.settings import get_settings
-from .base import BaseClient
+from src.metrics import CACHE_REQUESTS, GEMINI_REQUESTS, GEMINI_TOKENS, IN_FLIGHT, span
+from .base import AsyncBaseClient, BaseClient
+from .redis_client import get_redis, rkey, ttl_ms, use_redis
+from .rate_limit import GeminiRateLimiter, Hedger, RetryPolicy, estimate_tokens
 
 log = logging.getLogger(__name__)
 
 
+# ----------------------------------------------------------- 공용 helpers
+def _resolve_api_key(api_key: Optional[str]) -> str:
+    key = api_key or get_settings().API_KEY
+    if not key:
+        raise ValueError("Google Gemini API_KEY 가 설정되지 않았습니다.")
+    return key
+
+
+def _build_body(
+    system_prompt: str,
+    user_prompt: str,
+    *,
+    max_tokens: int = 1024,
+    temperature: float = 0.8,
+    top_p: float = 0.95,
+    response_mime_type: Optional[str] = None,
+    response_schema: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """system + user 프롬프트를 하나로 묶어 user 역할 요청 바디 생성 (기본값은 generate 와 같다)"""
+    body: Dict[str, Any] = {
+        "contents": [
+            {
+                "role": "user",
+                "parts": [{"text": f"{system_prompt}\n\n{user_prompt}"}],
+            }
+        ],
+        "generationConfig": {
+            "maxOutputTokens": max_tokens,
+            "temperature": temperature,
+            "topP": top_p,
+        },
+    }
+    # 구조화 출력 (예: application/json + responseSchema)
+    if response_mime_type:
+        body["generationConfig"]["responseMimeType"] = response_mime_type
+    if response_schema:
+        body["generationConfig"]["responseSchema"] = response_schema
+    return body
+
+
+def _extract_text(data: Dict[str, Any]) -> str:
+    return data["candidates"][0]["content"]["parts"][0]["text"].strip()
+
+
+def _record_usage(data: Dict[str, Any]) -> None:
+    """usageMetadata → gemini_tokens_total{kind=prompt|output}"""
+    usage = data.get("usageMetadata") or {}
+    GEMINI_TOKENS.inc(usage.get("promptTokenCount", 0), kind="prompt")
+    GEMINI_TOKENS.inc(usage.get("candidatesTokenCount", 0), kind="output")
+
+
+def _abort(exc: Exception) -> RuntimeError:
+    # Gemini 실패는 더 이상 허용하지 않음 → 즉시 오류 전파
+    log.error("Gemini 호출 실패 – 파이프라인 중단: %s", exc)
+    return RuntimeError("🛑 Gemini API 호출 실패 – 작업을 중단합니다.")
+
+
+# ----------------------------------------------------------- 응답 캐시
+class CompletionCache:
+    """
+    (모델 URL, 요청 바디) → 응답 텍스트
+    · 1차: 프로세스 메모리 LRU (memory_bytes)
+    · 2차: SQLite 파일 (max_bytes 초과 시 오래 안 쓴 순서로 삭제 – evict_every 번 저장마다 검사)
+      ─ 같은 볼륨을 쓰는 워커 프로세스끼리 공유 (WAL, 쓰기 잠금은 timeout 동안 대기)
+      ─ 스레드마다 연결을 따로 두고 Python 잠금은 메모리 LRU 에만 건다 (읽기는 WAL 로 동시 진행)
+      ─ RedisCompletionCache 는 2차 계층만 Redis 로 바꾼다 (레플리카 간 공유)
+    · ttl 초가 지난 항목은 두 계층 모두에서 미스로 취급
+    · 이벤트 루프에서는 aget · aput – 메모리 적중만 루프에서, 2차 계층 I/O 는 스레드로
+      (SQLite 쓰기 잠금 대기 · Redis 왕복이 루프 전체를 멈추지 않도록)
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        ttl: float,
+        max_bytes: int,
+        memory_bytes: int = 32 * 1024 * 1024,
+        evict_every: int = 64,
+    ) -> None:
+        self._init_memory(ttl, memory_bytes)
+        self.max_bytes = max_bytes
+        self.evict_every = evict_every
+        self._path = path
+        self._local = threading.local()
+        self._puts = 0
+        self._evict_lock = threading.Lock()
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        db = self._conn()
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS completions ("
+            " key TEXT PRIMARY KEY, value TEXT NOT NULL,"
+            " created REAL NOT NULL, accessed REAL NOT NULL, size INTEGER NOT NULL)"
+        )
+        db.execute("CREATE INDEX IF NOT EXISTS completions_accessed ON completions (accessed)")
+        db.execute("CREATE INDEX IF NOT EXISTS completions_created ON completions (created)")
+
+    def _conn(self) -> sqlite3.Connection:
+        """스레드별 SQLite 연결"""
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(str(self._path), isolation_level=None, timeout=30)
+            self._local.db = db
+        return db
+
+    def _init_memory(self, ttl: float, memory_bytes: int) -> None:
+        self.ttl = ttl
+        self.memory_bytes = memory_bytes
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._mem: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+        self._mem_size = 0
+
+    # --------------------------------------------------
+    @staticmethod
+    def key(model_url: str, body: Dict[str, Any]) -> str:
+        canonical = json.dumps(body, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha256(f"{model_url}\0{canonical}".encode("utf-8")).hexdigest()
+
+    def _fresh(self, created: float, now: float) -> bool:
+        return self.ttl <= 0 or now - created <= self.ttl
+
+    def _remember(self, key: str, created: float, value: str) -> None:
+        """메모리 LRU 에 적재 (lock 보유 상태에서 호출)"""
+        if key in self._mem:
+            self._mem_size -= len(self._mem.pop(key)[1])
+        self._mem[key] = (created, value)
+        self._mem_size += len(value)
+        while self._mem_size > self.memory_bytes and self._mem:
+            _, (_, old) = self._mem.popitem(last=False)
+            self._mem_size -= len(old)
+
+    def _mem_hit(self, key: str, now: float) -> Optional[str]:
+        """메모리 LRU 적중 (lock 보유 상태에서 호출)"""
+        item = self._mem.get(key)
+        if item is None or not self._fresh(item[0], now):
+            return None
+        self._mem.move_to_end(key)
+        self.hits += 1
+        CACHE_REQUESTS.inc(cache="llm", result="hit")
+        return item[1]
+
+    # --------------------------------------------------
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            if (value := self._mem_hit(key, now)) is not None:
+                return value
+
+        item = self._load(key, now)  # 2차 계층 I/O 는 잠금 밖에서
+        with self._lock:
+            if item is None:
+                self.misses += 1
+                CACHE_REQUESTS.inc(cache="llm", result="miss")
+                return None
+            self._remember(key, *item)
+            self.hits += 1
+        CACHE_REQUESTS.inc(cache="llm", result="hit")
+        return item[1]
+
+    def put(self, key: str, value: str) -> None:
+        now = time.time()
+        with self._lock:
+            self._remember(key, now, value)
+        self._store(key, value, now)
+
+    def peek(self, key: str) -> Optional[str]:
+        """메모리 LRU 만 조회 (I/O 없음 – 미스여도 미스로 세지 않는다)"""
+        with self._lock:
+            return self._mem_hit(key, time.time())
+
+    async def aget(self, key: str) -> Optional[str]:
+        if (value := self.peek(key)) is not None:
+            return value
+        return await asyncio.to_thread(self.get, key)
+
+    async def aput(self, key: str, value: str) -> None:
+        await asyncio.to_thread(self.put, key, value)
+
+    def discard(self, key: str) -> None:
+        """두 계층 모두에서 삭제 (저장된 응답을 쓸 수 없다고 판명됐을 때)"""
+        with self._lock:
+            if (item := self._mem.pop(key, None)) is not None:
+                self._mem_size -= len(item[1])
+        self._delete(key)
+
+    async def adiscard(self, key: str) -> None:
+        await asyncio.to_thread(self.discard, key)
+
+    # -------------------------------------------------- 2차 계층 (SQLite)
+    def _load(self, key: str, now: float) -> Optional[tuple[float, str]]:
+        """(created, value) – 없거나 만료면 None"""
+        db = self._conn()
+        row = db.execute(
+            "SELECT value, created FROM completions WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None or not self._fresh(row[1], now):
+            return None
+        db.execute("UPDATE completions SET accessed = ? WHERE key = ?", (now, key))
+        return row[1], row[0]
+
+    def _store(self, key: str, value: str, now: float) -> None:
+        size = len(value.encode("utf-8"))
+        self._conn().execute(
+            "INSERT OR REPLACE INTO completions VALUES (?, ?, ?, ?, ?)",
+            (key, value, now, now, size),
+        )
+        with self._lock:
+            due = self._puts % self.evict_every == 0
+            self._puts += 1
+        # 다른 스레드가 정리 중이면 건너뛴다 (다음 주기에 다시 검사)
+        if due and self._evict_lock.acquire(blocking=False):
+            try:
+                self._evict(now)
+            finally:
+                self._evict_lock.release()
+
+    def _delete(self, key: str) -> None:
+        self._conn().execute("DELETE FROM completions WHERE key = ?", (key,))
+
+    def _evict(self, now: float) -> None:
+        db = self._conn()
+        if self.ttl > 0:
+            db.execute("DELETE FROM completions WHERE created < ?", (now - self.ttl,))
+        total = db.execute("SELECT COALESCE(SUM(size), 0) FROM completions").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        victims = []
+        cur = db.execute("SELECT key, size FROM completions ORDER BY accessed")  # 인덱스 순서로 필요한 만큼만
+        for key, size in cur:
+            if total <= self.max_bytes:
+                break
+            victims.append((key,))
+            total -= size
+        cur.close()
+        db.executemany("DELETE FROM completions WHERE key = ?", victims)
+        log.debug("🧹 Gemini 응답 캐시 정리 – %d건", len(victims))
+
+    # --------------------------------------------------
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": round(self.hit_rate, 4)}
+
+
+class RedisCompletionCache(CompletionCache):
+    """
+    2차 계층 = Redis (SHARED_BACKEND=redis)
+    · 값은 그대로, 만료는 키 TTL 로 처리 (읽을 때 TTL 을 연장하지 않음 – created 기준과 같게)
+    · max_bytes 는 쓰지 않는다 – 총 용량은 Redis maxmemory 정책이 관리
+    """
+
+    def __init__(
+        self,
+        redis: Any,
+        *,
+        ttl: float,
+        memory_bytes: int = 32 * 1024 * 1024,
+    ) -> None:
+        self._init_memory(ttl, memory_bytes)
+        self._r = redis
+
+    def _load(self, key: str, now: float) -> Optional[tuple[float, str]]:
+        raw = self._r.get(rkey("llm", key))
+        return None if raw is None else (now, raw.decode("utf-8"))
+
+    def _store(self, key: str, value: str, now: float) -> None:
+        self._r.set(rkey("llm", key), value.encode("utf-8"), px=ttl_ms(self.ttl))
+
+    def _delete(self, key: str) -> None:
+        self._r.delete(rkey("llm", key))
+
+
+@lru_cache
+def get_completion_cache() -> Optional[CompletionCache]:
+    """
+    LLM_CACHE_ENABLED=false 면 None, SHARED_BACKEND=redis 면 Redis 2차 계층
+    SQLite 파일을 만들 수 없으면(쓰기 권한 없는 OUT_DIR 등) 경고 후 캐시 없이 진행
+    """
+    cfg = get_settings()
+    if not cfg.LLM_CACHE_ENABLED:
+        return None
+    if use_redis():
+        return RedisCompletionCache(get_redis(), ttl=cfg.LLM_CACHE_TTL)
+    try:
+        return CompletionCache(
+            cfg.llm_cache_path,
+            ttl=cfg.LLM_CACHE_TTL,
+            max_bytes=cfg.LLM_CACHE_MAX_BYTES,
+        )
+    except (OSError, sqlite3.Error) as exc:
+        log.warning("⚠️ Gemini 응답 캐시 비활성화 – %s (%s)", cfg.llm_cache_path, exc)
+        return None
+
+
 class GeminiClient(BaseClient):
     """
     엔드포인트 예시
       https://generativelanguage.googleapis.com/v1beta/models/gemini-1.5-flash-latest
     """
 
-    def __init__(self, base_url: str | AnyUrl, api_key: Optional[str] = None) -> None:
-        self._api_key: str = api_key or get_settings().API_KEY
-        if not self._api_key:
-            raise ValueError("Google Gemini API_KEY 가 설정되지 않았습니다.")
+    def __init__(
+        self,
+        base_url: str | AnyUrl,
+        api_key: Optional[str] = None,
+        *,
+        cache: Optional[CompletionCache] = None,
+        limiter: Optional[GeminiRateLimiter] = None,
+        retry: Optional[RetryPolicy] = None,
+        concurrency: Optional[threading.Semaphore] = None,
+    ) -> None:
+        self._api_key: str = _resolve_api_key(api_key)
+        self.cache = cache
+        self.limiter = limiter
+        self.retry = retry or RetryPolicy(max_retries=0)
+        # 프로세스 전역 동시 전송 상한 (LLM_CONCURRENCY) – map-reduce 내부 스레드까지 포함
+        self.concurrency = concurrency or contextlib.nullcontext()
 
         # BaseClient 에서는 인증 헤더가 불필요
         super().__init__(str(base_url).rstrip("/"), add_auth=False)
@@ -40,12 +376,43 @@ class GeminiClient(BaseClient):
         """
         /:generateContent POST 래퍼
         * API-KEY 는 `key` 쿼리스트링으로 전달해야 400 오류가 발생하지 않는다.
+        * 매 시도 전에 쿼터 버킷에서 대기하고, 재시도 가능한 오류는 백오프 후 재전송
         """
-        resp = self.session.post(self._gen_url, params={"key": self._api_key}, json=payload)
-        resp.raise_for_status()
-        return resp.json()
+        tokens = estimate_tokens(payload)
+        attempt = 0
+        while True:
+            if self.limiter:
+                self.limiter.acquire(tokens)
+            try:
+                with self.concurrency, span("gemini.request"), IN_FLIGHT.track(kind="gemini"):
+                    resp = self.session.post(
+                        self._gen_url, params={"key": self._api_key}, json=payload
+                    )
+                resp.raise_for_status()
+                GEMINI_REQUESTS.inc(outcome="ok")
+                return resp.json()
+            except httpx.HTTPError as exc:
+                delay = self.retry.next_delay(attempt, exc)
+                GEMINI_REQUESTS.inc(outcome="error" if delay is None else "retry")
+                if delay is None:
+                    raise
+                log.warning("⏳ Gemini 재시도 %d회차 – %.1fs 후 (%s)", attempt + 1, delay, exc)
+                if not (self.limiter and self.limiter.throttled(exc, delay)):
+                    time.sleep(delay)
+                attempt += 1
 
     # ----------------------------------------------------------- public
+    def cache_key(self, system_prompt: str, user_prompt: str, **opts: Any) -> Optional[str]:
+        """generate 와 같은 인자의 캐시 키 (캐시 비활성이면 None)"""
+        if self.cache is None:
+            return None
+        return self.cache.key(self.base_url, _build_body(system_prompt, user_prompt, **opts))
+
+    def forget(self, system_prompt: str, user_prompt: str, **opts: Any) -> None:
+        """generate 와 같은 인자로 저장된 응답을 캐시에서 삭제 (응답을 쓸 수 없을 때)"""
+        if (key := self.cache_key(system_prompt, user_prompt, **opts)) is not None:
+            self.cache.discard(key)  # type: ignore[union-attr]
+
     def generate(
         self,
         system_prompt: str,
@@ -54,29 +421,205 @@ class GeminiClient(BaseClient):
         max_tokens: int = 1024,
         temperature: float = 0.8,
         top_p: float = 0.95,
+        response_mime_type: Optional[str] = None,
+        response_schema: Optional[Dict[str, Any]] = None,
     ) -> str:
         """
         system + user 프롬프트를 하나로 묶어 user 역할로 전송.
+        캐시가 설정돼 있으면 동일 바디의 이전 응답을 네트워크 없이 반환.
         예외 발생 시 RuntimeError 로 전파해 전체 파이프라인을 즉시 중단한다.
         """
-        body: Dict[str, Any] = {
-            "contents": [
-                {
-                    "role": "user",
-                    "parts": [{"text": f"{system_prompt}\n\n{user_prompt}"}],
-                }
-            ],
-            "generationConfig": {
-                "maxOutputTokens": max_tokens,
-                "temperature": temperature,
-                "topP": top_p,
-            },
-        }
+        body = _build_body(
+            system_prompt, user_prompt,
+            max_tokens=max_tokens, temperature=temperature, top_p=top_p,
+            response_mime_type=response_mime_type, response_schema=response_schema,
+        )
+        key = self.cache.key(self.base_url, body) if self.cache else None
+        if key and (hit := self.cache.get(key)) is not None:
+            return hit
 
         try:
             data = self._post_gen(body)
-            return data["candidates"][0]["content"]["parts"][0]["text"].strip()
+            _record_usage(data)
+            text = _extract_text(data)
+        except Exception as exc:  # httpx.HTTPError | KeyError | IndexError
+            raise _abort(exc) from exc
+
+        if key:
+            self.cache.put(key, text)
+        return text
+
+
+class AsyncGeminiClient(AsyncBaseClient):
+    """GeminiClient 와 동일한 규약의 비동기 버전 (generate 가 코루틴)"""
+
+    def __init__(
+        self,
+        base_url: str | AnyUrl,
+        api_key: Optional[str] = None,
+        *,
+        cache: Optional[CompletionCache] = None,
+        limiter: Optional[GeminiRateLimiter] = None,
+        retry: Optional[RetryPolicy] = None,
+        hedger: Optional[Hedger] = None,
+        http2: bool = False,
+    ) -> None:
+        self._api_key: str = _resolve_api_key(api_key)
+        self.cache = cache
+        self.limiter = limiter
+        self.retry = retry or RetryPolicy(max_retries=0)
+        self.hedger = hedger
+        super().__init__(str(base_url).rstrip("/"), add_auth=False, http2=http2)
+        self._gen_url: str = f"{self.base_url}:generateContent"
+        self._stream_url: str = f"{self.base_url}:streamGenerateContent"
+
+    # ----------------------------------------------------------- helpers
+    async def _send(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        with span("gemini.request"), IN_FLIGHT.track(kind="gemini"):
+            resp = await self.session.post(
+                self._gen_url, params={"key": self._api_key}, json=payload
+            )
+        resp.raise_for_status()
+        return resp.json()
+
+    async def _post_gen(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        쿼터 대기 → (헤징) 전송 → 재시도 가능한 오류는 백오프 후 재전송
+        * 헤징 사본도 쿼터를 차감하고 보낸다 (중복 전송이 RPM · TPM 을 넘지 않도록)
+        """
+        tokens = estimate_tokens(payload)
+
+        async def hedge() -> Dict[str, Any]:
+            if self.limiter:
+                await self.limiter.aacquire(tokens)
+            return await self._send(payload)
+
+        attempt = 0
+        while True:
+            try:
+                if self.limiter:
+                    await self.limiter.aacquire(tokens)
+                if self.hedger:
+                    data = await self.hedger.run(lambda: self._send(payload), hedge)
+                else:
+                    data = await self._send(payload)
+                GEMINI_REQUESTS.inc(outcome="ok")
+                return data
+            except httpx.HTTPError as exc:
+                delay = self.retry.next_delay(attempt, exc)
+                GEMINI_REQUESTS.inc(outcome="error" if delay is None else "retry")
+                if delay is None:
+                    raise
+                log.warning("⏳ Gemini 재시도 %d회차 – %.1fs 후 (%s)", attempt + 1, delay, exc)
+                if not (self.limiter and await self.limiter.athrottled(exc, delay)):
+                    await asyncio.sleep(delay)
+                attempt += 1
+
+    # ----------------------------------------------------------- public
+    cache_key = GeminiClient.cache_key
+
+    async def forget(self, system_prompt: str, user_prompt: str, **opts: Any) -> None:
+        """GeminiClient.forget 의 비동기 버전"""
+        if (key := self.cache_key(system_prompt, user_prompt, **opts)) is not None:
+            await self.cache.adiscard(key)  # type: ignore[union-attr]
+
+    async def generate(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        *,
+        max_tokens: int = 1024,
+        temperature: float = 0.8,
+        top_p: float = 0.95,
+        response_mime_type: Optional[str] = None,
+        response_schema: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        body = _build_body(
+            system_prompt, user_prompt,
+            max_tokens=max_tokens, temperature=temperature, top_p=top_p,
+            response_mime_type=response_mime_type, response_schema=response_schema,
+        )
+        key = self.cache.key(self.base_url, body) if self.cache else None
+        if key and (hit := await self.cache.aget(key)) is not None:
+            return hit
+        return await self.complete(body, cache_key=key)
+
+    async def complete(self, body: Dict[str, Any], *, cache_key: Optional[str] = None) -> str:
+        """이미 만든 요청 바디 전송 → 응답 텍스트 (cache_key 가 있으면 캐시에 저장)"""
+        try:
+            data = await self._post_gen(body)
+            _record_usage(data)
+            text = _extract_text(data)
         except Exception as exc:  # httpx.HTTPError | KeyError | IndexError
-            # Gemini 실패는 더 이상 허용하지 않음 → 즉시 오류 전파
-            log.error("Gemini 호출 실패 – 파이프라인 중단: %s", exc)
-            raise RuntimeError("🛑 Gemini API 호출 실패 – 작업을 중단합니다.") from exc
+            raise _abort(exc) from exc
+
+        if cache_key and self.cache:
+            await self.cache.aput(cache_key, text)
+        return text
+
+    async def stream_generate(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        *,
+        max_tokens: int = 1024,
+        temperature: float = 0.8,
+        top_p: float = 0.95,
+    ) -> AsyncIterator[str]:
+        """
+        :streamGenerateContent (SSE) 로 응답 텍스트 조각을 생성되는 대로 반환.
+        캐시 적중 시 전체 텍스트를 한 번에 내보내고, 완료 후 전체 응답을 캐시에 저장한다.
+        재시도는 첫 조각을 내보내기 전 오류에만 적용된다.
+        """
+        body = _build_body(
+            system_prompt, user_prompt,
+            max_tokens=max_tokens, temperature=temperature, top_p=top_p,
+        )
+        key = self.cache.key(self.base_url, body) if self.cache else None
+        if key and (hit := await self.cache.aget(key)) is not None:
+            yield hit
+            return
+
+        parts: list[str] = []
+        usage: Dict[str, Any] = {}
+        tokens = estimate_tokens(body)
+        attempt = 0
+        while True:
+            try:
+                if self.limiter:
+                    await self.limiter.aacquire(tokens)
+                with IN_FLIGHT.track(kind="gemini"):
+                    async with self.session.stream(
+                        "POST", self._stream_url,
+                        params={"key": self._api_key, "alt": "sse"}, json=body,
+                    ) as resp:
+                        resp.raise_for_status()
+                        async for line in resp.aiter_lines():
+                            if not line.startswith("data:"):
+                                continue
+                            data = json.loads(line[5:])
+                            usage = data.get("usageMetadata") or usage  # 마지막 이벤트가 누적 합계
+                            if not data.get("candidates"):
+                                continue
+                            piece = "".join(
+                                part.get("text", "")
+                                for part in data["candidates"][0]["content"].get("parts", [])
+                            )
+                            if piece:
+                                parts.append(piece)
+                                yield piece
+                GEMINI_REQUESTS.inc(outcome="ok")
+                break
+            except Exception as exc:  # httpx.HTTPError | KeyError | IndexError | JSONDecodeError
+                delay = None if parts else self.retry.next_delay(attempt, exc)
+                GEMINI_REQUESTS.inc(outcome="error" if delay is None else "retry")
+                if delay is None:
+                    raise _abort(exc) from exc
+                log.warning("⏳ Gemini 스트림 재시도 %d회차 – %.1fs 후 (%s)", attempt + 1, delay, exc)
+                if not (self.limiter and await self.limiter.athrottled(exc, delay)):
+                    await asyncio.sleep(delay)
+                attempt += 1
+
+        _record_usage({"usageMetadata": usage})
+        if key:
+            await self.cache.aput(key, "".join(parts).strip())
@@ -3,23 +3,66 @@ src/api_clients/pipeline_client.py
 ────────────────────────────────────────────────────────────
 단일 Pipeline API 클라이언트
 ▸ 실제 서버가 없으면 /opt/app/data/sample_pipeline.json 로 폴백
+▸ 샘플 JSON 은 프로세스당 한 번만 읽고 파싱해 재사용
+▸ 동일한 (text_stt, num_clusters, top_k, target_lang) 요청이 진행 중이면
+  새 호출 없이 그 결과를 함께 기다린다 (request coalescing)
+▸ 동기 · 비동기 모두 keep-alive 커넥션 풀(_LIMITS) + HTTP/2(h2 설치 시) 공유
+▸ AsyncPipelineClient → FastAPI async 경로용 (POST /report-stt)
+
+※ 반환 dict 는 동시 요청 · 샘플 캐시와 공유될 수 있으므로 수정하지 말 것
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import threading
+from concurrent.futures import Future
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 import httpx
-from .base import BaseClient
+from .base import AsyncBaseClient, BaseClient
 
 log = logging.getLogger(__name__)
 
 # 샘플 JSON 위치 (docker-compose 에서 /opt/app/data 로 마운트)
 _SAMPLE_FILE = Path("/opt/app/data/sample_pipeline.json")
 
+_Key = Tuple[str, int, int, str]
+
+
+@lru_cache(maxsize=1)
+def _load_sample() -> Dict[str, Any]:
+    if not _SAMPLE_FILE.exists():
+        raise FileNotFoundError(
+            f"Sample file not found: {_SAMPLE_FILE}. "
+            "테스트용 sample_pipeline.json 을 준비하세요."
+        )
+    return json.loads(_SAMPLE_FILE.read_text(encoding="utf-8"))
+
+
+def _fallback(exc: Exception) -> Dict[str, Any]:
+    """404 · 연결 오류 → 샘플 JSON, 그 밖의 HTTP 오류는 그대로 전파"""
+    if isinstance(exc, httpx.HTTPStatusError):
+        if exc.response.status_code == 404:
+            log.warning("🔄 Pipeline API 404 – 샘플 파일로 폴백: %s", _SAMPLE_FILE)
+            return _load_sample()
+        raise exc
+    log.warning("🔄 Pipeline API 연결 실패 – 샘플 파일 사용: %s", exc)
+    return _load_sample()
+
+
+def _body(text_stt: str, num_clusters: int, top_k: int, target_lang: str) -> Dict[str, Any]:
+    return {
+        "text_stt": text_stt,
+        "num_clusters": num_clusters,
+        "top_k": top_k,
+        "target_lang": target_lang,
+    }
+
 
 class PipelineClient(BaseClient):
     """
@@ -29,7 +72,10 @@ class PipelineClient(BaseClient):
 
     def __init__(self, base_url: str) -> None:
         # Pipeline API 는 인증 불필요
-        super().__init__(base_url, add_auth=False)
+        super().__init__(base_url, add_auth=False, http2=True)
+        self.upstream_calls = 0
+        self._inflight: Dict[_Key, "Future[Dict[str, Any]]"] = {}
+        self._lock = threading.Lock()
 
     # ------------------------------------------------------
     def run(
@@ -40,35 +86,67 @@ class PipelineClient(BaseClient):
         top_k: int,
         target_lang: str,
     ) -> Dict[str, Any]:
-        body: Dict[str, Any] = {
-            "text_stt": text_stt,
-            "num_clusters": num_clusters,
-            "top_k": top_k,
-            "target_lang": target_lang,
-        }
+        key: _Key = (text_stt, num_clusters, top_k, target_lang)
+        with self._lock:
+            fut = self._inflight.get(key)
+            leader = fut is None
+            if leader:
+                fut = self._inflight[key] = Future()
+        if not leader:
+            return fut.result()  # 진행 중인 동일 요청 결과 공유
+
+        try:
+            result = self._fetch(_body(*key))
+            fut.set_result(result)
+            return result
+        except BaseException as exc:
+            fut.set_exception(exc)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
 
+    def _fetch(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:  # 서로 다른 키의 리더 스레드가 동시에 올 수 있다
+            self.upstream_calls += 1
         try:
             return self._post("/pipeline-run", body)
 
         # ───────── 폴백: 로컬 샘플 JSON ─────────
-        except httpx.HTTPStatusError as exc:
-            if exc.response.status_code == 404:
-                log.warning(
-                    "🔄 Pipeline API 404 – 샘플 파일로 폴백: %s", _SAMPLE_FILE
-                )
-                return self._load_sample()
-            raise  # 다른 HTTP 오류는 그대로 전파
-
-        except (httpx.RequestError, httpx.TimeoutException) as exc:
-            log.warning("🔄 Pipeline API 연결 실패 – 샘플 파일 사용: %s", exc)
-            return self._load_sample()
+        except (httpx.HTTPStatusError, httpx.RequestError, httpx.TimeoutException) as exc:
+            return _fallback(exc)
+
+
+
+class AsyncPipelineClient(AsyncBaseClient):
+    """PipelineClient 의 비동기 버전 (HTTP/2 keep-alive 커넥션 풀 공유)"""
+
+    def __init__(self, base_url: str) -> None:
+        super().__init__(base_url, add_auth=False, http2=True)
+        self.upstream_calls = 0
+        self._inflight: Dict[_Key, "asyncio.Task[Dict[str, Any]]"] = {}
 
     # ------------------------------------------------------
-    @staticmethod
-    def _load_sample() -> Dict[str, Any]:
-        if not _SAMPLE_FILE.exists():
-            raise FileNotFoundError(
-                f"Sample file not found: {_SAMPLE_FILE}. "
-                "테스트용 sample_pipeline.json 을 준비하세요."
-            )
-        return json.loads(_SAMPLE_FILE.read_text(encoding="utf-8"))
+    async def run(
+        self,
+        *,
+        text_stt: str,
+        num_clusters: int,
+        top_k: int,
+        target_lang: str,
+    ) -> Dict[str, Any]:
+        key: _Key = (text_stt, num_clusters, top_k, target_lang)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(_body(*key)))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # 한 대기자가 취소돼도 공유 작업은 계속 진행
+        return await asyncio.shield(task)
+
+    async def _fetch(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        self.upstream_calls += 1  # 이벤트 루프 스레드에서만 증가
+        try:
+            return await self._post("/pipeline-run", body)
+        except (httpx.HTTPStatusError, httpx.RequestError, httpx.TimeoutException) as exc:
+            return _fallback(exc)
@@ -0,0 +1,288 @@
+"""
+src/api_clients/rate_limit.py
+────────────────────────────────────────────────────────────
+Gemini 호출 공용 흐름 제어
+
+· GeminiRateLimiter → RPM · TPM 토큰 버킷 2개 (모든 프로세서 · 클라이언트가 공유)
+                      ─ local : 프로세스마다 쿼터 ÷ GEMINI_QUOTA_SHARE (gunicorn 워커 수)
+                      ─ redis : RedisTokenBucket – 워커 · 레플리카가 버킷 하나를 나눠 쓴다
+· RetryPolicy       → 429 · 5xx · 전송 오류 재시도 (지수 백오프 + full jitter,
+                      Retry-After 헤더가 있으면 그 값을 우선)
+· Hedger            → (비동기 전용, 선택) 최근 p95 지연을 넘긴 요청에
+                      동일 요청을 한 번 더 보내 먼저 끝난 응답 사용 (사본도 쿼터를 차감)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Deque, Optional, TypeVar, Union
+
+import httpx
+
+from config.settings import get_settings
+from .redis_client import get_redis, rkey, use_redis
+
+T = TypeVar("T")
+
+_RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+# ----------------------------------------------------------- 토큰 버킷
+class TokenBucket:
+    """rate(개/초) 로 채워지고 capacity 까지 쌓이는 버킷 – 스레드 안전"""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, n: float) -> float:
+        """
+        n 개를 예약하고 기다려야 할 시간(초) 반환.
+        잔량이 음수가 되도록 미리 차감해 호출 순서대로 대기 시간이 늘어난다.
+        """
+        n = min(n, self.capacity)  # 버킷보다 큰 요청도 언젠가는 통과
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._stamp) * self.rate)
+            self._stamp = now
+            self._tokens -= n
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def pause(self, seconds: float) -> None:
+        """지금부터 seconds 초 동안 새 예약이 통과하지 못하도록 잔량을 깎는다"""
+        with self._lock:
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+
+# 잔량 · 갱신 시각을 해시 하나에 두고 TokenBucket.reserve / pause 와 같은 계산을 서버에서 원자적으로
+# ARGV = rate, capacity, n, floor('' = 없음) → 차감 후 잔량 (Lua 숫자는 정수로 잘리므로 문자열로 반환)
+_BUCKET_LUA = """
+local rate, cap, n = tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local v = redis.call('HMGET', KEYS[1], 'tokens', 'stamp')
+local tokens = tonumber(v[1]) or cap
+local stamp = tonumber(v[2]) or now
+tokens = math.min(cap, tokens + (now - stamp) * rate) - n
+if ARGV[4] ~= '' then tokens = math.min(tokens, tonumber(ARGV[4])) end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'stamp', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil((cap - tokens) / rate * 1000) + 1000)
+return tostring(tokens)
+"""
+
+
+class RedisTokenBucket:
+    """
+    TokenBucket 과 같은 규약, 상태는 Redis (SHARED_BACKEND=redis)
+    · 시각은 Redis 서버 시계 기준 – 레플리카 간 시계 차이와 무관
+    · 예약마다 왕복 1회 → 비동기 경로는 스레드로 오프로드
+    """
+
+    def __init__(self, redis: Any, key: str, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._key = key
+        self._script = redis.register_script(_BUCKET_LUA)
+
+    def _eval(self, n: float, floor: str = "") -> float:
+        return float(self._script(keys=[self._key], args=[self.rate, self.capacity, n, floor]))
+
+    def reserve(self, n: float) -> float:
+        tokens = self._eval(min(n, self.capacity))
+        return 0.0 if tokens >= 0 else -tokens / self.rate
+
+    def pause(self, seconds: float) -> None:
+        self._eval(0, repr(-seconds * self.rate))
+
+
+Bucket = Union[TokenBucket, RedisTokenBucket]
+
+
+class GeminiRateLimiter:
+    """
+    분당 요청 수(rpm) · 분당 토큰 수(tpm) 쿼터. 0 이면 해당 제한 없음.
+    버스트는 burst 초 분량으로 제한해 쿼터 창 경계에서 429 가 몰리지 않게 한다.
+    (period 는 벤치마크에서 쿼터 창을 줄일 때만 바꾼다)
+    shared=True 면 버킷을 Redis 에 두어 모든 워커 · 레플리카가 쿼터 하나를 나눠 쓴다.
+    """
+
+    def __init__(
+        self, rpm: int, tpm: int, *, burst: float = 1.0, period: float = 60.0, shared: bool = False,
+    ) -> None:
+        self._rpm = self._bucket("rpm", rpm, burst, period, shared)
+        self._tpm = self._bucket("tpm", tpm, burst, period, shared)
+        self._blocking = shared
+
+    @staticmethod
+    def _bucket(name: str, quota: int, burst: float, period: float, shared: bool) -> Optional[Bucket]:
+        if not quota:
+            return None
+        rate = quota / period
+        if shared:
+            return RedisTokenBucket(get_redis(), rkey("ratelimit", name), rate, max(1.0, rate * burst))
+        return TokenBucket(rate, max(1.0, rate * burst))
+
+    def _reserve(self, tokens: int) -> float:
+        waits = [0.0]
+        if self._rpm:
+            waits.append(self._rpm.reserve(1))
+        if self._tpm:
+            waits.append(self._tpm.reserve(tokens))
+        return max(waits)
+
+    def throttled(self, exc: Exception, delay: float) -> bool:
+        """
+        서버 429 피드백 – 이후 호출 전체가 delay 동안 대기 (적응형 감속).
+        True 면 다음 acquire 가 대기를 대신하므로 호출자는 따로 sleep 하지 않는다.
+        """
+        if self._rpm is None or not (
+            isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code == 429
+        ):
+            return False
+        self._rpm.pause(delay)
+        return True
+
+    async def athrottled(self, exc: Exception, delay: float) -> bool:
+        """throttled 의 비동기 버전 (Redis 버킷이면 스레드에서)"""
+        if self._blocking:
+            return await asyncio.to_thread(self.throttled, exc, delay)
+        return self.throttled(exc, delay)
+
+    def acquire(self, tokens: int) -> None:
+        wait = self._reserve(tokens)
+        if wait:
+            time.sleep(wait)
+
+    async def aacquire(self, tokens: int) -> None:
+        wait = await asyncio.to_thread(self._reserve, tokens) if self._blocking else self._reserve(tokens)
+        if wait:
+            await asyncio.sleep(wait)
+
+
+def estimate_tokens(payload: dict) -> int:
+    """요청 바디 입력 토큰 근사치 (글자 4개 ≈ 1토큰)"""
+    chars = sum(
+        len(part.get("text", ""))
+        for content in payload.get("contents", [])
+        for part in content.get("parts", [])
+    )
+    return max(1, chars // 4)
+
+
+# ----------------------------------------------------------- 재시도
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After: 초 단위 숫자 또는 HTTP-date"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    def __init__(self, max_retries: int = 4, base: float = 1.0, cap: float = 30.0) -> None:
+        self.max_retries = max_retries
+        self.base = base
+        self.cap = cap
+
+    def next_delay(self, attempt: int, exc: Exception) -> Optional[float]:
+        """재시도할 오류면 대기 시간(초), 아니면 None (attempt 는 0부터)"""
+        if attempt >= self.max_retries:
+            return None
+        if isinstance(exc, httpx.HTTPStatusError):
+            if exc.response.status_code not in _RETRY_STATUS:
+                return None
+            retry_after = parse_retry_after(exc.response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, self.cap) + random.uniform(0, 0.1 * self.base)
+        elif not isinstance(exc, httpx.TransportError):
+            return None
+        return random.uniform(0, min(self.cap, self.base * 2 ** attempt))
+
+
+# ----------------------------------------------------------- 헤징
+class Hedger:
+    """
+    최근 성공 지연의 p95(샘플 부족 시 min_delay)를 넘기면
+    같은 요청을 한 번 더 보내고 먼저 끝난 결과를 쓴다.
+    """
+
+    def __init__(self, min_delay: float, window: int = 200) -> None:
+        self.min_delay = min_delay
+        self._samples: Deque[float] = deque(maxlen=window)
+        self.hedged = 0
+
+    @property
+    def threshold(self) -> float:
+        if len(self._samples) < 20:
+            return self.min_delay
+        ordered = sorted(self._samples)
+        return max(self.min_delay, ordered[int(len(ordered) * 0.95) - 1])
+
+    async def run(
+        self, call: Callable[[], Awaitable[T]], hedge: Optional[Callable[[], Awaitable[T]]] = None,
+    ) -> T:
+        """hedge = 사본 전송 (기본 call) – 호출자가 쿼터 차감을 넣어 보낸다"""
+        t0 = time.monotonic()
+        first = asyncio.ensure_future(call())
+        done, _ = await asyncio.wait({first}, timeout=self.threshold)
+        tasks = {first}
+        if not done:
+            self.hedged += 1
+            tasks.add(asyncio.ensure_future((hedge or call)()))
+        try:
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for t in done:
+                    if t.exception() is None:
+                        self._samples.append(time.monotonic() - t0)
+                        return t.result()
+                if not tasks:
+                    raise next(iter(done)).exception()  # type: ignore[misc]
+            raise RuntimeError("unreachable")
+        finally:
+            for t in tasks:
+                t.cancel()
+
+
+# ----------------------------------------------------------- 싱글턴
+@lru_cache
+def get_rate_limiter() -> GeminiRateLimiter:
+    """SHARED_BACKEND=redis 면 공유 버킷, 아니면 이 프로세스 몫(쿼터 ÷ GEMINI_QUOTA_SHARE)"""
+    cfg = get_settings()
+    if use_redis():
+        return GeminiRateLimiter(cfg.GEMINI_RPM, cfg.GEMINI_TPM, shared=True)
+    share = cfg.GEMINI_QUOTA_SHARE
+    # 0 은 '제한 없음' 이므로 나눈 몫이 0 이 되지 않게 최소 1
+    return GeminiRateLimiter(
+        cfg.GEMINI_RPM and max(1, cfg.GEMINI_RPM // share),
+        cfg.GEMINI_TPM and max(1, cfg.GEMINI_TPM // share),
+    )
+
+
+@lru_cache
+def get_retry_policy() -> RetryPolicy:
+    cfg = get_settings()
+    return RetryPolicy(cfg.LLM_MAX_RETRIES, cfg.LLM_BACKOFF_BASE, cfg.LLM_BACKOFF_MAX)
+
+
+@lru_cache
+def get_hedger() -> Optional[Hedger]:
+    cfg = get_settings()
+    return Hedger(cfg.LLM_HEDGE_MIN_DELAY) if cfg.LLM_HEDGE_ENABLED else None
@@ -0,0 +1,48 @@
+"""
+src/api_clients/redis_client.py
+────────────────────────────────────────────────────────────
+(선택) 워커 · 레플리카 간 공유 저장소용 Redis 연결 – SHARED_BACKEND=redis
+
+· get_redis → 프로세스 전역 연결 풀 1개 (REDIS_URL, Redis 프로토콜 호환 서버면 무엇이든)
+· rkey      → REDIS_PREFIX 를 붙인 키 (한 서버를 여러 배포가 나눠 써도 충돌 없음)
+· 각 저장소는 항목마다 TTL 만 걸고, 총 용량 제한은 서버의 maxmemory + allkeys-lru 정책에 맡긴다
+· redis 패키지는 SHARED_BACKEND=redis 일 때만 import
+"""
+
+from __future__ import annotations
+
+import logging
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from config.settings import get_settings
+
+if TYPE_CHECKING:  # pragma: no cover
+    import redis
+
+log = logging.getLogger(__name__)
+
+
+def use_redis() -> bool:
+    return get_settings().SHARED_BACKEND == "redis"
+
+
+def rkey(*parts: str) -> str:
+    return get_settings().REDIS_PREFIX + ":".join(parts)
+
+
+def ttl_ms(seconds: float) -> int | None:
+    """0 = 무제한 (SET px=None)"""
+    return int(seconds * 1000) if seconds > 0 else None
+
+
+@lru_cache
+def get_redis() -> "redis.Redis":
+    try:
+        import redis
+    except ImportError:  # pragma: no cover
+        raise RuntimeError("SHARED_BACKEND=redis 에는 redis 패키지가 필요합니다 (pip install redis)") from None
+    url = get_settings().REDIS_URL
+    client = redis.Redis.from_url(url, health_check_interval=30)
+    log.info("🔗 공유 저장소 → %s", url.rsplit("@", 1)[-1])  # 자격 증명은 로그에 남기지 않는다
+    return client
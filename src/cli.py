@@ -3,30 +3,159 @@ src/cli.py
 ────────────────────────────────────────────────────────────
 ⛳  커맨드라인 배치 실행:
     단일 Pipeline API → Gemini → HTML + PDF 보고서 저장
+
+· 단건  : --stt meeting.txt --out out/
+· 배치  : --batch <디렉터리 | manifest.jsonl> --out out/
+          ─ 디렉터리 : *.txt · *.jsonl(STT) / *.json(파이프라인 JSON)
+          ─ manifest : 한 줄당 {"stt": 경로} 또는 {"pipeline": 경로} (+ 선택 "id")
+          하나의 프로세스 · 공유 클라이언트 풀에서 --jobs 건을 동시에 처리하고
+          항목별 소요 시간을 요약 출력한다.
+          ─ --llm-batch-window 를 주면 항목들의 Gemini 요청을 창 단위로 모아 함께 전송
+            (대량 재생성 처리량 우선, LLM_BATCH_WINDOW)
 """
 
 from __future__ import annotations
 
 import argparse
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+from src import setup_logging
+from src.utils import iter_lines
+
 
-from src.service.report_service import generate_report
+class BatchItem(NamedTuple):
+    id: str
+    stt: Optional[Path] = None
+    pipeline: Optional[Path] = None
 
 
 def _args() -> argparse.Namespace:
     p = argparse.ArgumentParser("Generate meeting report (CLI)")
-    p.add_argument("--stt", required=True, help="STT 원문(.txt)")
+    src = p.add_mutually_exclusive_group(required=True)
+    src.add_argument("--stt", help="STT 원문(.txt)")
+    src.add_argument("--batch", help="배치 입력: 디렉터리 또는 manifest(.jsonl)")
     p.add_argument("--out", required=True, help="출력 디렉터리")
     p.add_argument("--clusters", type=int, default=5)
     p.add_argument("--topk", type=int, default=5)
+    p.add_argument("--jobs", type=int, default=4, help="동시에 처리할 배치 항목 수")
+    p.add_argument("--llm-concurrency", type=int, help="동시 Gemini 호출 상한 (LLM_CONCURRENCY)")
+    p.add_argument("--llm-batch-window", type=float,
+                   help="Gemini 요청을 모으는 창(초) – 배치 항목 간 요청 묶음 (LLM_BATCH_WINDOW)")
+    p.add_argument("--render-workers", type=int, help="PDF 렌더 프로세스 수 (PDF_WORKERS)")
+    p.add_argument("--mmap", action="store_true", help="JSONL STT 를 mmap 으로 읽기 (대용량 회의록)")
     return p.parse_args()
 
 
+# ---------------------------------------------------------------- 입력 수집
+def _read_stt(path: Path, use_mmap: bool = False) -> str:
+    if path.suffix.lower() == ".jsonl":
+        # 줄 리스트 사본 없이 바로 원문 문자열로 합친다
+        return "\n".join(iter_lines(path, use_mmap=use_mmap))
+    return path.read_text(encoding="utf-8")
+
+
+def _collect(batch: Path) -> List[BatchItem]:
+    if batch.is_dir():
+        items = []
+        for f in sorted(batch.iterdir()):
+            ext = f.suffix.lower()
+            if ext in (".txt", ".jsonl"):
+                items.append(BatchItem(f.stem, stt=f))
+            elif ext == ".json":
+                items.append(BatchItem(f.stem, pipeline=f))
+        return items
+
+    items = []
+    for n, line in enumerate(batch.read_text(encoding="utf-8").splitlines(), 1):
+        if not line.strip():
+            continue
+        obj = json.loads(line)
+        stt, pipe = obj.get("stt"), obj.get("pipeline")
+        if not (stt or pipe):
+            raise SystemExit(f"{batch}:{n} – 'stt' 또는 'pipeline' 키가 필요합니다.")
+        path = batch.parent / (stt or pipe)
+        items.append(BatchItem(
+            str(obj.get("id") or path.stem),
+            stt=path if stt else None,
+            pipeline=path if pipe else None,
+        ))
+    return items
+
+
+# ---------------------------------------------------------------- 실행
+def _run_one(item: BatchItem, out_root: Path, args: argparse.Namespace) -> Dict[str, Path]:
+    from src.models.schemas import PipelineRequest
+    from src.service.report_service import generate_report, generate_report_from_pipeline_json
+
+    out_dir = out_root / item.id
+    if item.pipeline is not None:
+        p = PipelineRequest.from_json_bytes(item.pipeline.read_bytes())
+        return generate_report_from_pipeline_json(p, out_dir)
+    return generate_report(
+        stt_text=_read_stt(item.stt, args.mmap),
+        out_dir=out_dir,
+        clusters=args.clusters,
+        top_k=args.topk,
+    )
+
+
+def _run_batch(items: List[BatchItem], out_root: Path, args: argparse.Namespace) -> int:
+    def timed(item: BatchItem):
+        t0 = time.perf_counter()
+        try:
+            paths = _run_one(item, out_root, args)
+            return item.id, "ok", time.perf_counter() - t0, str(paths["pdf"])
+        except Exception as exc:  # 한 건 실패가 전체 배치를 멈추지 않도록
+            return item.id, "FAIL", time.perf_counter() - t0, str(exc)
+
+    t_all = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(args.jobs, 1)) as pool:
+        rows = list(pool.map(timed, items))
+    elapsed = time.perf_counter() - t_all
+
+    width = max([len(r[0]) for r in rows] + [2])
+    print(f"{'id':<{width}}  status  seconds  output")
+    for rid, status, sec, detail in rows:
+        print(f"{rid:<{width}}  {status:<6}  {sec:7.2f}  {detail}")
+    failed = sum(r[1] != "ok" for r in rows)
+    print(f"── {len(rows)}건 / 실패 {failed}건 / 총 {elapsed:.2f}s "
+          f"({len(rows) / elapsed * 3600 if elapsed else 0:.0f} reports/h)")
+    return 1 if failed else 0
+
+
 def main() -> None:
     args = _args()
+    setup_logging()
+
+    # 설정은 report_service 최초 임포트 시 읽히므로 그 전에 덮어쓴다
+    if args.llm_batch_window:
+        os.environ["LLM_BATCH_WINDOW"] = str(args.llm_batch_window)
+        # 호출 스레드는 배치 결과를 기다리기만 하므로 항목 수만큼 요청을 넣을 수 있게 한다
+        if not args.llm_concurrency:
+            args.llm_concurrency = max(args.jobs, 1) * 3
+    if args.llm_concurrency:
+        os.environ["LLM_CONCURRENCY"] = str(args.llm_concurrency)
+    if args.render_workers is not None:
+        os.environ["PDF_WORKERS"] = str(args.render_workers)
+
+    out_dir = Path(args.out).resolve()
+    # 캐시(<OUT_DIR>/.cache)도 --out 아래에 두도록 – 환경 변수 OUT_DIR 을 직접 준 경우는 그대로
+    os.environ.setdefault("OUT_DIR", str(out_dir))
+
+    if args.batch:
+        items = _collect(Path(args.batch))
+        if not items:
+            raise SystemExit(f"배치 입력이 비어 있습니다: {args.batch}")
+        raise SystemExit(_run_batch(items, out_dir, args))
+
+    from src.service.report_service import generate_report
 
-    stt_text = Path(args.stt).read_text(encoding="utf-8")
-    out_dir  = Path(args.out).resolve()
+    stt_text = _read_stt(Path(args.stt), args.mmap)
 
     paths = generate_report(
         stt_text=stt_text,
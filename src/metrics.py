@@ -0,0 +1,253 @@
+"""
+src/metrics.py
+────────────────────────────────────────────────────────────
+단계별 지연 계측 + Prometheus 텍스트 노출 (외부 의존성 없음)
+
+· Counter / Gauge / Histogram → REGISTRY 에 등록, render() 로 text format 0.0.4 출력
+· span(stage)    → with 블록 소요 시간을 report_stage_seconds{stage} 에 기록
+· timed(stage)   → 동기 · 코루틴 함수용 span 데코레이터
+· server_timing  → 요청 단위 span 수집 (contextvar) → Server-Timing 헤더 문자열
+
+contextvar 는 asyncio 태스크에는 자동 전파되지만 executor 스레드에는 아니므로
+스레드로 넘길 때는 contextvars.copy_context().run 으로 감싸야 헤더에 포함된다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+F = TypeVar("F", bound=Callable)
+
+_DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _fmt(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labels):
+            raise ValueError(f"{self.name}: labels {sorted(labels)} != {list(self.labels)}")
+        return tuple(str(labels[k]) for k in self.labels)
+
+    def _label_str(self, key: Tuple[str, ...], extra: str = "") -> str:
+        pairs = [f'{k}="{_escape(v)}"' for k, v in zip(self.labels, key)]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self.samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()) -> None:
+        super().__init__(name, help, labels)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{self._label_str(k)} {_fmt(v)}" for k, v in items]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    @contextmanager
+    def track(self, **labels: str) -> Iterator[None]:
+        """블록 실행 중 +1 (in-flight 게이지)"""
+        self.inc(**labels)
+        try:
+            yield
+        finally:
+            self.dec(**labels)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = _DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, help, labels)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        self._values: Dict[Tuple[str, ...], List[float]] = {}  # [bucket counts..., sum]
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            row = self._values.setdefault(key, [0.0] * (len(self.buckets) + 1))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    row[i] += 1
+            row[-1] += value
+
+    def count(self, **labels: str) -> int:
+        row = self._values.get(self._key(labels))
+        return int(row[-2]) if row else 0
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((k, list(v)) for k, v in self._values.items())
+        lines = []
+        for key, row in items:
+            for bound, n in zip(self.buckets, row):
+                le = 'le="%s"' % _fmt(bound)
+                lines.append(f"{self.name}_bucket{self._label_str(key, le)} {_fmt(n)}")
+            lines.append(f"{self.name}_sum{self._label_str(key)} {_fmt(row[-1])}")
+            lines.append(f"{self.name}_count{self._label_str(key)} {_fmt(row[-2])}")
+        return lines
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        return "\n".join(m.render() for m in self._metrics.values()) + "\n"
+
+
+REGISTRY = Registry()
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def counter(name: str, help: str, labels: Sequence[str] = ()) -> Counter:
+    return REGISTRY.register(Counter(name, help, labels))  # type: ignore[return-value]
+
+
+def gauge(name: str, help: str, labels: Sequence[str] = ()) -> Gauge:
+    return REGISTRY.register(Gauge(name, help, labels))  # type: ignore[return-value]
+
+
+def histogram(name: str, help: str, labels: Sequence[str] = (),
+              buckets: Sequence[float] = _DEFAULT_BUCKETS) -> Histogram:
+    return REGISTRY.register(Histogram(name, help, labels, buckets))  # type: ignore[return-value]
+
+
+# ───────── 공용 메트릭 ─────────
+STAGE_SECONDS = histogram("report_stage_seconds", "보고서 생성 단계별 소요 시간(초)", ["stage"])
+IN_FLIGHT = gauge("report_in_flight", "진행 중인 작업 수", ["kind"])
+GEMINI_REQUESTS = counter("gemini_requests_total", "Gemini HTTP 시도 수", ["outcome"])
+GEMINI_TOKENS = counter("gemini_tokens_total", "usageMetadata 기준 Gemini 토큰 수", ["kind"])
+CACHE_REQUESTS = counter("cache_requests_total", "캐시 조회 수", ["cache", "result"])
+GEMINI_BATCH_SIZE = histogram("gemini_batch_size", "배치당 Gemini 요청 수 (requests = 모인 요청, sent = 중복 제거 후 전송)",
+                              ["kind"], buckets=(1, 2, 4, 8, 16, 32, 64, 128))
+JOBS = gauge("report_jobs", "작업 큐 상태별 작업 수", ["status"])
+HTTP_REQUESTS = counter("http_requests_total", "HTTP 요청 수", ["method", "path", "status"])
+SCHED_QUEUED = gauge("scheduler_queued", "스케줄러 대기 요청 수", ["resource", "priority"])
+SCHED_WAIT = histogram("scheduler_wait_seconds", "스케줄러 슬롯 대기 시간(초)", ["resource", "priority"])
+SCHED_DROPPED = counter("scheduler_dropped_total", "마감 초과로 폐기된 요청 수", ["resource", "priority"])
+
+
+# ───────── 단계 span · Server-Timing ─────────
+_timings: contextvars.ContextVar[Optional[List[Tuple[str, float]]]] = contextvars.ContextVar(
+    "server_timing", default=None
+)
+
+
+@contextmanager
+def span(stage: str) -> Iterator[None]:
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - t0
+        STAGE_SECONDS.observe(elapsed, stage=stage)
+        bucket = _timings.get()
+        if bucket is not None:
+            bucket.append((stage, elapsed))
+
+
+def timed(stage: str) -> Callable[[F], F]:
+    """span 데코레이터 – 코루틴 함수면 await 구간까지 측정"""
+
+    def deco(fn: F) -> F:
+        if asyncio.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def awrapper(*args, **kwargs):
+                with span(stage):
+                    return await fn(*args, **kwargs)
+            return awrapper  # type: ignore[return-value]
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(stage):
+                return fn(*args, **kwargs)
+        return wrapper  # type: ignore[return-value]
+
+    return deco
+
+
+@contextmanager
+def server_timing() -> Iterator[List[Tuple[str, float]]]:
+    """요청 범위에서 span 을 모은다 (같은 stage 는 합산해 헤더에 기록)"""
+    bucket: List[Tuple[str, float]] = []
+    token = _timings.set(bucket)
+    try:
+        yield bucket
+    finally:
+        _timings.reset(token)
+
+
+def format_server_timing(bucket: List[Tuple[str, float]]) -> str:
+    totals: Dict[str, float] = {}
+    for stage, elapsed in bucket:
+        totals[stage] = totals.get(stage, 0.0) + elapsed
+    return ", ".join(f"{stage};dur={sec * 1000:.1f}" for stage, sec in totals.items())
+
+
+def render() -> str:
+    return REGISTRY.render()
@@ -5,3 +5,25 @@ class Role(StrEnum):
     """LLM Chat 메시지 역할 Enum."""
     SYSTEM = "system"
     USER = "user"
+
+
+class JobStatus(StrEnum):
+    """비동기 보고서 작업 상태 Enum."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class ReportFormat(StrEnum):
+    """보고서 출력 형식 Enum (report_builder.FORMATS 의 키)."""
+    JSON = "json"
+    MD = "md"
+    HTML = "html"
+    PDF = "pdf"
+
+
+class Priority(StrEnum):
+    """스케줄러 우선순위 클래스 (X-Priority 헤더 값)."""
+    INTERACTIVE = "interactive"
+    BATCH = "batch"
@@ -8,14 +8,27 @@ src/models/schemas.py
      ─ 숫자·문자 혼재 자료 수용, 422 오류 해결
   2. Pydantic v2 양식 적용 (model_config = ConfigDict …)
   3. 서버용 요청 모델 `PipelineRequest` 추가
+  4. 비동기 작업 API 응답 모델 `JobInfo` 추가
+  5. PipelineResponse 검증 직후 출처 + page_content 기준 문서 중복 제거 (최고 점수 유지)
+     ─ all_documents 내 중복 삭제, chunks[].related_docs 의 동일 문서는 같은 인스턴스 공유
+  6. PipelineRequest.from_json_bytes – raw 본문 fast-path 파싱 (orjson 선택 사용)
+  7. ReportSchema.input_hashes – LLM 섹션별 입력 해시 (증분 재생성 판단용)
+  8. STT 원문 요청 모델 `SttRequest` (POST /report-stt – 서버가 Pipeline API 를 호출)
 """
 
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, ConfigDict, Field, StrictStr
+from pydantic import BaseModel, ConfigDict, Field, StrictStr, model_validator
+
+from src.models.enums import JobStatus
+
+try:  # 선택 의존성 – 없으면 pydantic 내장 JSON 파서 사용
+    import orjson as _orjson
+except ImportError:  # pragma: no cover
+    _orjson = None
 
 
 # ────────────────────────────── 검색 결과 · 문서 ─────────────────────────────
@@ -45,6 +58,40 @@ class ChunkDoc(BaseModel):
     model_config = ConfigDict(extra="allow")
 
 
+_DocKey = Tuple[str, str]
+
+
+def _doc_key(doc: SearchDoc) -> _DocKey:
+    """(출처, 본문) – 출처는 metadata 의 doc_id → doc_name → source 중 처음 있는 값"""
+    meta = doc.metadata
+    source = meta.get("doc_id") or meta.get("doc_name") or meta.get("source") or ""
+    return str(source), doc.page_content
+
+
+def _unique_docs(docs: List[SearchDoc], canon: Dict[_DocKey, SearchDoc]) -> List[SearchDoc]:
+    """
+    목록 안에서 출처 · page_content 가 같은 문서는 점수가 가장 높은 것만 첫 등장 위치에 남기고,
+    다른 목록에 이미 나온 동일 문서(모든 필드 일치)는 그 인스턴스로 대체
+    """
+    out: List[SearchDoc] = []
+    keys: List[_DocKey] = []
+    pos: Dict[_DocKey, int] = {}
+    for doc in docs:
+        key = _doc_key(doc)
+        i = pos.get(key)
+        if i is None:
+            pos[key] = len(out)
+            out.append(doc)
+            keys.append(key)
+        elif doc.score > out[i].score:
+            out[i] = doc
+    for i, key in enumerate(keys):
+        first = canon.setdefault(key, out[i])
+        if first is not out[i] and first == out[i]:
+            out[i] = first
+    return out
+
+
 # ────────────────────────────── 파이프라인 원본 구조 ─────────────────────────
 class MeetingMeta(BaseModel):
     title: StrictStr
@@ -74,12 +121,44 @@ class PipelineResponse(BaseModel):
 
     model_config = ConfigDict(extra="allow")
 
+    @model_validator(mode="after")
+    def _dedup_documents(self) -> "PipelineResponse":
+        # 허브가 같은 SearchDoc 을 여러 번 실어 보내는 경우가 많다
+        canon: Dict[_DocKey, SearchDoc] = {}
+        self.all_documents = _unique_docs(self.all_documents, canon)
+        for chunk in self.chunks:
+            chunk.related_docs = _unique_docs(chunk.related_docs, canon)
+        return self
+
 
 # FastAPI 요청 본문 검증용 별칭 (현재 구조가 동일해 그대로 상속)
 class PipelineRequest(PipelineResponse):
     """POST /report-json 요청 바디"""
 
-    pass
+    @classmethod
+    def from_json_bytes(cls, body: bytes) -> "PipelineRequest":
+        """
+        raw 본문 → 모델 (stdlib json 경유 없이)
+        큰 본문에서는 orjson 파싱 + model_validate 가 model_validate_json 보다 빠르다.
+        JSON 문법 오류는 model_validate_json 으로 넘겨 표준 ValidationError 로 만든다.
+        """
+        if _orjson is not None:
+            try:
+                data = _orjson.loads(body)
+            except _orjson.JSONDecodeError:
+                pass
+            else:
+                return cls.model_validate(data)
+        return cls.model_validate_json(body)
+
+
+class SttRequest(BaseModel):
+    """POST /report-stt 요청 바디 – Pipeline API(/pipeline-run) 입력과 같은 이름"""
+
+    text_stt: StrictStr = Field(min_length=1)
+    num_clusters: int = Field(default=5, ge=1)
+    top_k: int = Field(default=5, ge=1)
+    target_lang: StrictStr = "ko"
 
 
 # ────────────────────────────── ReportBuilder 입력 ──────────────────────────
@@ -97,4 +176,20 @@ class ReportSchema(BaseModel):
     risks: List[StrictStr]
     appendix: List[StrictStr]
 
+    # 섹션명(summary · actions · analysis) → 해당 섹션을 만든 입력의 해시
+    input_hashes: Dict[str, str] = Field(default_factory=dict)
+
     model_config = ConfigDict(extra="allow")
+
+
+# ────────────────────────────── 비동기 작업 API ─────────────────────────────
+class JobInfo(BaseModel):
+    """POST /reports · GET /reports/{id} 응답 바디"""
+
+    id: StrictStr
+    status: JobStatus
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+    links: Dict[str, str] = Field(default_factory=dict)
@@ -1,5 +1,8 @@
-from typing import List
+import asyncio
+from typing import Any, Dict, List, Optional
 from src.api_clients.llm_client import LLMClient
+from src.processors.map_reduce import amap_reduce, map_reduce
+from src.metrics import timed
 
 class ActionProcessor:
     """회의에서 결정된 Action Item 한국어 추출"""
@@ -8,15 +11,56 @@ class ActionProcessor:
         "아래 회의 기록(영어)에서 실행해야 할 구체적 Action Item을 한국어 bullet 리스트로 뽑아주세요. "
         "• 형태의 글머리표만 사용하고, 각 항목은 간결한 명령문으로 작성하세요."
     )
+    # 긴 회의록 map-reduce 용 (map 은 SYS 그대로 사용)
+    SYS_REDUCE = (
+        "아래는 한 회의를 구간별로 나눠 추출한 한국어 Action Item 목록들입니다. "
+        "중복·유사 항목을 하나로 합쳐 최종 Action Item을 한국어 bullet 리스트로 정리하세요. "
+        "• 형태의 글머리표만 사용하고, 각 항목은 간결한 명령문으로 작성하세요."
+    )
 
     def __init__(self, client: LLMClient) -> None:
         self.client = client
 
-    def run(self, text_en: str) -> List[str]:
-        bullets = self.client.generate(
+    def _request(self, text_en: str) -> Dict[str, Any]:
+        return dict(
             system_prompt=self.SYS,
             user_prompt=text_en,
             max_tokens=256,
             temperature=0.2,
         )
+
+    @staticmethod
+    def _parse(bullets: str) -> List[str]:
         return [b.lstrip("• ").strip() for b in bullets.splitlines() if b.strip()]
+
+    @timed("llm.actions")
+    def run(self, text_en: str) -> List[str]:
+        return self._parse(self.client.generate(**self._request(text_en)))
+
+    @timed("llm.actions")
+    async def arun(self, text_en: str) -> List[str]:
+        """AsyncGeminiClient 용 비동기 버전"""
+        return self._parse(await self.client.generate(**self._request(text_en)))
+
+    # ---------------------------------------------------------------- map-reduce
+    def _chunk_kwargs(self, fanout: int, group_chars: int) -> Dict[str, Any]:
+        return dict(
+            map_request=self._request,
+            reduce_request=lambda g: dict(self._request(g), system_prompt=self.SYS_REDUCE),
+            fanout=fanout,
+            group_chars=group_chars,
+        )
+
+    @timed("llm.actions")
+    def run_chunks(self, chunks: List[str], *, fanout: int, group_chars: int) -> List[str]:
+        """청크별 추출(map) → 중복 병합(reduce)"""
+        return self._parse(
+            map_reduce(self.client, chunks, **self._chunk_kwargs(fanout, group_chars))
+        )
+
+    @timed("llm.actions")
+    async def arun_chunks(self, chunks: List[str], *, fanout: int, group_chars: int,
+                          sem: Optional[asyncio.Semaphore] = None) -> List[str]:
+        return self._parse(
+            await amap_reduce(self.client, chunks, **self._chunk_kwargs(fanout, group_chars), sem=sem)
+        )
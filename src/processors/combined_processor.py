@@ -0,0 +1,91 @@
+import json
+from typing import Any, Dict, Sequence
+from src.api_clients.llm_client import LLMClient
+from src.models.schemas import SearchDoc
+from src.processors.integrated_analysis_processor import IntegratedAnalysisProcessor
+from src.metrics import timed
+
+class CombinedReportProcessor:
+    """
+    요약 · 액션 · 결정 · 리스크 · 통합 분석을 Gemini 1회 호출(JSON 구조화 출력)로 생성.
+    회의 원문을 세 번 보내던 분리 호출 대비 입력 토큰 · prefill 지연이 1/3 수준.
+    응답 JSON 파싱 · 검증 실패 시 ValueError → 호출 측이 분리 경로로 폴백.
+    (그 응답은 캐시에서 지운다 – 같은 입력으로 다시 호출하면 새로 생성)
+    """
+
+    SYS = (
+        "당신은 전문 비즈니스 회의 분석가입니다. 영어 회의 원문과 관련 사내 문서를 읽고 "
+        "모든 결과를 한국어로 작성해 지정된 JSON 스키마로만 응답하세요.\n"
+        "- executive_summary: 회의 핵심 요약 3~5문장\n"
+        "- action_items: 실행해야 할 구체적 Action Item (간결한 명령문)\n"
+        "- decisions: 회의에서 확정된 결정 사항\n"
+        "- risks: 언급된 리스크 · 우려 사항\n"
+        "- analysis: 회의와 문서를 종합한 통합 분석 5줄 이내"
+    )
+
+    RESPONSE_SCHEMA: Dict[str, Any] = {
+        "type": "OBJECT",
+        "properties": {
+            "executive_summary": {"type": "STRING"},
+            "action_items": {"type": "ARRAY", "items": {"type": "STRING"}},
+            "decisions": {"type": "ARRAY", "items": {"type": "STRING"}},
+            "risks": {"type": "ARRAY", "items": {"type": "STRING"}},
+            "analysis": {"type": "STRING"},
+        },
+        "required": ["executive_summary", "action_items", "decisions", "risks", "analysis"],
+    }
+
+    def __init__(self, client: LLMClient) -> None:
+        self.client = client
+
+    def _request(self, meeting_text_en: str, docs: Sequence[SearchDoc]) -> Dict[str, Any]:
+        snippets = IntegratedAnalysisProcessor.doc_snippets(docs)
+        user = f"## 회의 원문\n{meeting_text_en}\n\n## 문서\n{snippets}"
+        return dict(
+            system_prompt=self.SYS,
+            user_prompt=user,
+            max_tokens=1536,
+            temperature=0.25,
+            response_mime_type="application/json",
+            response_schema=self.RESPONSE_SCHEMA,
+        )
+
+    @staticmethod
+    def _parse(raw: str) -> Dict[str, Any]:
+        """
+        JSON 응답 → {"summary", "actions", "decisions", "risks", "analysis"}
+        (report_service 의 분리 경로 결과와 같은 키)
+        """
+        try:
+            data = json.loads(raw)
+            sections = {
+                "summary": str(data["executive_summary"]).strip(),
+                "actions": [str(a).lstrip("• ").strip() for a in data["action_items"]],
+                "decisions": [str(d).strip() for d in data["decisions"]],
+                "risks": [str(r).strip() for r in data["risks"]],
+                "analysis": str(data["analysis"]).strip(),
+            }
+        except (json.JSONDecodeError, KeyError, TypeError) as exc:
+            raise ValueError(f"구조화 응답 파싱 실패: {exc}") from exc
+        if not sections["summary"]:
+            raise ValueError("구조화 응답에 executive_summary 가 비어 있습니다.")
+        return sections
+
+    @timed("llm.combined")
+    def run(self, meeting_text_en: str, docs: Sequence[SearchDoc]) -> Dict[str, Any]:
+        req = self._request(meeting_text_en, docs)
+        try:
+            return self._parse(self.client.generate(**req))
+        except ValueError:
+            self.client.forget(**req)
+            raise
+
+    @timed("llm.combined")
+    async def arun(self, meeting_text_en: str, docs: Sequence[SearchDoc]) -> Dict[str, Any]:
+        """AsyncGeminiClient 용 비동기 버전"""
+        req = self._request(meeting_text_en, docs)
+        try:
+            return self._parse(await self.client.generate(**req))
+        except ValueError:
+            await self.client.forget(**req)
+            raise
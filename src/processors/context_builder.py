@@ -0,0 +1,147 @@
+"""
+src/processors/context_builder.py
+────────────────────────────────────────────────────────────
+통합 분석 · 구조화 호출 프롬프트의 '관련 문서' 컨텍스트 구성
+
+1) 후보 = all_documents + chunks[].related_docs
+2) MMR 순위 – λ·정규화 점수 − (1−λ)·max(기존 선택과의 유사도, 청크 중복도)
+   ─ 유사도는 단어 3-shingle 지문의 Jaccard, 아직 근거가 없는 회의 청크의 문서가 먼저 뽑힌다
+   ─ 뽑힌 문서와 거의 같은 문서(Jaccard ≥ dup_threshold)는 후보에서 제거
+3) 토큰 예산(CONTEXT_TOKEN_BUDGET) 안에서 발췌를 순서대로 채움
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Sequence, Set
+
+from config.settings import get_settings
+from src.models.schemas import PipelineResponse, SearchDoc
+from src.utils import approx_tokens
+
+_SHINGLE = 3
+_FINGERPRINT_WORDS = 200  # 지문은 앞부분 단어만으로 계산 (비용 상한)
+_MIN_SNIPPET_TOKENS = 40  # 남은 예산이 이보다 작으면 잘라 넣지 않는다
+
+
+def fingerprint(text: str) -> FrozenSet[int]:
+    """단어 3-shingle 해시 집합 (프로세스 내 비교 전용 – hash 는 실행마다 달라진다)"""
+    words = text.lower().split()[:_FINGERPRINT_WORDS]
+    if len(words) < _SHINGLE:
+        return frozenset({hash(tuple(words))})
+    return frozenset(map(hash, zip(words, words[1:], words[2:])))
+
+
+def jaccard(a: FrozenSet[int], b: FrozenSet[int]) -> float:
+    if not a or not b:
+        return 0.0
+    inter = len(a & b)
+    return inter / (len(a) + len(b) - inter)
+
+
+@dataclass
+class _Candidate:
+    doc: SearchDoc
+    fp: FrozenSet[int]
+    chunks: Set[int] = field(default_factory=set)  # 이 문서가 related_docs 로 붙은 청크 번호
+
+
+class ContextBuilder:
+    def __init__(
+        self,
+        *,
+        token_budget: int,
+        mmr_lambda: float = 0.7,
+        dup_threshold: float = 0.85,
+        snippet_chars: int = 800,
+    ) -> None:
+        self.token_budget = token_budget
+        self.mmr_lambda = mmr_lambda
+        self.dup_threshold = dup_threshold
+        self.snippet_chars = snippet_chars
+
+    # ---------------------------------------------------------------- 후보
+    def _candidates(self, p: PipelineResponse) -> List[_Candidate]:
+        """page_content 가 같은 문서는 하나로 합치고 붙어 있던 청크 번호를 모은다"""
+        by_content: Dict[str, _Candidate] = {}
+        sources = [(-1, p.all_documents)] + [(i, c.related_docs) for i, c in enumerate(p.chunks)]
+        for chunk_idx, docs in sources:
+            for doc in docs:
+                cand = by_content.get(doc.page_content)
+                if cand is None:
+                    cand = by_content[doc.page_content] = _Candidate(doc, fingerprint(doc.page_content))
+                elif doc.score > cand.doc.score:
+                    cand.doc = doc
+                if chunk_idx >= 0:
+                    cand.chunks.add(chunk_idx)
+        return list(by_content.values())
+
+    # ---------------------------------------------------------------- MMR
+    def select(self, p: PipelineResponse) -> List[SearchDoc]:
+        """
+        관련도 · 다양성 순으로 문서를 고른다 (발췌 합이 token_budget 을 채우면 중단).
+        뽑힌 문서와 거의 같은 후보(Jaccard ≥ dup_threshold)는 그 자리에서 제외
+        → 후보 쌍 전체 비교 없이 선택 라운드 × 후보 수 만큼만 지문을 비교한다.
+        """
+        pool = self._candidates(p)
+        if not pool:
+            return []
+        lo = min(c.doc.score for c in pool)
+        hi = max(c.doc.score for c in pool)
+        span = hi - lo or 1.0
+
+        chosen: List[SearchDoc] = []
+        covered: Set[int] = set()
+        max_sim = [0.0] * len(pool)  # 선택된 문서와의 최대 유사도 – 새로 뽑힌 문서만 반영해 갱신
+        used = 0
+        while pool and used < self.token_budget:
+            def mmr(i: int) -> float:
+                c = pool[i]
+                rel = (c.doc.score - lo) / span
+                redundant = len(c.chunks & covered) / len(c.chunks) if c.chunks else 0.0
+                return self.mmr_lambda * rel - (1 - self.mmr_lambda) * max(max_sim[i], redundant)
+
+            best = pool.pop(i := max(range(len(pool)), key=mmr))
+            del max_sim[i]
+            chosen.append(best.doc)
+            used += approx_tokens(best.doc.page_content[: self.snippet_chars])
+
+            rest: List[_Candidate] = []
+            sims: List[float] = []
+            for c, s in zip(pool, max_sim):
+                sim = jaccard(c.fp, best.fp)
+                if sim >= self.dup_threshold:
+                    best.chunks |= c.chunks  # 거의-복제본이 붙어 있던 청크도 이미 근거가 있음
+                    continue
+                rest.append(c)
+                sims.append(max(s, sim))
+            pool, max_sim = rest, sims
+            covered |= best.chunks
+        return chosen
+
+    # ---------------------------------------------------------------- 예산 채우기
+    def pack(self, docs: Sequence[SearchDoc]) -> str:
+        """순서대로 발췌를 넣되 token_budget 을 넘기지 않는다"""
+        parts: List[str] = []
+        left = self.token_budget
+        for doc in docs:
+            snippet = doc.page_content[: self.snippet_chars].strip()
+            cost = approx_tokens(snippet)
+            if cost > left:
+                if left < _MIN_SNIPPET_TOKENS:
+                    break
+                snippet = snippet[: left * 4].rsplit(" ", 1)[0]
+                cost = approx_tokens(snippet)
+            parts.append(snippet)
+            left -= cost
+        return "\n\n".join(parts)
+
+    def build(self, p: PipelineResponse) -> str:
+        return self.pack(self.select(p))
+
+
+@lru_cache
+def get_context_builder() -> ContextBuilder:
+    cfg = get_settings()
+    return ContextBuilder(token_budget=cfg.CONTEXT_TOKEN_BUDGET, mmr_lambda=cfg.CONTEXT_MMR_LAMBDA)
@@ -1,5 +1,8 @@
-from typing import List, Dict, Any
+from typing import Any, Dict, Sequence
 from src.api_clients.llm_client import LLMClient
+from src.metrics import timed
+from src.processors.context_builder import get_context_builder
+from src.models.schemas import SearchDoc
 
 class IntegratedAnalysisProcessor:
     """회의·문서를 종합한 한국어 인사이트"""
@@ -8,16 +11,40 @@ class IntegratedAnalysisProcessor:
         "다음 두 가지 정보를 모두 고려하여 한국어로 5줄 이내로 통합 분석을 작성하세요.\n"
         "1) 회의 영어 원문\n2) 관련 사내 문서(콘텍스트)"
     )
+    # 긴 회의록(map-reduce) – 원문 대신 통합 요약을 입력으로 (입력 상한 · 지연을 원문 길이와 무관하게)
+    SYS_SUMMARY = (
+        "다음 두 가지 정보를 모두 고려하여 한국어로 5줄 이내로 통합 분석을 작성하세요.\n"
+        "1) 회의 내용 요약(한국어)\n2) 관련 사내 문서(콘텍스트)"
+    )
 
     def __init__(self, client: LLMClient) -> None:
         self.client = client
 
-    def run(self, meeting_text_en: str, docs: List[Dict[str, Any]]) -> str:
-        doc_snippets = "\n\n".join(d["page_content"][:800] for d in docs[:10])
-        user = f"## 회의 원문\n{meeting_text_en}\n\n## 문서\n{doc_snippets}"
-        return self.client.generate(
-            system_prompt=self.SYS,
+    @staticmethod
+    def doc_snippets(docs: Sequence[SearchDoc]) -> str:
+        """
+        프롬프트에 넣을 문서 발췌 (CombinedReportProcessor 와 공유)
+        docs 순서대로 CONTEXT_TOKEN_BUDGET 까지 채운다 – 순위는 ContextBuilder.select
+        """
+        return get_context_builder().pack(docs)
+
+    def _request(self, meeting_text_en: str, docs: Sequence[SearchDoc],
+                 summarized: bool = False) -> Dict[str, Any]:
+        head = "회의 요약" if summarized else "회의 원문"
+        user = f"## {head}\n{meeting_text_en}\n\n## 문서\n{self.doc_snippets(docs)}"
+        return dict(
+            system_prompt=self.SYS_SUMMARY if summarized else self.SYS,
             user_prompt=user,
             max_tokens=512,
             temperature=0.25,
         )
+
+    @timed("llm.analysis")
+    def run(self, meeting_text_en: str, docs: Sequence[SearchDoc], *, summarized: bool = False) -> str:
+        """summarized=True → meeting_text_en 자리에 map-reduce 통합 요약"""
+        return self.client.generate(**self._request(meeting_text_en, docs, summarized))
+
+    @timed("llm.analysis")
+    async def arun(self, meeting_text_en: str, docs: Sequence[SearchDoc], *, summarized: bool = False) -> str:
+        """AsyncGeminiClient 용 비동기 버전"""
+        return await self.client.generate(**self._request(meeting_text_en, docs, summarized))
@@ -0,0 +1,83 @@
+"""
+src/processors/map_reduce.py
+────────────────────────────────────────────────────────────
+긴 회의록용 map-reduce 실행기
+
+· map    : 청크별 Gemini 호출을 fanout 개까지 병렬 실행
+· reduce : 부분 결과를 group_chars 이하 묶음으로 나눠 병렬 병합,
+           결과가 하나가 될 때까지 반복 (트리 reduce)
+  → 회의록 길이가 늘어도 지연은 대략 log(청크 수) 단계로 유지
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+Request = Callable[[str], Dict[str, Any]]
+
+
+def _groups(parts: List[str], group_chars: int) -> List[str]:
+    """부분 결과를 group_chars 기준으로 묶어 reduce 입력 목록 생성"""
+    groups: List[str] = []
+    buf: List[str] = []
+    size = 0
+    for part in parts:
+        if size + len(part) > group_chars and buf:
+            groups.append("\n\n".join(buf))
+            buf, size = [], 0
+        buf.append(part)
+        size += len(part)
+    if buf:
+        groups.append("\n\n".join(buf))
+    return groups
+
+
+def map_reduce(
+    client: Any,
+    chunks: Iterable[str],
+    *,
+    map_request: Request,
+    reduce_request: Request,
+    fanout: int,
+    group_chars: int,
+) -> str:
+    """동기 클라이언트(GeminiClient) 버전"""
+    def call(build: Request, text: str) -> str:
+        return client.generate(**build(text))
+
+    with ThreadPoolExecutor(max_workers=fanout, thread_name_prefix="map") as pool:
+        parts = list(pool.map(lambda c: call(map_request, c), chunks))
+        while len(parts) > 1:
+            groups = _groups(parts, group_chars)
+            if len(groups) == len(parts) and len(parts) > 1:
+                groups = ["\n\n".join(parts)]  # 더 묶이지 않으면 한 번에 병합
+            parts = list(pool.map(lambda g: call(reduce_request, g), groups))
+    return parts[0]
+
+
+async def amap_reduce(
+    client: Any,
+    chunks: Iterable[str],
+    *,
+    map_request: Request,
+    reduce_request: Request,
+    fanout: int,
+    group_chars: int,
+    sem: Optional[asyncio.Semaphore] = None,
+) -> str:
+    """비동기 클라이언트(AsyncGeminiClient) 버전 – sem 을 주면 여러 map-reduce 가 fanout 을 나눠 쓴다"""
+    sem = sem or asyncio.Semaphore(fanout)
+
+    async def call(build: Request, text: str) -> str:
+        async with sem:
+            return await client.generate(**build(text))
+
+    parts = list(await asyncio.gather(*(call(map_request, c) for c in chunks)))
+    while len(parts) > 1:
+        groups = _groups(parts, group_chars)
+        if len(groups) == len(parts) and len(parts) > 1:
+            groups = ["\n\n".join(parts)]
+        parts = list(await asyncio.gather(*(call(reduce_request, g) for g in groups)))
+    return parts[0]
@@ -0,0 +1,193 @@
+"""
+src/processors/pdf_renderer.py
+────────────────────────────────────────────────────────────
+WeasyPrint PDF 렌더 전용 프로세스 풀
+
+· write_pdf 는 CPU 바운드 + GIL 점유 → 요청 처리 프로세스와 분리
+· 워커는 기동 시 한 번만 폰트(fontconfig · Noto CJK)와 스타일시트(STYLESHEET)를 로드
+  하고 더미 렌더로 예열해 둔다 (PDF_WORKERS 개)
+· 대기열 상한(PDF_QUEUE_SIZE)을 넘으면 submit 이 빈자리를 기다린다
+· PDF_WORKERS=0 → 프로세스 풀 없이 현재 프로세스에서 렌더
+· 워커가 비정상 종료해 풀이 깨지면(BrokenProcessPool) 풀을 새로 띄우고 그 렌더를 1회 재시도
+· weasyprint 는 렌더하는 프로세스에서 처음 필요할 때만 임포트 (모듈 임포트 비용 없음)
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing as mp
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Optional
+
+from config.settings import get_settings
+
+log = logging.getLogger(__name__)
+
+# 보고서 스타일시트 (template_dir 기준) – PDF 로 보낼 HTML 에는 <style> 을 넣지 않는다
+STYLESHEET = "report_template.css"
+_WARMUP_HTML = (
+    '<meta charset="UTF-8">'
+    '<p style="font-family: \'Noto Sans CJK KR\', sans-serif">회의록 warm-up</p>'
+)
+
+# ───────── 프로세스별 상태 (워커 initializer 가 채움) ─────────
+_font_config: Any = None
+_stylesheets: list[Any] = []
+
+
+def _init_worker() -> None:
+    """폰트 설정 · 스타일시트 1회 로드 + 더미 렌더로 fontconfig 예열"""
+    global _font_config, _stylesheets
+    from weasyprint import CSS, HTML
+    from weasyprint.text.fonts import FontConfiguration
+
+    _font_config = FontConfiguration()
+    _stylesheets = [CSS(filename=str(stylesheet_path()), font_config=_font_config)]
+    HTML(string=_WARMUP_HTML).write_pdf(
+        stylesheets=_stylesheets, font_config=_font_config
+    )
+
+
+def stylesheet_path() -> Path:
+    return get_settings().template_dir / STYLESHEET
+
+
+def _render(html_str: str, base_url: str = ".") -> bytes:
+    """HTML 문자열 → PDF bytes (워커 프로세스에서 실행)"""
+    from weasyprint import HTML
+
+    if _font_config is None:
+        _init_worker()
+    return HTML(string=html_str, base_url=base_url).write_pdf(
+        stylesheets=_stylesheets, font_config=_font_config
+    )
+
+
+class PdfRenderPool:
+    """예열된 워커 프로세스에 PDF 렌더를 위임하는 풀"""
+
+    def __init__(self, workers: int, queue_size: int) -> None:
+        self.workers = workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # 실행 중 + 대기 중 작업 수 상한
+        self._slots = threading.BoundedSemaphore(max(workers, 1) + queue_size)
+        self._inline_lock = threading.Lock()
+        self._rebuild_lock = threading.Lock()
+
+        if workers > 0:
+            self._executor = self._spawn()
+            # 워커를 미리 띄워 첫 요청이 예열 비용을 내지 않게 한다
+            for f in [self._executor.submit(int) for _ in range(workers)]:
+                f.result()
+            log.info("🖨️  PDF 렌더 풀 기동 – 워커 %d개 (대기열 %d)", workers, queue_size)
+
+    def _spawn(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=mp.get_context("spawn"),
+            initializer=_init_worker,
+        )
+
+    def _replace(self, broken: ProcessPoolExecutor) -> ProcessPoolExecutor:
+        """
+        깨진 풀을 새 풀로 교체 – 같은 풀에서 동시에 실패한 요청들이 한 번만 교체하도록
+        잠금 안에서 현재 풀이 아직 broken 인지 확인한다
+        (완료 콜백 스레드에서도 불리므로 종료를 기다리지 않는다)
+        """
+        with self._rebuild_lock:
+            if self._executor is broken:
+                log.warning("♻️ PDF 렌더 워커 비정상 종료 – 풀 재기동")
+                broken.shutdown(wait=False, cancel_futures=True)
+                self._executor = self._spawn()
+            return self._executor  # type: ignore[return-value]
+
+    def _submit_pooled(self, html_str: str, base_url: str) -> "Future[bytes]":
+        executor = self._executor
+        assert executor is not None
+        try:
+            first = executor.submit(_render, html_str, base_url)
+        except BrokenProcessPool:
+            return self._replace(executor).submit(_render, html_str, base_url)
+
+        outer: Future[bytes] = Future()
+
+        def retry_once(f: "Future[bytes]") -> None:
+            if not f.cancelled() and isinstance(f.exception(), BrokenProcessPool):
+                try:
+                    f = self._replace(executor).submit(_render, html_str, base_url)
+                except Exception as exc:
+                    if not outer.done():
+                        outer.set_exception(exc)
+                    return
+            f.add_done_callback(lambda g: _copy_outcome(g, outer))
+
+        first.add_done_callback(retry_once)
+        return outer
+
+    # --------------------------------------------------
+    def submit(self, html_str: str, base_url: str = ".") -> "Future[bytes]":
+        self._slots.acquire()
+        try:
+            if self._executor is None:
+                fut: Future[bytes] = Future()
+                with self._inline_lock:  # 인-프로세스 렌더는 한 번에 하나
+                    try:
+                        fut.set_result(_render(html_str, base_url))
+                    except Exception as exc:
+                        fut.set_exception(exc)
+            else:
+                fut = self._submit_pooled(html_str, base_url)
+        except Exception:
+            self._slots.release()
+            raise
+        fut.add_done_callback(lambda _: self._slots.release())
+        return fut
+
+    def render(self, html_str: str, base_url: str = ".") -> bytes:
+        return self.submit(html_str, base_url).result()
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _copy_outcome(src: "Future[bytes]", dst: "Future[bytes]") -> None:
+    """src 의 결과 · 예외 · 취소를 dst 로 옮김 (dst 가 이미 끝났으면 무시)"""
+    if dst.done():
+        return
+    if src.cancelled():
+        dst.cancel()
+    elif (exc := src.exception()) is not None:
+        dst.set_exception(exc)
+    else:
+        dst.set_result(src.result())
+
+
+_pool: Optional[PdfRenderPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_render_pool() -> PdfRenderPool:
+    """
+    프로세스 전역 렌더 풀 (최초 호출 시 기동 – WeasyPrint 도 이때 처음 로드)
+    예열을 끄면 첫 PDF 요청들이 동시에 들어올 수 있으므로 잠금으로 한 번만 만든다
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                cfg = get_settings()
+                _pool = PdfRenderPool(cfg.PDF_WORKERS, cfg.PDF_QUEUE_SIZE)
+    return _pool
+
+
+def shutdown_render_pool() -> None:
+    """기동된 풀이 있으면 워커 종료 (서버 lifespan 종료 시)"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+            _pool = None
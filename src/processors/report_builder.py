@@ -1,23 +1,180 @@
 """
 src/processors/report_builder.py
 ────────────────────────────────────────────────────────────
-ReportSchema + 메타 → Jinja2 HTML → WeasyPrint PDF & HTML
+ReportSchema + 메타 → 출력 형식(json · md · html · pdf)
+(PDF 변환은 pdf_renderer 프로세스 풀에 위임)
+· FORMATS / register_format → 형식 레지스트리 (미디어 타입 · 확장자 · 렌더 함수)
+· artifacts       → ReportArtifacts – 요청된 형식만, 형식마다 한 번만 지연 생성
+                    (pdf 만 WeasyPrint 를 거치고, 그 외 형식은 건드리지 않는다)
+· restore         → json 형식 출력만으로 ReportArtifacts 복원 (다른 워커가 보관한 작업 산출물)
+· build_report    → HTML + PDF 를 지정 경로에 저장 (CLI)
+· render_sections → 템플릿 block 단위 부분 렌더 (HTML 스트리밍 응답용)
+· get_report_builder → 프로세스 전역 1개 (템플릿 1회 컴파일, 서버 기동 시 warm_up)
+· 스타일은 report_template.css 한 곳 – html 형식은 <style> 로 포함하고,
+  PDF 변환용 HTML 은 스타일 없이 렌더해 렌더 워커가 미리 파싱해 둔 CSS 를 쓴다
 """
 
 from __future__ import annotations
 
+import json
 import logging
+import threading
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Any, Callable, Dict, Iterable, Mapping, NamedTuple, Optional, Sequence, Union
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
-from weasyprint import HTML
+from markupsafe import Markup
 
 from config.settings import get_settings
+from src.metrics import IN_FLIGHT, span, timed
+from src.models.enums import ReportFormat
+from src.processors.pdf_renderer import get_render_pool, stylesheet_path
 from src.models.schemas import ReportSchema, MeetingMeta, SearchDoc
 
 log = logging.getLogger(__name__)
 
+_TEMPLATE = "report_template.html"
+_TEMPLATE_MD = "report_template.md"  # 확장자가 .md 라 select_autoescape 대상이 아니다
+
+# 템플릿 block 순서 (report_template.html 과 동일)
+SECTIONS = (
+    "header", "purpose", "agenda", "summary", "decisions", "actions", "risks", "analysis", "docs",
+)
+
+Output = Union[str, bytes]
+# 이미 렌더된 형식의 출처 – 파일 경로 또는 bytes 를 돌려주는 함수 (사라졌으면 None → 다시 렌더)
+Source = Union[Path, Callable[[], Optional[bytes]]]
+
+
+# ─────────────────────────── 출력 형식 레지스트리 ────────────────────────────
+class OutputFormat(NamedTuple):
+    name: str
+    media_type: str
+    ext: str
+    binary: bool
+    render: Callable[["ReportArtifacts"], Output]
+
+
+FORMATS: Dict[str, OutputFormat] = {}
+
+
+def register_format(
+    name: str,
+    *,
+    media_type: str,
+    ext: Optional[str] = None,
+    binary: bool = False,
+) -> Callable[[Callable[["ReportArtifacts"], Output]], Callable[["ReportArtifacts"], Output]]:
+    """
+    ReportArtifacts → str | bytes 렌더 함수를 형식으로 등록
+    (다른 형식이 필요하면 art.get(...) 으로 받아 쓴다)
+    """
+    def deco(fn: Callable[["ReportArtifacts"], Output]) -> Callable[["ReportArtifacts"], Output]:
+        key = str(name)
+        FORMATS[key] = OutputFormat(key, media_type, ext or key, binary, fn)
+        return fn
+    return deco
+
+
+class ReportArtifacts:
+    """
+    ReportSchema 1개에서 파생되는 형식별 산출물
+    · get(fmt) → 메모리에 있으면 그대로, sources(보고서 캐시 · 공유 저장소)에 있으면 읽고, 없으면 렌더
+    · 형식마다 잠금을 따로 두어 같은 형식은 한 번만 만들고, 다른 형식은 동시에 만들 수 있다
+    """
+
+    def __init__(
+        self,
+        builder: "ReportBuilder",
+        *,
+        report: ReportSchema,
+        meta: MeetingMeta,
+        purpose: str,
+        docs: Iterable[SearchDoc],
+        sources: Optional[Mapping[str, Source]] = None,
+    ) -> None:
+        self.builder = builder
+        self.report = report
+        self.meta = meta
+        self.purpose = purpose
+        self.docs = list(docs)
+        self._sources = dict(sources or {})
+        self._data: Dict[str, Output] = {}
+        self._fresh: set[str] = set()
+        self._locks: Dict[str, threading.Lock] = {}
+
+    @property
+    def context(self) -> Dict[str, Any]:
+        return dict(report=self.report, meta=self.meta, purpose=self.purpose, docs=self.docs)
+
+    # --------------------------------------------------
+    def get(self, fmt: str) -> Output:
+        if fmt not in FORMATS:
+            raise ValueError(f"지원하지 않는 보고서 형식: {fmt}")
+        if fmt in self._data:
+            return self._data[fmt]
+        with self._locks.setdefault(fmt, threading.Lock()):
+            if fmt not in self._data:
+                self._data[fmt] = self._produce(FORMATS[fmt])
+            return self._data[fmt]
+
+    def _produce(self, f: OutputFormat) -> Output:
+        if (src := self._sources.get(f.name)) is not None:
+            raw = read_source(src)
+            if raw is not None:  # 그 사이 캐시 정리 · 만료로 사라졌으면 다시 렌더
+                return raw if f.binary else raw.decode("utf-8")
+        out = f.render(self)
+        self._fresh.add(f.name)
+        return out
+
+    def render(self, *formats: str) -> "ReportArtifacts":
+        """지정 형식을 미리 생성 (이미 있는 형식은 건너뜀)"""
+        for fmt in formats:
+            self.get(fmt)
+        return self
+
+    def needs_render(self, fmt: str) -> bool:
+        """메모리에도 sources 에도 없어 get 이 새로 렌더해야 하는 형식인가"""
+        return fmt not in self._data and fmt not in self._sources
+
+    def rendered(self) -> Dict[str, Output]:
+        """지금까지 메모리에 올라온 형식"""
+        return dict(self._data)
+
+    def fresh(self) -> Dict[str, Output]:
+        """sources 에서 읽지 않고 이번에 새로 렌더한 형식 (캐시 저장 대상)"""
+        return {fmt: self._data[fmt] for fmt in self._fresh}
+
+    def write(self, fmt: str, path: Path) -> Path:
+        out = self.get(fmt)
+        with span(f"write.{fmt}"):
+            if isinstance(out, bytes):
+                path.write_bytes(out)
+            else:
+                path.write_text(out, encoding="utf-8")
+        log.info("📝 %s 저장 → %s", fmt.upper(), path)
+        return path
+
+    # --------------------------------------------------
+    @property
+    def html(self) -> str:
+        return self.get(ReportFormat.HTML)  # type: ignore[return-value]
+
+    @property
+    def pdf(self) -> bytes:
+        return self.get(ReportFormat.PDF)  # type: ignore[return-value]
+
+
+def read_source(src: Source) -> Optional[bytes]:
+    if callable(src):
+        return src()
+    try:
+        return src.read_bytes()
+    except FileNotFoundError:
+        return None
+
 
 class ReportBuilder:
     def __init__(self) -> None:
@@ -25,30 +182,145 @@ class ReportBuilder:
         self.env = Environment(
             loader=FileSystemLoader(cfg.template_dir),
             autoescape=select_autoescape(),
+            auto_reload=False,  # 요청마다 템플릿 mtime 확인 생략
         )
+        # 생성 시 한 번만 컴파일
+        self.template = self.env.get_template(_TEMPLATE)
+        self.template_md = self.env.get_template(_TEMPLATE_MD)
+        # html 응답에 넣을 스타일 (파일은 한 번만 읽는다)
+        self.stylesheet = Markup(stylesheet_path().read_text(encoding="utf-8"))
 
     # ---------------------------------------------------------------- private
-    def _render_html(
-        self,
+    @staticmethod
+    def _context(
         *,
         report: ReportSchema,
         meta: MeetingMeta,
         purpose: str,
         docs: Iterable[SearchDoc],
-    ) -> str:
-        """템플릿 → HTML 문자열"""
-        return self.env.get_template("report_template.html").render(
-            # 템플릿이 요구하는 이름으로 매핑
+    ) -> Dict[str, Any]:
+        # 템플릿이 요구하는 이름으로 매핑 (html · md 공통)
+        return dict(
             meta=meta,
             purpose=purpose,
             agenda=report.agenda_keypoints,
             summary=report.executive_summary,
+            decisions=report.decisions,
             actions=report.action_items,
+            risks=report.risks,
             analysis=report.appendix[0] if report.appendix else "",
             docs=list(docs),
         )
 
+    @timed("render.html")
+    def _render_html(self, *, for_pdf: bool = False, **kwargs: Any) -> str:
+        """
+        템플릿 → HTML 문자열 (report · meta · purpose · docs)
+        for_pdf=True → <style> 생략 (렌더 워커의 CSS 객체가 대신 적용)
+        """
+        ctx = self._context(**kwargs)
+        ctx["stylesheet"] = None if for_pdf else self.stylesheet
+        return self.template.render(ctx)
+
     # ---------------------------------------------------------------- public
+    def render_html(
+        self,
+        *,
+        report: ReportSchema,
+        meta: MeetingMeta,
+        purpose: str,
+        docs: Iterable[SearchDoc],
+    ) -> str:
+        """HTML 만 필요한 요청용 – PDF 변환 없이 문자열 반환"""
+        return self._render_html(report=report, meta=meta, purpose=purpose, docs=docs)
+
+    @timed("render.md")
+    def render_markdown(self, **kwargs: Any) -> str:
+        return self.template_md.render(self._context(**kwargs))
+
+    @timed("render.json")
+    def render_json(
+        self,
+        *,
+        report: ReportSchema,
+        meta: MeetingMeta,
+        purpose: str,
+        docs: Iterable[SearchDoc],
+    ) -> str:
+        """구조화 내용 그대로 (증분 재생성용 input_hashes 는 내부 정보라 제외)"""
+        return json.dumps(
+            {
+                "meeting_meta": meta.model_dump(mode="json"),
+                "meeting_purpose": purpose,
+                **report.model_dump(mode="json", exclude={"input_hashes"}),
+                "documents": [d.model_dump(mode="json") for d in docs],
+            },
+            ensure_ascii=False,
+        )
+
+    def render_sections(self, names: Sequence[str], **context: Any) -> str:
+        """
+        지정한 block 만 렌더 (context 키는 템플릿 변수명 그대로:
+        meta · purpose · agenda · summary · decisions · actions · risks · analysis · docs
+        – decisions · risks 는 비어 있으면 아무것도 출력하지 않는다)
+        """
+        ctx = self.template.new_context({"stylesheet": self.stylesheet, **context})
+        return "".join("".join(self.template.blocks[name](ctx)) for name in names)
+
+    def warm_up(self) -> None:
+        """
+        더미 보고서로 템플릿 렌더 + PDF 1건 변환
+        → 렌더 풀 기동 · fontconfig · 스타일시트 로드를 첫 요청 전에 끝낸다
+        """
+        meta = MeetingMeta(
+            title="warm-up", datetime=datetime.now(timezone.utc), author="-", participants=["-"]
+        )
+        report = ReportSchema(
+            meeting_title="warm-up", executive_summary="회의록 예열", agenda_keypoints=["-"],
+            decisions=[], action_items=["-"], risks=[], appendix=["-"],
+        )
+        html_str = self._render_html(report=report, meta=meta, purpose="-", docs=[], for_pdf=True)
+        get_render_pool().render(html_str, base_url=".")  # 예열은 render.pdf 지표에서 제외
+        log.info("🔥 ReportBuilder 예열 완료")
+
+    def render_pdf(self, html_str: str) -> bytes:
+        """
+        HTML 문자열 → PDF bytes (write_pdf 대상 없이, 렌더 풀 대기 시간 포함)
+        html_str 은 _render_html(for_pdf=True) 출력 – 스타일은 렌더 워커가 붙인다
+        """
+        with span("render.pdf"), IN_FLIGHT.track(kind="pdf"):
+            return get_render_pool().render(html_str, base_url=".")
+
+    def artifacts(
+        self,
+        *,
+        report: ReportSchema,
+        meta: MeetingMeta,
+        purpose: str,
+        docs: Iterable[SearchDoc],
+        sources: Optional[Mapping[str, Source]] = None,
+    ) -> ReportArtifacts:
+        """형식별 산출물 묶음 – 이 시점에는 아무것도 렌더하지 않는다"""
+        return ReportArtifacts(
+            self, report=report, meta=meta, purpose=purpose, docs=docs, sources=sources
+        )
+
+    def restore(self, raw: bytes, sources: Optional[Mapping[str, Source]] = None) -> ReportArtifacts:
+        """
+        render_json 출력 → ReportArtifacts (payload 없이 나머지 형식을 다시 렌더할 수 있다)
+        input_hashes 는 json 에 없으므로 비어 있다 – 증분 재생성 기준으로는 쓰지 않는다
+        """
+        data = json.loads(raw)
+        meta = MeetingMeta.model_validate(data.pop("meeting_meta"))
+        purpose = data.pop("meeting_purpose")
+        docs = [SearchDoc.model_validate(d) for d in data.pop("documents")]
+        art = self.artifacts(
+            report=ReportSchema.model_validate(data), meta=meta, purpose=purpose, docs=docs,
+            sources=sources,
+        )
+        art._data[str(ReportFormat.JSON)] = raw.decode("utf-8")
+        return art
+
     def build_report(
         self,
         *,
@@ -58,20 +330,39 @@ class ReportBuilder:
         docs: Iterable[SearchDoc],
         out_pdf: Path,
         out_html: Optional[Path] = None,
-    ) -> None:
+    ) -> ReportArtifacts:
         """
-        HTML + PDF 동시 생성
+        HTML + PDF 동시 생성 후 파일로 저장
         """
-        html_str = self._render_html(
-            report=report,
-            meta=meta,
-            purpose=purpose,
-            docs=docs,
-        )
+        art = self.artifacts(report=report, meta=meta, purpose=purpose, docs=docs)
+        art.write(ReportFormat.HTML, out_html or out_pdf.with_suffix(".html"))
+        art.write(ReportFormat.PDF, out_pdf)
+        return art
+
+
+# ─────────────────────────── 기본 형식 ────────────────────────────
+@register_format(ReportFormat.JSON, media_type="application/json")
+def _json(art: ReportArtifacts) -> str:
+    return art.builder.render_json(**art.context)
+
+
+@register_format(ReportFormat.MD, media_type="text/markdown; charset=utf-8")
+def _markdown(art: ReportArtifacts) -> str:
+    return art.builder.render_markdown(**art.context)
+
+
+@register_format(ReportFormat.HTML, media_type="text/html; charset=utf-8")
+def _html(art: ReportArtifacts) -> str:
+    return art.builder._render_html(**art.context)
+
+
+@register_format(ReportFormat.PDF, media_type="application/pdf", binary=True)
+def _pdf(art: ReportArtifacts) -> bytes:
+    # html 형식과 달리 <style> 없이 렌더 (WeasyPrint 가 요청마다 CSS 를 다시 파싱하지 않게)
+    return art.builder.render_pdf(art.builder._render_html(**art.context, for_pdf=True))
 
-        out_html = out_html or out_pdf.with_suffix(".html")
-        out_html.write_text(html_str, encoding="utf-8")
-        log.info("📝 HTML 저장 → %s", out_html)
 
-        HTML(string=html_str, base_url=".").write_pdf(out_pdf)
-        log.info("📄 PDF 저장 → %s", out_pdf)
+@lru_cache
+def get_report_builder() -> ReportBuilder:
+    """프로세스 전역 ReportBuilder (컴파일된 템플릿 재사용)"""
+    return ReportBuilder()
@@ -1,5 +1,8 @@
-from typing import List
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional
 from src.api_clients.llm_client import LLMClient
+from src.processors.map_reduce import amap_reduce, map_reduce
+from src.metrics import timed
 
 class SummaryProcessor:
     """회의 내용을 한국어로 요약 (3~5줄)"""
@@ -8,14 +11,56 @@ class SummaryProcessor:
         "당신은 전문 비즈니스 회의 요약가입니다. "
         "사용자가 제공한 영어 회의 원문을 읽고 한국어로 3~5문장 핵심 요약을 작성하세요."
     )
+    # 긴 회의록 map-reduce 용
+    SYS_MAP = (
+        "당신은 전문 비즈니스 회의 요약가입니다. "
+        "아래는 긴 영어 회의 원문의 일부입니다. 이 부분의 핵심 내용을 한국어로 2~4문장으로 요약하세요."
+    )
+    SYS_REDUCE = (
+        "당신은 전문 비즈니스 회의 요약가입니다. "
+        "아래는 한 회의를 구간별로 나눠 요약한 한국어 부분 요약들입니다. "
+        "중복을 제거하고 하나로 통합해 한국어 3~5문장 핵심 요약을 작성하세요."
+    )
 
     def __init__(self, client: LLMClient) -> None:
         self.client = client
 
-    def run(self, text_en: str) -> str:
-        return self.client.generate(
+    def _request(self, text_en: str) -> Dict[str, Any]:
+        return dict(
             system_prompt=self.SYS,
             user_prompt=text_en,
             max_tokens=512,
             temperature=0.3,
         )
+
+    @timed("llm.summary")
+    def run(self, text_en: str) -> str:
+        return self.client.generate(**self._request(text_en))
+
+    @timed("llm.summary")
+    async def arun(self, text_en: str) -> str:
+        """AsyncGeminiClient 용 비동기 버전"""
+        return await self.client.generate(**self._request(text_en))
+
+    def astream(self, text_en: str) -> AsyncIterator[str]:
+        """요약 텍스트를 생성되는 대로 조각 단위로 반환 (streamGenerateContent)"""
+        return self.client.stream_generate(**self._request(text_en))
+
+    # ---------------------------------------------------------------- map-reduce
+    def _chunk_kwargs(self, fanout: int, group_chars: int) -> Dict[str, Any]:
+        return dict(
+            map_request=lambda c: dict(self._request(c), system_prompt=self.SYS_MAP),
+            reduce_request=lambda g: dict(self._request(g), system_prompt=self.SYS_REDUCE),
+            fanout=fanout,
+            group_chars=group_chars,
+        )
+
+    @timed("llm.summary")
+    def run_chunks(self, chunks: List[str], *, fanout: int, group_chars: int) -> str:
+        """청크별 부분 요약(map) → 통합 요약(reduce)"""
+        return map_reduce(self.client, chunks, **self._chunk_kwargs(fanout, group_chars))
+
+    @timed("llm.summary")
+    async def arun_chunks(self, chunks: List[str], *, fanout: int, group_chars: int,
+                          sem: Optional[asyncio.Semaphore] = None) -> str:
+        return await amap_reduce(self.client, chunks, **self._chunk_kwargs(fanout, group_chars), sem=sem)
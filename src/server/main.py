@@ -2,66 +2,318 @@
 FastAPI 엔드포인트
 ────────────────────────────────────────────────────────────
 • POST /report-json   : 허브-API JSON → 보고서 생성
+• POST /report-pdf    : 허브-API JSON → PDF 다운로드
+• POST /report?format=json|md|html|pdf : 요청한 형식 하나만 생성 (pdf 외에는 WeasyPrint 생략)
+• POST /report-stt?format=… : STT 원문 → Pipeline API(비동기 · HTTP/2 풀) → 지정 형식 보고서
+• POST /reports              : 비동기 작업 제출 → 202 + 작업 id (대기열 초과 시 429)
+• GET  /reports/{id}         : 작업 상태
+• GET  /reports/{id}/{format}: 완료된 작업 산출물 (제출 시 지정하지 않은 형식은 그때 렌더)
+  ─ ARTIFACT_PERSIST=true 면 작업을 받지 않은 gunicorn 워커 · 레플리카도 공유 보관소에서 응답
+• GET  /health        : 헬스 체크
+• GET  /metrics       : Prometheus 메트릭 (단계별 지연 · 토큰 · in-flight · 캐시 적중)
+
+요청 헤더 (선택) – service/scheduler.py 의 우선순위 · 공정 큐 · 마감
+• X-Tenant   : 테넌트 이름 (SCHED_TENANT_WEIGHTS 가중치, 없으면 "default")
+• X-Priority : interactive | batch (기본: 동기 엔드포인트 interactive, POST /reports batch)
+• X-Deadline : 이 요청을 포기할 시간(초) – 그 안에 처리할 수 없으면 503 + Retry-After
+
+모든 핸들러는 async – Gemini 대기는 이벤트 루프에서, PDF 렌더는
+report_service 전용 executor 에서 처리되므로 보고서 생성 중에도
+새 요청·헬스 체크를 계속 받는다.
+
+PipelineRequest 본문은 raw bytes 를 PipelineRequest.from_json_bytes 로 파싱·검증한다
+(stdlib json 파서 생략, 큰 본문은 스레드로 오프로드).
 """
 
 from __future__ import annotations
 
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse, HTMLResponse, FileResponse
-from pathlib import Path
+import asyncio
+import re
+import time
+from contextlib import asynccontextmanager
+from typing import List
+
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.openapi.utils import get_openapi
+from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse, StreamingResponse
+from pydantic import ValidationError
 import uuid
 
-from src.models.schemas import PipelineRequest
-from src.service.report_service import generate_report_from_pipeline_json
+from config.settings import get_settings
+from src import metrics, setup_logging
+from src.models.enums import JobStatus, ReportFormat
+from src.models.schemas import JobInfo, PipelineRequest, SttRequest
+from src.processors.pdf_renderer import shutdown_render_pool
+from src.processors.report_builder import FORMATS, Output
+from src.service import report_service
+from src.service.jobs import JobManager, QueueFullError, create_job_manager
+from src.service.scheduler import DeadlineExceeded, reset_ticket, set_ticket, ticket_from_headers
+from src.service.report_service import (
+    agenerate_report_artifacts,
+    agenerate_report_formats,
+    agenerate_report_html,
+    arender_format,
+    astream_report_html,
+)
+
+setup_logging()  # uvicorn · gunicorn 이 이 모듈을 앱 진입점으로 임포트한다
+
+_SERVER_TIMING = get_settings().SERVER_TIMING_ENABLED
+_INLINE_PARSE_BYTES = 1024 * 1024  # 이보다 큰 본문은 이벤트 루프 밖에서 검증
+_JOB_ID = re.compile(r"[0-9a-f]{32}")  # uuid4().hex – 공유 보관소 경로 · 키에 그대로 쓰인다
+_jobs: JobManager | None = None
+
+
+@asynccontextmanager
+async def _lifespan(_: FastAPI):
+    global _jobs
+    await report_service.awarm_up()
+    _jobs = create_job_manager()
+    _jobs.start()
+    yield
+    await _jobs.stop()
+    await report_service.aclose()
+    shutdown_render_pool()
+
 
 app = FastAPI(
     title="Report Generator API",
     version="1.0.0",
     description="허브-API JSON을 받아 HTML/PDF 회의록을 생성합니다.",
+    lifespan=_lifespan,
 )
 
 
+# ─────────────────────────── 요청 본문 fast-path ────────────────────────────
+async def _pipeline_body(request: Request) -> PipelineRequest:
+    body = await request.body()
+    try:
+        if len(body) > _INLINE_PARSE_BYTES:
+            return await asyncio.to_thread(PipelineRequest.from_json_bytes, body)
+        return PipelineRequest.from_json_bytes(body)
+    except ValidationError as e:
+        # FastAPI 기본 422 응답과 같은 형식 (loc 앞에 "body")
+        raise RequestValidationError(
+            [{**err, "loc": ("body", *err["loc"])} for err in e.errors(include_url=False)]
+        )
+
+
+_PIPELINE_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/json": {"schema": {"$ref": "#/components/schemas/PipelineRequest"}}
+        },
+    }
+}
+
+
+def _openapi():
+    """Depends 로 받는 본문 스키마를 문서에 직접 등록"""
+    if app.openapi_schema is None:
+        schema = get_openapi(
+            title=app.title, version=app.version,
+            description=app.description, routes=app.routes,
+        )
+        body = PipelineRequest.model_json_schema(ref_template="#/components/schemas/{model}")
+        components = schema.setdefault("components", {}).setdefault("schemas", {})
+        components.update(body.pop("$defs", {}))
+        components["PipelineRequest"] = body
+        app.openapi_schema = schema
+    return app.openapi_schema
+
+
+app.openapi = _openapi
+
+
+@app.middleware("http")
+async def _schedule_ticket(request: Request, call_next):
+    """X-Tenant · X-Priority · X-Deadline → 스케줄러 Ticket (요청 처리 동안 contextvar)"""
+    try:
+        ticket = ticket_from_headers(request.headers)
+    except ValueError as e:
+        return JSONResponse({"detail": str(e)}, status_code=400)
+    token = set_ticket(ticket)
+    try:
+        return await call_next(request)
+    finally:
+        reset_ticket(token)
+
+
+@app.middleware("http")
+async def _observe(request: Request, call_next):
+    """요청 수 · in-flight 집계 + (선택) Server-Timing 헤더"""
+    t0 = time.perf_counter()
+    with metrics.IN_FLIGHT.track(kind="http"), metrics.server_timing() as timings:
+        response = await call_next(request)
+    route = request.scope.get("route")
+    metrics.HTTP_REQUESTS.inc(
+        method=request.method,
+        path=getattr(route, "path", "unmatched"),  # 경로 파라미터로 라벨이 폭증하지 않도록 템플릿 사용
+        status=str(response.status_code),
+    )
+    if _SERVER_TIMING:
+        timings.append(("total", time.perf_counter() - t0))
+        response.headers["Server-Timing"] = metrics.format_server_timing(timings)
+    return response
+
+
+def _error(e: Exception) -> HTTPException:
+    """마감 초과 폐기 → 503 + Retry-After, 나머지 → 500"""
+    if isinstance(e, DeadlineExceeded):
+        return HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+    return HTTPException(status_code=500, detail=str(e))
+
+
 # ─────────────────────────── ❶ 보고서 생성 엔드포인트 ────────────────────────────
-@app.post("/report-json", response_class=HTMLResponse,
+@app.post("/report-json", response_class=HTMLResponse, openapi_extra=_PIPELINE_BODY,
           summary="허브-API JSON → HTML 보고서 생성")
-def create_report_json(payload: PipelineRequest):
+async def create_report_json(
+    payload: PipelineRequest = Depends(_pipeline_body),
+    stream: bool = Query(False, description="섹션이 완성되는 대로 HTML 을 스트리밍"),
+):
     """
     허브-API 가 내려주는 JSON( `PipelineRequest` )을 그대로 본문으로 보내면<br>
-    HTML 보고서를 직접 반환합니다. PDF 파일은 `/report-pdf` 엔드포인트를 통해 접근할 수 있습니다.
+    HTML 보고서를 직접 반환합니다 (PDF 는 만들지 않음). PDF 파일은 `/report-pdf` 엔드포인트를 통해 접근할 수 있습니다.<br>
+    `?stream=true` 이면 메타 · 목적 · 주요 논의를 즉시 보내고 LLM 섹션을 완성되는 대로 이어 보냅니다.
     """
-    out_dir = Path("/opt/app/out") / str(uuid.uuid4())
+    if stream:
+        return StreamingResponse(
+            astream_report_html(payload), media_type="text/html; charset=utf-8"
+        )
     try:
-        paths = generate_report_from_pipeline_json(payload, out_dir)
-        
-        # HTML 파일 내용을 읽어서 직접 반환
-        with open(paths["html"], "r", encoding="utf-8") as html_file:
-            html_content = html_file.read()
-        
-        return html_content
+        return await agenerate_report_html(payload)
     except Exception as e:  # pragma: no cover
-        raise HTTPException(status_code=500, detail=str(e))
+        raise _error(e)
 
 
 # ─────────────────────────── ❷ PDF 파일 제공 엔드포인트 ────────────────────────────
-@app.post("/report-pdf", response_class=FileResponse,
+def _format_response(fmt: str, out: Output) -> Response:
+    # PDF 는 다운로드 가능한 형태로, 나머지는 본문 그대로 반환
+    f = FORMATS[fmt]
+    headers = {}
+    if f.binary:
+        headers["Content-Disposition"] = f'attachment; filename="report.{f.ext}"'
+    return Response(content=out, media_type=f.media_type, headers=headers)
+
+
+def _pdf_response(pdf: bytes) -> Response:
+    return _format_response(ReportFormat.PDF, pdf)
+
+
+_ANY_FORMAT = {200: {"content": {f.media_type: {} for f in FORMATS.values()}}}
+
+
+@app.post("/report-pdf", response_class=Response,
+          responses={200: {"content": {"application/pdf": {}}}}, openapi_extra=_PIPELINE_BODY,
           summary="허브-API JSON → PDF 보고서 생성")
-def create_report_pdf(payload: PipelineRequest):
+async def create_report_pdf(payload: PipelineRequest = Depends(_pipeline_body)):
     """
     허브-API 가 내려주는 JSON( `PipelineRequest` )을 그대로 본문으로 보내면<br>
     PDF 보고서 파일을 직접 다운로드할 수 있게 반환합니다.
     """
-    out_dir = Path("/opt/app/out") / str(uuid.uuid4())
     try:
-        paths = generate_report_from_pipeline_json(payload, out_dir)
-        
-        # PDF 파일을 직접 반환 (다운로드 가능한 형태로)
-        return FileResponse(
-            path=paths["pdf"],
-            media_type="application/pdf",
-            filename="report.pdf"
+        art = await agenerate_report_artifacts(payload, persist_as=str(uuid.uuid4()))
+        return _pdf_response(art.pdf)
+    except Exception as e:  # pragma: no cover
+        raise _error(e)
+
+
+@app.post("/report", response_class=Response, responses=_ANY_FORMAT, openapi_extra=_PIPELINE_BODY,
+          summary="허브-API JSON → 지정 형식 보고서 생성")
+async def create_report(
+    payload: PipelineRequest = Depends(_pipeline_body),
+    format: ReportFormat = Query(ReportFormat.HTML, description="json · md · html · pdf"),
+):
+    """
+    요청한 형식 하나만 만들어 반환합니다.<br>
+    `json` · `md` 는 챗봇 · 검색 색인용 구조화 내용이며, `pdf` 가 아니면 PDF 변환을 하지 않습니다.
+    """
+    try:
+        art = await agenerate_report_formats(payload, (format,))
+        return _format_response(format, art.get(format))
+    except Exception as e:  # pragma: no cover
+        raise _error(e)
+
+
+@app.post("/report-stt", response_class=Response, responses=_ANY_FORMAT,
+          summary="STT 원문 → Pipeline API → 지정 형식 보고서 생성")
+async def create_report_from_stt(
+    payload: SttRequest,
+    format: ReportFormat = Query(ReportFormat.HTML, description="json · md · html · pdf"),
+):
+    """
+    서버가 Pipeline API(`/pipeline-run`)를 비동기로 호출해 허브 JSON 을 만든 뒤 `/report` 와 같이 처리합니다.<br>
+    같은 STT 가 동시에 들어오면 Pipeline 호출은 한 번만 나갑니다.
+    """
+    try:
+        art = await report_service.agenerate_report(
+            payload.text_stt, (format,),
+            clusters=payload.num_clusters, top_k=payload.top_k, target_lang=payload.target_lang,
         )
+        return _format_response(format, art.get(format))
     except Exception as e:  # pragma: no cover
-        raise HTTPException(status_code=500, detail=str(e))
+        raise _error(e)
+
+
+# ─────────────────────────── ❸ 비동기 작업 API ────────────────────────────
+async def _job_or_404(job_id: str) -> JobInfo:
+    info = await _jobs.lookup(job_id) if _jobs and _JOB_ID.fullmatch(job_id) else None
+    if info is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return info
+
+
+@app.post("/reports", response_model=JobInfo, status_code=202, openapi_extra=_PIPELINE_BODY,
+          summary="허브-API JSON → 보고서 작업 제출")
+async def submit_report(
+    response: Response,
+    payload: PipelineRequest = Depends(_pipeline_body),
+    formats: List[ReportFormat] = Query(
+        [ReportFormat.HTML, ReportFormat.PDF], description="작업에서 미리 만들어 둘 형식"
+    ),
+):
+    """
+    작업을 대기열에 넣고 즉시 id 를 반환합니다.<br>
+    `GET /reports/{id}` 로 상태를 조회하고, 완료되면 `/{format}` 으로 산출물을 받습니다.
+    `?formats=` 로 미리 만들 형식을 고르며, 나머지 형식도 조회 시 같은 내용으로 렌더됩니다.
+    대기열이 가득 차면 **429** 를 반환하므로 `Retry-After` 이후 다시 시도하세요.
+    """
+    try:
+        job = await _jobs.submit(payload, formats)
+    except QueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "5"})
+    response.headers["Location"] = f"/reports/{job.id}"
+    return job.info()
+
+
+@app.get("/reports/{job_id}", response_model=JobInfo, summary="보고서 작업 상태")
+async def get_report_job(job_id: str):
+    return await _job_or_404(job_id)
+
+
+@app.get("/reports/{job_id}/{format}", response_class=Response, responses=_ANY_FORMAT,
+         summary="완료된 작업 산출물")
+async def get_report_job_output(job_id: str, format: ReportFormat):
+    info = await _job_or_404(job_id)
+    if info.status is not JobStatus.DONE:
+        raise HTTPException(status_code=409, detail=f"작업이 아직 완료되지 않았습니다: {info.status}")
+    if (art := await _jobs.artifacts(job_id)) is None:  # 보관 기간 만료
+        raise HTTPException(status_code=404, detail="작업 산출물을 찾을 수 없습니다.")
+    try:
+        out = await arender_format(art, format)
+    except DeadlineExceeded as e:
+        raise _error(e)
+    return _format_response(format, out)
+
 
+# ─────────────────────────── ❹ 헬스 체크 ────────────────────────────
+@app.get("/health", summary="헬스 체크")
+async def health():
+    return JSONResponse({"status": "ok"})
 
 
+@app.get("/metrics", response_class=PlainTextResponse, summary="Prometheus 메트릭")
+async def prometheus_metrics():
+    return PlainTextResponse(metrics.render(), media_type=metrics.CONTENT_TYPE)
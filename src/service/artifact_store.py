@@ -0,0 +1,215 @@
+"""
+src/service/artifact_store.py
+────────────────────────────────────────────────────────────
+(선택) 서버 산출물 보관소 – OUT_DIR/<id>/report.{json,md,html,pdf}
+
+· 응답은 메모리 산출물로 바로 나가고, 보관은 report_service 가
+  백그라운드 스레드에서 save 를 호출한다 (ARTIFACT_PERSIST=true 일 때만)
+· 그 시점까지 렌더된 형식 + json 만 보관 (json 외에는 보관을 위해 새로 렌더하지 않는다)
+  ─ load 는 json 으로 ReportArtifacts 를 복원하므로 보관하지 않은 형식도 어느 워커에서나 렌더된다
+· put_job · get_job → 비동기 작업 상태(JobInfo) 공유 – 작업을 받지 않은 워커도 상태 · 산출물 조회
+  (delete_job → 대기열에 들어가지 못한 작업의 기록 삭제)
+· 보존 기간(ARTIFACT_RETENTION) · 총 용량(ARTIFACT_MAX_BYTES) 기준 GC
+  ─ 저장 시 최대 gc_interval 초에 한 번, 기동 시 한 번 실행
+  ─ 작업 상태(.jobs/)는 JOB_RETENTION 기준
+· 보고서 캐시 디렉터리(.cache) 등 '.' 으로 시작하는 항목은 크기 GC 대상에서 제외
+· SHARED_BACKEND=redis → RedisArtifactStore (같은 구성을 Redis 키로, 레플리카 간 공유)
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import os
+import shutil
+import threading
+import time
+import uuid
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from config.settings import get_settings
+from src.api_clients.redis_client import get_redis, rkey, ttl_ms, use_redis
+from src.models.enums import ReportFormat
+from src.models.schemas import JobInfo
+from src.processors.report_builder import FORMATS, ReportArtifacts, get_report_builder
+
+log = logging.getLogger(__name__)
+
+
+class ArtifactStore:
+    def __init__(
+        self,
+        root: Path,
+        *,
+        retention: float,
+        max_bytes: int,
+        job_ttl: float = 3600.0,
+        gc_interval: float = 60.0,
+    ) -> None:
+        self.root = root
+        self.retention = retention
+        self.max_bytes = max_bytes
+        self.job_ttl = job_ttl
+        self.gc_interval = gc_interval
+        self._lock = threading.Lock()
+        self._last_gc = 0.0
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    # --------------------------------------------------
+    def save(self, name: str, art: ReportArtifacts) -> Dict[str, Path]:
+        """임시 디렉터리에 쓴 뒤 원자적으로 rename"""
+        art.get(ReportFormat.JSON)  # load 의 복원 기준
+        entry = self.root / name
+        tmp = self.root / f".tmp-{uuid.uuid4().hex}"
+        tmp.mkdir(parents=True)
+        for fmt, out in art.rendered().items():
+            path = tmp / f"report.{FORMATS[fmt].ext}"
+            if isinstance(out, bytes):
+                path.write_bytes(out)
+            else:
+                path.write_text(out, encoding="utf-8")
+        if entry.exists():
+            shutil.rmtree(entry, ignore_errors=True)
+        tmp.rename(entry)
+        log.debug("💾 산출물 보관 → %s", entry)
+
+        if time.monotonic() - self._last_gc >= self.gc_interval:
+            self.gc()
+        return {f.suffix[1:]: f for f in entry.iterdir()}
+
+    def load(self, name: str) -> Optional[ReportArtifacts]:
+        """save 한 엔트리 → 지연 산출물 (보관된 형식은 파일에서 읽고, 나머지는 json 에서 렌더)"""
+        entry = self.root / name
+        try:
+            raw = (entry / "report.json").read_bytes()
+        except FileNotFoundError:
+            return None
+        sources = {fmt: entry / f"report.{f.ext}" for fmt, f in FORMATS.items() if fmt != "json"}
+        return get_report_builder().restore(raw, sources)
+
+    # -------------------------------------------------- 작업 상태
+    def _job_path(self, job_id: str) -> Path:
+        return self.root / ".jobs" / f"{job_id}.json"
+
+    def put_job(self, info: JobInfo) -> None:
+        path = self._job_path(info.id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".tmp-{uuid.uuid4().hex}")
+        tmp.write_text(info.model_dump_json(), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def get_job(self, job_id: str) -> Optional[JobInfo]:
+        path = self._job_path(job_id)
+        try:
+            if self.job_ttl > 0 and time.time() - path.stat().st_mtime > self.job_ttl:
+                return None
+            return JobInfo.model_validate_json(path.read_bytes())
+        except FileNotFoundError:
+            return None
+
+    def delete_job(self, job_id: str) -> None:
+        self._job_path(job_id).unlink(missing_ok=True)
+
+    # --------------------------------------------------
+    def gc(self) -> None:
+        """보존 기간이 지난 엔트리 삭제 후, 용량 초과분을 오래된 순서로 삭제"""
+        with self._lock:
+            self._last_gc = time.monotonic()
+            now = time.time()
+            entries: list[tuple[float, int, Path]] = []
+            for entry in self.root.iterdir():
+                if not entry.is_dir() or entry.name.startswith("."):
+                    continue
+                try:
+                    mtime = entry.stat().st_mtime
+                    if self.retention > 0 and now - mtime > self.retention:
+                        shutil.rmtree(entry, ignore_errors=True)
+                        continue
+                    size = sum(f.stat().st_size for f in entry.iterdir() if f.is_file())
+                except FileNotFoundError:
+                    continue
+                entries.append((mtime, size, entry))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, entry in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                shutil.rmtree(entry, ignore_errors=True)
+                total -= size
+                log.debug("🧹 보관 산출물 정리 → %s", entry.name)
+
+            jobs = self.root / ".jobs"
+            if self.job_ttl > 0 and jobs.is_dir():
+                for path in jobs.iterdir():
+                    try:
+                        if now - path.stat().st_mtime > self.job_ttl:
+                            path.unlink()
+                    except FileNotFoundError:
+                        continue
+
+
+class RedisArtifactStore(ArtifactStore):
+    """
+    SHARED_BACKEND=redis – 산출물 = <REDIS_PREFIX>artifact:<id>:<형식>, 작업 상태 = <REDIS_PREFIX>job:<id>
+    · 만료는 키 TTL (ARTIFACT_RETENTION · JOB_RETENTION), 총 용량은 Redis maxmemory 정책
+    """
+
+    def __init__(self, redis: Any, *, retention: float, job_ttl: float = 3600.0) -> None:
+        self.retention = retention
+        self.job_ttl = job_ttl
+        self._r = redis
+
+    def save(self, name: str, art: ReportArtifacts) -> Dict[str, str]:  # type: ignore[override]
+        art.get(ReportFormat.JSON)
+        ttl = ttl_ms(self.retention)
+        keys: Dict[str, str] = {}
+        pipe = self._r.pipeline(transaction=False)
+        for fmt, out in art.rendered().items():
+            keys[fmt] = rkey("artifact", name, fmt)
+            pipe.set(keys[fmt], out if isinstance(out, bytes) else out.encode("utf-8"), px=ttl)
+        pipe.execute()
+        log.debug("💾 산출물 보관 → %s", rkey("artifact", name))
+        return keys
+
+    def load(self, name: str) -> Optional[ReportArtifacts]:
+        raw = self._r.get(rkey("artifact", name, "json"))
+        if raw is None:
+            return None
+        sources = {
+            fmt: functools.partial(self._r.get, rkey("artifact", name, fmt))
+            for fmt in FORMATS if fmt != "json"
+        }
+        return get_report_builder().restore(raw, sources)
+
+    def put_job(self, info: JobInfo) -> None:
+        self._r.set(rkey("job", info.id), info.model_dump_json().encode("utf-8"), px=ttl_ms(self.job_ttl))
+
+    def get_job(self, job_id: str) -> Optional[JobInfo]:
+        raw = self._r.get(rkey("job", job_id))
+        return None if raw is None else JobInfo.model_validate_json(raw)
+
+    def delete_job(self, job_id: str) -> None:
+        self._r.delete(rkey("job", job_id))
+
+    def gc(self) -> None:
+        """만료는 Redis 가 처리"""
+
+
+@lru_cache
+def get_artifact_store() -> Optional[ArtifactStore]:
+    """ARTIFACT_PERSIST=false 면 None (아무것도 남기지 않음 – 작업 조회는 받은 워커에서만)"""
+    cfg = get_settings()
+    if not cfg.ARTIFACT_PERSIST:
+        return None
+    if use_redis():
+        return RedisArtifactStore(
+            get_redis(), retention=cfg.ARTIFACT_RETENTION, job_ttl=cfg.JOB_RETENTION
+        )
+    return ArtifactStore(
+        cfg.OUT_DIR,
+        retention=cfg.ARTIFACT_RETENTION,
+        max_bytes=cfg.ARTIFACT_MAX_BYTES,
+        job_ttl=cfg.JOB_RETENTION,
+    )
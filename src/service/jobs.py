@@ -0,0 +1,213 @@
+"""
+src/service/jobs.py
+────────────────────────────────────────────────────────────
+비동기 보고서 작업 큐 (워커 프로세스마다 하나)
+
+· submit      → 즉시 작업 id 반환, 대기열이 가득 차면 QueueFullError (→ 429)
+· JOB_WORKERS 개 워커 태스크가 대기열을 소비하며
+  agenerate_report_formats 로 제출 시 지정한 형식(기본 HTML + PDF)을 한 번만 생성 (메모리 보관)
+  ─ 지정하지 않은 형식도 조회 시 같은 ReportSchema 에서 지연 렌더
+· 완료 · 실패 작업은 JOB_RETENTION 초 동안 상태 · 산출물 조회 가능
+  (제출 · 작업 완료 때마다 보존 기간이 지난 작업을 메모리에서 정리)
+· ARTIFACT_PERSIST=true 면 상태 변화마다 JobInfo 를, 완료 직전에 산출물을 공유 보관소에 저장
+  → gunicorn 워커 여럿 · 레플리카 여럿이어도 어느 워커로 조회가 들어오든 lookup · artifacts 가 응답
+  (완료 상태는 산출물 저장이 끝난 뒤에 공개하므로 DONE 을 본 워커는 산출물도 읽을 수 있다)
+· 대기열은 FIFO 가 아니라 (우선순위, 테넌트 공정 큐 태그) 순서 – 한 테넌트의 대량 제출이
+  다른 테넌트 작업을 뒤로 밀지 않는다. 제출 시점의 Ticket(기본 batch)으로 scheduler 슬롯을 받는다
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from config.settings import get_settings
+from src.metrics import JOBS
+from src.models.enums import JobStatus, Priority
+from src.models.schemas import JobInfo, PipelineRequest
+from src.processors.report_builder import FORMATS, ReportArtifacts
+from src.service.artifact_store import ArtifactStore, get_artifact_store
+from src.service.report_service import agenerate_report_formats
+from src.service.scheduler import FairTags, Ticket, current_ticket, reset_ticket, set_ticket
+
+log = logging.getLogger(__name__)
+
+
+class QueueFullError(RuntimeError):
+    """대기열 상한 초과 – 클라이언트는 잠시 후 재시도해야 한다."""
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+@dataclass
+class Job:
+    id: str
+    payload: PipelineRequest
+    formats: Tuple[str, ...] = ("html", "pdf")
+    status: JobStatus = JobStatus.QUEUED
+    created_at: datetime = field(default_factory=_now)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+    artifacts: Optional[ReportArtifacts] = None
+    ticket: Ticket = field(default_factory=Ticket)
+
+    def info(self) -> JobInfo:
+        links = {"self": f"/reports/{self.id}"}
+        if self.status is JobStatus.DONE:
+            links.update({fmt: f"/reports/{self.id}/{fmt}" for fmt in FORMATS})
+        return JobInfo(
+            id=self.id,
+            status=self.status,
+            created_at=self.created_at,
+            started_at=self.started_at,
+            finished_at=self.finished_at,
+            error=self.error,
+            links=links,
+        )
+
+
+class JobManager:
+    def __init__(
+        self,
+        *,
+        workers: int,
+        queue_size: int,
+        retention: float,
+        store: Optional[ArtifactStore] = None,
+        weights: Optional[Dict[str, float]] = None,
+    ) -> None:
+        self.workers = workers
+        self.retention = retention
+        self.store = store
+        self._queue: "asyncio.PriorityQueue[Tuple[int, float, int, Job]]" = asyncio.PriorityQueue(
+            maxsize=queue_size
+        )
+        self._fair = {p: FairTags(weights or {}) for p in Priority}
+        self._seq = itertools.count()
+        self._jobs: Dict[str, Job] = {}
+        self._tasks: List[asyncio.Task] = []
+
+    # --------------------------------------------------
+    def start(self) -> None:
+        self._tasks = [
+            asyncio.create_task(self._worker(i), name=f"report-job-{i}")
+            for i in range(self.workers)
+        ]
+        log.info("📬 보고서 작업 큐 기동 – 워커 %d개", self.workers)
+
+    async def stop(self) -> None:
+        for t in self._tasks:
+            t.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    # --------------------------------------------------
+    async def submit(self, payload: PipelineRequest, formats: Sequence[str] = ("html", "pdf")) -> Job:
+        self._prune()
+        if self._queue.full():
+            raise QueueFullError("보고서 작업 대기열이 가득 찼습니다.")
+        ticket = current_ticket().with_default(Priority.BATCH)
+        job = Job(id=uuid.uuid4().hex, payload=payload, formats=tuple(formats), ticket=ticket)
+        # 대기열에 넣기 전에 기록 – 워커의 RUNNING 기록이 QUEUED 에 덮이지 않는다 (상태 순서 보장)
+        await self._publish(job)
+        rank = 0 if ticket.priority is Priority.INTERACTIVE else 1
+        try:
+            self._queue.put_nowait(
+                (rank, self._fair[ticket.priority].tag(ticket.tenant), next(self._seq), job)
+            )
+        except asyncio.QueueFull:  # 기록하는 사이 대기열이 찼다 – 아무도 id 를 모르는 QUEUED 기록 삭제
+            await self._unpublish(job)
+            raise QueueFullError("보고서 작업 대기열이 가득 찼습니다.") from None
+        self._jobs[job.id] = job
+        JOBS.inc(status="queued")
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    async def lookup(self, job_id: str) -> Optional[JobInfo]:
+        """이 워커가 받은 작업이면 메모리에서, 아니면 공유 보관소에서"""
+        if (job := self._jobs.get(job_id)) is not None:
+            return job.info()
+        if self.store is None:
+            return None
+        return await asyncio.to_thread(self.store.get_job, job_id)
+
+    async def artifacts(self, job_id: str) -> Optional[ReportArtifacts]:
+        """완료 작업의 산출물 (다른 워커 작업은 보관된 json 에서 복원)"""
+        if (job := self._jobs.get(job_id)) is not None:
+            return job.artifacts
+        if self.store is None:
+            return None
+        return await asyncio.to_thread(self.store.load, job_id)
+
+    async def _publish(self, job: Job) -> None:
+        if self.store is not None:
+            await asyncio.to_thread(self.store.put_job, job.info())
+
+    async def _unpublish(self, job: Job) -> None:
+        if self.store is None:
+            return
+        try:
+            await asyncio.to_thread(self.store.delete_job, job.id)
+        except Exception:
+            log.exception("작업 기록 삭제 실패 – %s", job.id)
+
+    # --------------------------------------------------
+    async def _worker(self, idx: int) -> None:
+        while True:
+            _, start, _, job = await self._queue.get()
+            self._fair[job.ticket.priority].served(start)
+            token = set_ticket(job.ticket)
+            job.status, job.started_at = JobStatus.RUNNING, _now()
+            JOBS.dec(status="queued")
+            JOBS.inc(status="running")
+            try:
+                await self._publish(job)
+                art = await agenerate_report_formats(job.payload, job.formats)
+                if self.store is not None:
+                    await asyncio.to_thread(self.store.save, job.id, art)
+                job.artifacts, job.status = art, JobStatus.DONE
+            except Exception as exc:
+                log.exception("보고서 작업 실패 – %s", job.id)
+                job.status, job.error = JobStatus.FAILED, str(exc)
+            finally:
+                job.finished_at = _now()
+                JOBS.dec(status="running")
+                job.payload = None  # type: ignore[assignment]  # 본문 메모리 해제
+                reset_ticket(token)
+                self._queue.task_done()
+            try:
+                await self._publish(job)
+            except Exception:
+                log.exception("작업 상태 공유 실패 – %s", job.id)
+            self._prune()  # 제출이 끊겨도 완료 작업이 메모리에 쌓이지 않도록
+
+    def _prune(self) -> None:
+        """보존 기간이 지난 완료 · 실패 작업 정리"""
+        now = _now()
+        expired = [
+            jid for jid, j in self._jobs.items()
+            if j.finished_at and (now - j.finished_at).total_seconds() > self.retention
+        ]
+        for jid in expired:
+            del self._jobs[jid]
+
+
+def create_job_manager() -> JobManager:
+    cfg = get_settings()
+    return JobManager(
+        workers=cfg.JOB_WORKERS,
+        queue_size=cfg.JOB_QUEUE_SIZE,
+        retention=cfg.JOB_RETENTION,
+        store=get_artifact_store(),
+        weights=cfg.SCHED_TENANT_WEIGHTS,
+    )
@@ -0,0 +1,360 @@
+"""
+src/service/report_cache.py
+────────────────────────────────────────────────────────────
+PipelineRequest 내용 기반(content-addressed) 보고서 캐시
+
+· 키 = sha256( 정규화된 payload JSON + 프롬프트 버전 + 템플릿 버전 )
+  ─ 허브 재전송 · /report-json → /report-pdf 연속 호출이 같은 키로 모인다
+  ─ elapsed_time · error 는 보고서 내용과 무관하므로 키에서 제외
+· 엔트리 = <REPORT_CACHE_DIR | OUT_DIR/.cache>/<key>/report.json (+ 렌더된 report.html · report.pdf)
+  ─ report.json(ReportSchema)만 있으면 적중 – json · md 는 여기서 바로, 없는 html · pdf 는
+    그때 렌더해 같은 엔트리에 파일 단위로 추가 (HTML 만 요청한 보고서도 캐시된다)
+· 적중 시 Gemini 호출 없이 load 로 지연 산출물(ReportArtifacts) 구성
+· 만료(REPORT_CACHE_TTL) · 총 용량(REPORT_CACHE_MAX_BYTES) 기준 LRU 정리
+  ─ 디렉터리 전체를 훑으므로 저장마다가 아니라 최대 gc_interval 초에 한 번
+    (그 사이 max_bytes 의 10% 넘게 쓰면 바로 – 초과 폭을 제한)
+· SHARED_BACKEND=redis → RedisReportCache (같은 엔트리 구성을 Redis 키로, 레플리카 간 공유)
+  local 은 REPORT_CACHE_DIR 을 같은 볼륨으로 잡은 워커끼리 그대로 공유된다
+
+증분 재생성 (REPORT_INCREMENTAL)
+· section_hashes – LLM 섹션별 입력 해시
+  ─ summary · actions ← text_stt (+ 파이프라인 청크 원문)
+  ─ analysis          ← text_stt + all_documents · 청크별 related_docs
+  ─ 메타 · 목적 · 주요 논의 · 문서 목록은 LLM 을 거치지 않아 매번 payload 로 다시 렌더
+· 최신 ReportSchema 를 회의록(text_stt) 단위로 <REPORT_CACHE_DIR>/.sections/<key>.json 에 보관
+  ─ 모든 LLM 섹션이 text_stt 에 의존하므로 재사용 가능한 이전 실행은 항상 같은 회의록이다
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+import uuid
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+from config.settings import get_settings
+from src.metrics import CACHE_REQUESTS
+from src.models.schemas import PipelineRequest, ReportSchema
+from src.api_clients.redis_client import get_redis, rkey, ttl_ms, use_redis
+from src.processors.report_builder import (
+    FORMATS, Output, ReportArtifacts, Source, get_report_builder, read_source,
+)
+from src.processors.action_processor import ActionProcessor
+from src.processors.combined_processor import CombinedReportProcessor
+from src.processors.integrated_analysis_processor import IntegratedAnalysisProcessor
+from src.processors.pdf_renderer import STYLESHEET
+from src.processors.summary_processor import SummaryProcessor
+
+log = logging.getLogger(__name__)
+
+_TEMPLATE_FILES = ("report_template.html", STYLESHEET)
+_CACHED_FORMATS = ("html", "pdf")  # json · md 는 report.json 에서 바로 렌더할 만큼 싸다
+_KEY_EXCLUDE = {"elapsed_time", "error"}
+
+
+# ----------------------------------------------------------- 키 계산
+def _sha256(*parts: str) -> str:
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+@lru_cache
+def prompt_version() -> str:
+    """프로세서 시스템 프롬프트 · 문서 컨텍스트 설정이 바뀌면 캐시가 자동 무효화된다."""
+    cfg = get_settings()
+    return _sha256(
+        SummaryProcessor.SYS, SummaryProcessor.SYS_MAP, SummaryProcessor.SYS_REDUCE,
+        ActionProcessor.SYS, ActionProcessor.SYS_REDUCE,
+        IntegratedAnalysisProcessor.SYS, IntegratedAnalysisProcessor.SYS_SUMMARY,
+        CombinedReportProcessor.SYS,
+        json.dumps(CombinedReportProcessor.RESPONSE_SCHEMA, sort_keys=True),
+        cfg.REPORT_MODE,
+        str(cfg.CONTEXT_TOKEN_BUDGET), str(cfg.CONTEXT_MMR_LAMBDA),
+    )[:16]
+
+
+@lru_cache
+def template_version() -> str:
+    h = hashlib.sha256()
+    for name in _TEMPLATE_FILES:
+        h.update((get_settings().template_dir / name).read_bytes())
+    return h.hexdigest()[:16]
+
+
+def cache_key(p: PipelineRequest) -> str:
+    payload = p.model_dump(mode="json", exclude=_KEY_EXCLUDE)
+    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return _sha256(canonical, prompt_version(), template_version())
+
+
+def transcript_key(p: PipelineRequest) -> str:
+    """증분 재생성 시 이전 실행을 찾는 키 (회의록 원문 기준)"""
+    return _sha256(p.text_stt)
+
+
+def section_hashes(p: PipelineRequest) -> Dict[str, str]:
+    """LLM 섹션별 입력 해시 – 이전 실행과 같으면 그 섹션은 다시 만들 필요가 없다"""
+    transcript = (p.text_stt, "\n".join(c.chunk_en for c in p.chunks), prompt_version())
+    docs = json.dumps(
+        [[(d.page_content, d.score) for d in p.all_documents]]
+        + [[(d.page_content, d.score) for d in c.related_docs] for c in p.chunks],
+        ensure_ascii=False,
+    )
+    return {
+        "summary": _sha256("summary", *transcript)[:16],
+        "actions": _sha256("actions", *transcript)[:16],
+        "analysis": _sha256("analysis", *transcript, docs)[:16],
+    }
+
+
+# ----------------------------------------------------------- 캐시 본체
+class ReportCache:
+    def __init__(self, root: Path, *, max_bytes: int, ttl: float, gc_interval: float = 60.0) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.gc_interval = gc_interval
+        self._lock = threading.Lock()
+        self._last_gc = 0.0
+        self._written = 0  # 마지막 정리 이후 쓴 크기 (문자열은 글자 수로 어림)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    # --------------------------------------------------
+    def _entry(self, key: str) -> Path:
+        return self.root / key
+
+    def _expired(self, entry: Path, now: float) -> bool:
+        return self.ttl > 0 and now - entry.stat().st_mtime > self.ttl
+
+    # --------------------------------------------------
+    def get(self, key: str) -> Optional[Dict[str, Source]]:
+        """적중 시 {"json"[, "html", "pdf"]} 출처 (있는 것만), 미스 · 만료 시 None"""
+        paths = self._lookup(key)
+        CACHE_REQUESTS.inc(cache="report", result="miss" if paths is None else "hit")
+        if paths is not None:
+            log.debug("♻️  보고서 캐시 적중 → %s", key[:12])
+        return paths
+
+    def _lookup(self, key: str) -> Optional[Dict[str, Source]]:
+        entry = self._entry(key)
+        try:
+            if self._expired(entry, time.time()):
+                shutil.rmtree(entry, ignore_errors=True)
+                return None
+            if not (entry / "report.json").exists():
+                return None
+            paths: Dict[str, Source] = {"json": entry / "report.json"}
+            for fmt in _CACHED_FORMATS:
+                if (path := entry / f"report.{FORMATS[fmt].ext}").exists():
+                    paths[fmt] = path
+            os.utime(entry)  # 최근 사용 시각 갱신 (LRU)
+        except FileNotFoundError:
+            return None
+        return paths
+
+    def load_report(self, key: str) -> Optional[ReportSchema]:
+        path = self._entry(key) / "report.json"
+        if not path.exists():
+            return None
+        return ReportSchema.model_validate_json(path.read_bytes())
+
+    def load(self, paths: Dict[str, Source], p: PipelineRequest) -> Optional[ReportArtifacts]:
+        """
+        get 결과 → 지연 산출물 (캐시된 html · pdf 는 요청될 때 읽는다)
+        메타 · 목적 · 문서는 키에 포함된 payload 와 같으므로 p 에서 가져온다
+        get 이후 정리 · 만료로 report.json 이 사라졌으면 None (미스와 같게 처리)
+        """
+        raw = read_source(paths["json"])
+        if raw is None:
+            return None
+        return get_report_builder().artifacts(
+            report=ReportSchema.model_validate_json(raw),
+            meta=p.meeting_meta,
+            purpose=p.meeting_purpose,
+            docs=p.all_documents,
+            sources={fmt: path for fmt, path in paths.items() if fmt in _CACHED_FORMATS},
+        )
+
+    def put(self, key: str, report: ReportSchema, outputs: Mapping[str, Output]) -> None:
+        """
+        report.json 과 outputs 중 캐시 대상 형식(html · pdf)을 엔트리에 추가
+        파일마다 임시 파일 → os.replace 로 원자적 교체 (읽는 쪽은 반쯤 쓴 파일을 보지 않는다)
+        """
+        entry = self._entry(key)
+        files: Dict[str, Output] = {
+            f"report.{FORMATS[fmt].ext}": out for fmt, out in outputs.items() if fmt in _CACHED_FORMATS
+        }
+        with self._lock:
+            entry.mkdir(parents=True, exist_ok=True)
+            if not (entry / "report.json").exists():
+                files["report.json"] = report.model_dump_json()
+            elif not files:
+                return  # 적중 엔트리에서 json · md 만 만든 경우 – 쓸 것이 없다
+            for name, out in files.items():
+                tmp = entry / f".tmp-{uuid.uuid4().hex}"
+                if isinstance(out, bytes):
+                    tmp.write_bytes(out)
+                else:
+                    tmp.write_text(out, encoding="utf-8")
+                os.replace(tmp, entry / name)
+                self._written += len(out)
+            os.utime(entry)
+            if (time.monotonic() - self._last_gc >= self.gc_interval
+                    or self._written > self.max_bytes // 10):
+                self._evict()
+
+    # -------------------------------------------------- 증분 재생성용 섹션 보관
+    def _sections_path(self, tkey: str) -> Path:
+        return self.root / ".sections" / f"{tkey}.json"
+
+    def load_sections(self, tkey: str) -> Optional[ReportSchema]:
+        """같은 회의록으로 마지막에 만든 ReportSchema (만료 · 없음 → None)"""
+        path = self._sections_path(tkey)
+        try:
+            if self._expired(path, time.time()):
+                path.unlink(missing_ok=True)
+                return None
+            return ReportSchema.model_validate_json(path.read_bytes())
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def put_sections(self, tkey: str, report: ReportSchema) -> None:
+        path = self._sections_path(tkey)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".tmp-{uuid.uuid4().hex}")
+        tmp.write_text(report.model_dump_json(), encoding="utf-8")
+        os.replace(tmp, path)
+
+    # --------------------------------------------------
+    @staticmethod
+    def _size(entry: Path) -> int:
+        return sum(f.stat().st_size for f in entry.iterdir() if f.is_file())
+
+    def _evict(self) -> None:
+        """만료 엔트리 삭제 후, 용량 초과분을 오래 안 쓴 순서로 삭제"""
+        self._last_gc, self._written = time.monotonic(), 0
+        now = time.time()
+        entries: list[tuple[float, int, Path]] = []
+        for entry in self._entries():
+            try:
+                if self._expired(entry, now):
+                    shutil.rmtree(entry, ignore_errors=True)
+                    continue
+                entries.append((entry.stat().st_mtime, self._size(entry), entry))
+            except FileNotFoundError:
+                continue
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+            log.debug("🧹 보고서 캐시 정리 → %s", entry.name[:12])
+
+        # 섹션 보관 파일은 작으므로 만료 기준으로만 정리
+        sections = self.root / ".sections"
+        if self.ttl > 0 and sections.is_dir():
+            for path in sections.iterdir():
+                try:
+                    if self._expired(path, now):
+                        path.unlink()
+                except FileNotFoundError:
+                    continue
+
+    def _entries(self) -> Iterable[Path]:
+        return (e for e in self.root.iterdir() if e.is_dir() and not e.name.startswith("."))
+
+
+class RedisReportCache(ReportCache):
+    """
+    SHARED_BACKEND=redis – 엔트리 = <REDIS_PREFIX>report:<key>:{json,html,pdf}
+    · 적중 시 엔트리 키의 TTL 을 다시 걸어 최근 사용 엔트리를 남긴다
+      (총 용량은 REPORT_CACHE_MAX_BYTES 대신 Redis maxmemory 정책이 관리)
+    · 캐시된 html · pdf 는 적중 시점이 아니라 요청될 때 GET
+    · 섹션 보관 = <REDIS_PREFIX>sections:<tkey>
+    """
+
+    def __init__(self, redis: Any, *, ttl: float) -> None:
+        self.ttl = ttl
+        self._r = redis
+
+    def _key(self, key: str, fmt: str) -> str:
+        return rkey("report", key, fmt)
+
+    def _lookup(self, key: str) -> Optional[Dict[str, Source]]:
+        names = ("json", *_CACHED_FORMATS)
+        keys = [self._key(key, fmt) for fmt in names]
+        pipe = self._r.pipeline(transaction=False)
+        for k in keys:
+            pipe.exists(k)
+        if (ttl := ttl_ms(self.ttl)) is not None:
+            for k in keys:
+                pipe.pexpire(k, ttl)  # 최근 사용 시각 갱신 (LRU)
+        found = pipe.execute()[: len(names)]
+        if not found[0]:
+            return None
+        return {
+            fmt: functools.partial(self._r.get, k)
+            for fmt, k, ok in zip(names, keys, found) if ok
+        }
+
+    def load_report(self, key: str) -> Optional[ReportSchema]:
+        raw = self._r.get(self._key(key, "json"))
+        return None if raw is None else ReportSchema.model_validate_json(raw)
+
+    def put(self, key: str, report: ReportSchema, outputs: Mapping[str, Output]) -> None:
+        """report.json 은 처음 것을 유지 (이미 캐시된 html · pdf 와 내용이 어긋나지 않게)"""
+        ttl = ttl_ms(self.ttl)
+        pipe = self._r.pipeline(transaction=False)
+        pipe.set(self._key(key, "json"), report.model_dump_json().encode("utf-8"), px=ttl, nx=True)
+        for fmt, out in outputs.items():
+            if fmt in _CACHED_FORMATS:
+                data = out if isinstance(out, bytes) else out.encode("utf-8")
+                pipe.set(self._key(key, fmt), data, px=ttl)
+        pipe.execute()
+
+    def load_sections(self, tkey: str) -> Optional[ReportSchema]:
+        raw = self._r.get(rkey("sections", tkey))
+        try:
+            return None if raw is None else ReportSchema.model_validate_json(raw)
+        except ValueError:
+            return None
+
+    def put_sections(self, tkey: str, report: ReportSchema) -> None:
+        self._r.set(
+            rkey("sections", tkey), report.model_dump_json().encode("utf-8"), px=ttl_ms(self.ttl)
+        )
+
+
+@lru_cache
+def get_report_cache() -> Optional[ReportCache]:
+    """
+    REPORT_CACHE_ENABLED=false 면 None, SHARED_BACKEND=redis 면 RedisReportCache
+    캐시 디렉터리를 만들 수 없으면 경고 후 캐시 없이 진행
+    """
+    cfg = get_settings()
+    if not cfg.REPORT_CACHE_ENABLED:
+        return None
+    if use_redis():
+        return RedisReportCache(get_redis(), ttl=cfg.REPORT_CACHE_TTL)
+    try:
+        return ReportCache(
+            cfg.report_cache_dir,
+            max_bytes=cfg.REPORT_CACHE_MAX_BYTES,
+            ttl=cfg.REPORT_CACHE_TTL,
+        )
+    except OSError as exc:
+        log.warning("⚠️ 보고서 캐시 비활성화 – %s (%s)", cfg.report_cache_dir, exc)
+        return None
@@ -2,40 +2,384 @@
 src/service/report_service.py
 ────────────────────────────────────────────────────────────
 CLI · FastAPI 가 공통으로 호출하는 비즈니스 로직
+
+· 동기(generate_*) · 비동기(agenerate_*) 보고서 생성 – 분리 3회 호출 또는
+  REPORT_MODE=combined 구조화 1회 호출(파싱 실패 시 분리 경로로 폴백)
+· 긴 원문은 요약 · 액션을 청크 단위 map-reduce 로 처리
+· report_cache 재사용 · 섹션 단위 증분 재생성 · HTML 스트리밍(astream_report_html)
+· Gemini · 파이프라인 클라이언트와 실행기는 첫 사용 시 생성 (임포트 시 연결 · 스레드 없음)
 """
 
 from __future__ import annotations
+import asyncio
+import contextvars
+import functools
+import logging
+import threading
+from contextlib import aclosing
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict
+from typing import Any, AsyncIterator, Awaitable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from markupsafe import Markup, escape
 
 from config.settings import get_settings
-from src.api_clients.gemini_client import GeminiClient
+from src.api_clients.batching import AsyncBatchedGeminiClient, BatchedGeminiClient, get_gemini_batcher
+from src.api_clients.gemini_client import AsyncGeminiClient, GeminiClient, get_completion_cache
+from src.api_clients.pipeline_client import AsyncPipelineClient, PipelineClient
+from src.api_clients.rate_limit import get_hedger, get_rate_limiter, get_retry_policy
+from src.metrics import IN_FLIGHT
 from src.processors.summary_processor import SummaryProcessor
 from src.processors.action_processor import ActionProcessor
 from src.processors.integrated_analysis_processor import IntegratedAnalysisProcessor
-from src.processors.report_builder import ReportBuilder
-from src.models.schemas import ReportSchema, MeetingMeta, SearchDoc  # SearchDoc 복구됨
+from src.processors.combined_processor import CombinedReportProcessor
+from src.processors.context_builder import get_context_builder
+from src.processors.report_builder import FORMATS, Output, ReportArtifacts, get_report_builder
+from src.service import scheduler
+from src.service.artifact_store import get_artifact_store
+from src.service.report_cache import cache_key, get_report_cache, section_hashes, transcript_key
+from src.utils import chunk_transcript
+from src.models.enums import ReportFormat
+from src.models.schemas import PipelineRequest, ReportSchema, MeetingMeta, SearchDoc  # SearchDoc 복구됨
+
+log = logging.getLogger(__name__)
+
+# ───────── 클라이언트 · 실행기 – 첫 사용 시 생성 (임포트만으로는 연결 · 스레드를 만들지 않는다) ─────────
+@lru_cache
+def _gem() -> GeminiClient:
+    """동기 Gemini – 비동기 클라이언트와 같은 쿼터 버킷 · 재시도 정책 · 응답 캐시 공유"""
+    # LLM_BATCH_WINDOW > 0 → 동기 · 비동기 경로 모두 같은 배처로 모아 보낸다 (스트리밍 제외)
+    if (batcher := get_gemini_batcher()) is not None:
+        return BatchedGeminiClient(batcher)  # type: ignore[return-value]
+    return GeminiClient(
+        get_settings().LLM_API, cache=get_completion_cache(),
+        limiter=get_rate_limiter(), retry=get_retry_policy(), concurrency=_llm_slots(),
+    )
+
+
+@lru_cache
+def _llm_slots() -> threading.BoundedSemaphore:
+    """동기 Gemini 전송 상한 – _llm_pool 작업과 그 안의 map-reduce 스레드가 함께 나눠 쓴다"""
+    return threading.BoundedSemaphore(get_settings().LLM_CONCURRENCY)
+
+
+@lru_cache
+def _agem() -> AsyncGeminiClient:
+    client = AsyncGeminiClient(
+        get_settings().LLM_API, cache=get_completion_cache(),
+        limiter=get_rate_limiter(), retry=get_retry_policy(), hedger=get_hedger(),
+    )
+    if (batcher := get_gemini_batcher()) is not None:
+        return AsyncBatchedGeminiClient(batcher, client)  # type: ignore[return-value]
+    return client
+
+
+@lru_cache
+def _pipe() -> PipelineClient:
+    return PipelineClient(str(get_settings().PIPELINE_API))
+
+
+@lru_cache
+def _apipe() -> AsyncPipelineClient:
+    return AsyncPipelineClient(str(get_settings().PIPELINE_API))
+
+
+@lru_cache
+def _llm_pool() -> ThreadPoolExecutor:
+    """모든 요청이 공유하는 Gemini 호출 풀 (동시 호출 수 상한)"""
+    return ThreadPoolExecutor(
+        max_workers=get_settings().LLM_CONCURRENCY,
+        thread_name_prefix="gemini",
+    )  # 실제 동시 전송 수는 _llm_slots 가 제한
+
 
+@lru_cache
+def _render_pool() -> ThreadPoolExecutor:
+    """CPU 바운드 HTML·PDF 렌더 전용 executor (이벤트 루프 / 기본 스레드 풀과 분리)"""
+    return ThreadPoolExecutor(
+        max_workers=get_settings().RENDER_CONCURRENCY,
+        thread_name_prefix="render",
+    )
+
+
+def _offload(fn, *args) -> "asyncio.Future[Any]":
+    """_render_pool 로 넘기되 현재 contextvar(Server-Timing span 수집)를 그대로 전달"""
+    call = functools.partial(contextvars.copy_context().run, fn, *args)
+    return asyncio.get_running_loop().run_in_executor(_render_pool(), call)
 
-_cfg = get_settings()
-_gem = GeminiClient(_cfg.LLM_API)
+
+# LLM 이 만드는 섹션 (증분 재생성 단위 – report_cache.section_hashes 와 같은 이름)
+_LLM_SECTIONS = ("summary", "actions", "analysis")
 
 
 def _build_report_model(p: PipelineRequest,
-                        summary: str,
-                        actions: list[str],
-                        analysis: str) -> ReportSchema:
+                        sections: Dict[str, Any],
+                        input_hashes: Optional[Dict[str, str]] = None) -> ReportSchema:
+    """sections = {"summary", "actions", "analysis"[, "decisions", "risks"]}"""
     return ReportSchema(
         meeting_title=p.meeting_meta.title,
-        executive_summary=summary,
+        executive_summary=sections["summary"],
         agenda_keypoints=p.insights,
-        decisions=[],
-        action_items=actions,
-        risks=[],
-        appendix=[analysis],
+        decisions=sections.get("decisions", []),
+        action_items=sections["actions"],
+        risks=sections.get("risks", []),
+        appendix=[sections["analysis"]],
+        input_hashes=input_hashes or {},
+    )
+
+
+def _sections_of(report: ReportSchema) -> Dict[str, Any]:
+    """_build_report_model 의 역변환"""
+    return {
+        "summary": report.executive_summary,
+        "actions": report.action_items,
+        "decisions": report.decisions,
+        "risks": report.risks,
+        "analysis": report.appendix[0] if report.appendix else "",
+    }
+
+
+def _transcript_chunks(p: PipelineRequest) -> Optional[List[str]]:
+    """긴 회의록이면 map-reduce 청크 목록, 아니면 None"""
+    limit = get_settings().MAP_REDUCE_THRESHOLD
+    if not limit or len(p.text_stt) <= limit:
+        return None
+    chunks = chunk_transcript(
+        p.text_stt, get_settings().MAP_CHUNK_CHARS, [c.chunk_en for c in p.chunks],
+        overlap=get_settings().MAP_CHUNK_OVERLAP,
+    )
+    return chunks if len(chunks) > 1 else None
+
+
+def _context_docs(p: PipelineRequest) -> List[SearchDoc]:
+    """LLM 프롬프트용 문서 – all_documents + 청크별 related_docs 를 중복 제거 · MMR 순위화"""
+    return get_context_builder().select(p)
+
+
+def _run_processors(p: PipelineRequest,
+                    chunks: Optional[List[str]] = None,
+                    names: Sequence[str] = _LLM_SECTIONS,
+                    summary: Optional[str] = None) -> Dict[str, Any]:
+    """
+    요약 / 액션 / 통합 분석 중 names 에 해당하는 것을 동시에 실행하고 sections dict 반환.
+    chunks(map-reduce)면 통합 분석은 요약 결과(재생성하지 않으면 summary)로 요약 뒤에 실행.
+    하나라도 실패하면 해당 RuntimeError 를 그대로 전파한다.
+    """
+    mr = dict(fanout=get_settings().MAP_FANOUT, group_chars=get_settings().MAP_CHUNK_CHARS)
+    futures = {}
+    if "summary" in names:
+        futures["summary"] = (
+            _llm_pool().submit(SummaryProcessor(_gem()).run_chunks, chunks, **mr) if chunks
+            else _llm_pool().submit(SummaryProcessor(_gem()).run, p.text_stt)
+        )
+    if "actions" in names:
+        futures["actions"] = (
+            _llm_pool().submit(ActionProcessor(_gem()).run_chunks, chunks, **mr) if chunks
+            else _llm_pool().submit(ActionProcessor(_gem()).run, p.text_stt)
+        )
+    if "analysis" in names:
+        if chunks and "summary" in futures:
+            # 풀 작업 안에서 다른 풀 작업을 기다리지 않도록 요약은 호출 스레드에서 받는다
+            summary = futures["summary"].result()
+        if chunks and summary:
+            futures["analysis"] = _llm_pool().submit(
+                IntegratedAnalysisProcessor(_gem()).run, summary, _context_docs(p), summarized=True
+            )
+        else:
+            futures["analysis"] = _llm_pool().submit(
+                IntegratedAnalysisProcessor(_gem()).run, p.text_stt, _context_docs(p)
+            )
+    return {name: f.result() for name, f in futures.items()}
+
+
+async def _arun_processors(p: PipelineRequest,
+                           chunks: Optional[List[str]] = None,
+                           names: Sequence[str] = _LLM_SECTIONS,
+                           summary: Optional[str] = None) -> Dict[str, Any]:
+    """_run_processors 의 비동기 버전 (AsyncGeminiClient 공유, 요약 · 액션 map-reduce 는 MAP_FANOUT 을 나눠 쓴다)"""
+    mr = dict(fanout=get_settings().MAP_FANOUT, group_chars=get_settings().MAP_CHUNK_CHARS,
+              sem=asyncio.Semaphore(get_settings().MAP_FANOUT))
+    coros: Dict[str, Any] = {}
+    if "summary" in names:
+        coros["summary"] = asyncio.ensure_future(
+            SummaryProcessor(_agem()).arun_chunks(chunks, **mr) if chunks
+            else SummaryProcessor(_agem()).arun(p.text_stt)
+        )
+    if "actions" in names:
+        coros["actions"] = (
+            ActionProcessor(_agem()).arun_chunks(chunks, **mr) if chunks
+            else ActionProcessor(_agem()).arun(p.text_stt)
+        )
+    if "analysis" in names:
+        if chunks and ("summary" in coros or summary):
+            coros["analysis"] = _aanalysis_of_summary(p, coros.get("summary") or summary)
+        else:
+            coros["analysis"] = IntegratedAnalysisProcessor(_agem()).arun(p.text_stt, _context_docs(p))
+    return dict(zip(coros, await asyncio.gather(*coros.values())))
+
+
+async def _aanalysis_of_summary(p: PipelineRequest, summary: "str | Awaitable[str]") -> str:
+    """map-reduce 통합 요약이 나오면 그것으로 통합 분석"""
+    if not isinstance(summary, str):
+        summary = await summary
+    return await IntegratedAnalysisProcessor(_agem()).arun(summary, _context_docs(p), summarized=True)
+
+
+def _use_combined(chunks: Optional[List[str]]) -> bool:
+    # 긴 회의록(map-reduce 대상)은 1회 호출에 담지 않는다
+    return get_settings().REPORT_MODE == "combined" and not chunks
+
+
+def _generate_sections(p: PipelineRequest) -> Dict[str, Any]:
+    """REPORT_MODE 에 따라 1회 구조화 호출 또는 분리 호출"""
+    chunks = _transcript_chunks(p)
+    if _use_combined(chunks):
+        try:
+            # 동시 호출 상한(LLM_CONCURRENCY)을 지키도록 공유 풀에서 실행
+            return _llm_pool().submit(
+                CombinedReportProcessor(_gem()).run, p.text_stt, _context_docs(p)
+            ).result()
+        except ValueError as exc:
+            log.warning("🔁 구조화 응답 파싱 실패 – 분리 호출로 폴백: %s", exc)
+    return _run_processors(p, chunks)
+
+
+async def _agenerate_sections(p: PipelineRequest) -> Dict[str, Any]:
+    chunks = _transcript_chunks(p)
+    if _use_combined(chunks):
+        try:
+            return await CombinedReportProcessor(_agem()).arun(p.text_stt, _context_docs(p))
+        except ValueError as exc:
+            log.warning("🔁 구조화 응답 파싱 실패 – 분리 호출로 폴백: %s", exc)
+    return await _arun_processors(p, chunks)
+
+
+# CLI · /report-pdf · 비동기 작업의 기본 산출물
+_DEFAULT_FORMATS = (ReportFormat.HTML, ReportFormat.PDF)
+
+
+def _artifacts(p: PipelineRequest, report_m: ReportSchema) -> ReportArtifacts:
+    """ReportSchema → 지연 산출물 (아직 아무 형식도 렌더하지 않음)"""
+    return get_report_builder().artifacts(
+        report=report_m,
+        meta=p.meeting_meta,
+        purpose=p.meeting_purpose,
+        docs=p.all_documents,
     )
 
 
+def _write_files(art: ReportArtifacts,
+                 out_dir: Path,
+                 formats: Iterable[str] = _DEFAULT_FORMATS) -> Dict[str, Path]:
+    """out_dir/report.<ext> 로 저장 후 {형식: 경로} 반환 (없는 형식은 이때 렌더)"""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    return {str(fmt): art.write(fmt, out_dir / f"report.{FORMATS[fmt].ext}") for fmt in formats}
+
+
+# 응답 이후 처리되는 디스크 쓰기 (캐시 저장 · 산출물 보관) – 종료 시 aclose 에서 대기
+_pending: Set["asyncio.Future[Any]"] = set()
+
+
+def _background(fn, *args) -> None:
+    fut = asyncio.ensure_future(asyncio.to_thread(fn, *args))
+    _pending.add(fut)
+
+    def _done(f: "asyncio.Future[Any]") -> None:
+        _pending.discard(f)
+        if not f.cancelled() and f.exception() is not None:
+            log.warning("💾 백그라운드 저장 실패: %s", f.exception())
+
+    fut.add_done_callback(_done)
+
+
+def _cached(p: PipelineRequest) -> Tuple[str, Optional[ReportArtifacts]]:
+    """(캐시 키, 적중 시 캐시 파일을 원본으로 하는 지연 산출물)"""
+    key = cache_key(p)
+    cache = get_report_cache()
+    hit = cache.get(key) if cache is not None else None
+    return key, (cache.load(hit, p) if hit is not None else None)
+
+
+def _store(key: str, art: ReportArtifacts) -> None:
+    """이번에 새로 렌더한 형식을 보고서 캐시에 추가 (백그라운드)"""
+    if (cache := get_report_cache()) is not None:
+        _background(cache.put, key, art.report, art.fresh())
+
+
+# ─────────────────────────── 증분 재생성 ────────────────────────────
+def _reusable(p: PipelineRequest) -> Tuple[Dict[str, str], Dict[str, Any], List[str]]:
+    """
+    (이번 입력 해시, 이전 실행 섹션, 다시 만들어야 할 섹션명)
+    REPORT_INCREMENTAL=false · 보고서 캐시 꺼짐 · 이전 실행 없음 → 전부 재생성
+    """
+    hashes = section_hashes(p)
+    cache = get_report_cache()
+    prev = (
+        cache.load_sections(transcript_key(p))
+        if cache is not None and get_settings().REPORT_INCREMENTAL else None
+    )
+    if prev is None:
+        return hashes, {}, list(_LLM_SECTIONS)
+    stale = [name for name in _LLM_SECTIONS if prev.input_hashes.get(name) != hashes[name]]
+    return hashes, _sections_of(prev), stale
+
+
+def _stale_plan(stale: List[str]) -> str:
+    """재생성 방식: reuse(호출 없음) · full(전체 경로) · partial(바뀐 섹션만 분리 호출)"""
+    if not stale:
+        return "reuse"
+    if len(stale) == len(_LLM_SECTIONS):
+        return "full"
+    # combined 모드에서 요약·액션이 바뀌면 결정 · 리스크도 함께 갱신해야 하므로 1회 호출로 처리
+    if get_settings().REPORT_MODE == "combined" and len(stale) > 1:
+        return "full"
+    return "partial"
+
+
+def _save_sections(p: PipelineRequest, report_m: ReportSchema) -> None:
+    if (cache := get_report_cache()) is not None and get_settings().REPORT_INCREMENTAL:
+        cache.put_sections(transcript_key(p), report_m)
+
+
+def _generate_report_model(p: PipelineRequest) -> ReportSchema:
+    """입력이 그대로인 LLM 섹션은 이전 실행 결과를 재사용해 ReportSchema 조립"""
+    hashes, prev, stale = _reusable(p)
+    plan = _stale_plan(stale)
+    if plan == "full":
+        sections = _generate_sections(p)
+    else:
+        log.info("♻️  섹션 재사용 – 재생성 대상: %s", ", ".join(stale) or "없음")
+        if plan == "partial":
+            prev.update(_run_processors(p, _transcript_chunks(p), stale, prev.get("summary")))
+        sections = prev
+
+    report_m = _build_report_model(p, sections, hashes)
+    if stale:
+        _save_sections(p, report_m)
+    return report_m
+
+
+async def _agenerate_report_model(p: PipelineRequest) -> ReportSchema:
+    """_generate_report_model 의 비동기 버전 (섹션 보관 쓰기는 백그라운드)"""
+    hashes, prev, stale = await _offload(_reusable, p)
+    plan = _stale_plan(stale)
+    if plan == "full":
+        async with scheduler.slot("llm"):
+            sections = await _agenerate_sections(p)
+    else:
+        log.info("♻️  섹션 재사용 – 재생성 대상: %s", ", ".join(stale) or "없음")
+        if plan == "partial":
+            async with scheduler.slot("llm"):
+                prev.update(await _arun_processors(p, _transcript_chunks(p), stale, prev.get("summary")))
+        sections = prev
+
+    report_m = _build_report_model(p, sections, hashes)
+    if stale:
+        _background(_save_sections, p, report_m)
+    return report_m
+
+
 def generate_report_from_pipeline_json(
         p: PipelineRequest,
         out_dir: Path) -> Dict[str, Path]:
@@ -43,28 +387,254 @@ def generate_report_from_pipeline_json(
     허브-API JSON(PipelineRequest) → Gemini → HTML·PDF 생성
     반환: {"html": Path, "pdf": Path}
     """
-    out_dir.mkdir(parents=True, exist_ok=True)
-    html_path = out_dir / "report.html"
-    pdf_path  = out_dir / "report.pdf"
-
-    # ─ Gemini 요약/액션/통합 분석 ─
-    summary   = SummaryProcessor(_gem).run(p.text_stt)
-    actions   = ActionProcessor(_gem).run(p.text_stt)
-    analysis  = IntegratedAnalysisProcessor(_gem).run(
-        p.text_stt,
-        [d.model_dump() for d in p.all_documents],
+    key, art = _cached(p)
+    if art is None:
+        # ─ Gemini 요약/액션/통합 분석 (입력이 그대로인 섹션은 재사용) ─
+        art = _artifacts(p, _generate_report_model(p))
+
+    # ─ HTML + PDF ─
+    paths = _write_files(art, out_dir)
+    if (cache := get_report_cache()) is not None:
+        cache.put(key, art.report, art.fresh())
+    return paths
+
+
+def generate_report(
+        stt_text: str,
+        out_dir: Path,
+        *,
+        clusters: int = 5,
+        top_k: int = 5,
+        target_lang: str = "ko") -> Dict[str, Path]:
+    """
+    CLI 용: STT 원문 → Pipeline API(/pipeline-run) → generate_report_from_pipeline_json
+    반환: {"html": Path, "pdf": Path}
+    """
+    raw = _pipe().run(
+        text_stt=stt_text,
+        num_clusters=clusters,
+        top_k=top_k,
+        target_lang=target_lang,
     )
+    return generate_report_from_pipeline_json(PipelineRequest.model_validate(raw), out_dir)
 
-    report_m  = _build_report_model(p, summary, actions, analysis)
 
-    # ─ HTML + PDF ─
-    ReportBuilder().build_report(
-        report=report_m,
+async def agenerate_report(
+        stt_text: str,
+        formats: Sequence[str] = _DEFAULT_FORMATS,
+        *,
+        clusters: int = 5,
+        top_k: int = 5,
+        target_lang: str = "ko") -> ReportArtifacts:
+    """
+    서버용: STT 원문 → 비동기 Pipeline API → agenerate_report_formats
+    (동일 STT 동시 요청은 Pipeline 1회 호출로 합쳐짐)
+    """
+    raw = await _apipe().run(
+        text_stt=stt_text,
+        num_clusters=clusters,
+        top_k=top_k,
+        target_lang=target_lang,
+    )
+    p = await asyncio.to_thread(PipelineRequest.model_validate, raw)
+    return await agenerate_report_formats(p, formats)
+
+
+async def agenerate_report_from_pipeline_json(
+        p: PipelineRequest,
+        out_dir: Path) -> Dict[str, Path]:
+    """
+    generate_report_from_pipeline_json 의 비동기 버전
+    agenerate_report_artifacts 결과를 out_dir 에 저장하고 경로 반환
+    """
+    art = await agenerate_report_artifacts(p)
+    return await asyncio.to_thread(_write_files, art, out_dir)
+
+
+async def agenerate_report_formats(
+        p: PipelineRequest,
+        formats: Sequence[str] = _DEFAULT_FORMATS,
+        *,
+        persist_as: Optional[str] = None) -> ReportArtifacts:
+    """
+    서버용: ReportSchema 1회 생성 → formats 만 메모리에서 렌더해 반환 (응답 전 디스크 쓰기 없음)
+    · 캐시 적중이면 Gemini 호출 없이 캐시된 ReportSchema · 파일에서 출발
+    · 캐시 저장과 persist_as(ARTIFACT_PERSIST=true 일 때 산출물 보관소 <id>) 보관은 백그라운드
+    """
+    with IN_FLIGHT.track(kind="report"):
+        key, art = await _offload(_cached, p)
+        if art is None:
+            art = _artifacts(p, await _agenerate_report_model(p))
+        await _arender(art, formats)
+        _store(key, art)
+
+    if persist_as and (store := get_artifact_store()) is not None:
+        _background(store.save, persist_as, art)
+    return art
+
+
+async def _arender(art: ReportArtifacts, formats: Sequence[str]) -> None:
+    """formats 를 렌더 executor 에서 생성 – PDF 를 새로 렌더해야 하면 scheduler pdf 슬롯 안에서"""
+    pdf = ReportFormat.PDF in formats and art.needs_render(ReportFormat.PDF)
+    rest = [fmt for fmt in formats if not (pdf and fmt == ReportFormat.PDF)]
+    if rest:
+        await _offload(art.render, *rest)
+    if pdf:
+        async with scheduler.slot("pdf"):
+            await _offload(art.get, ReportFormat.PDF)
+
+
+async def arender_format(art: ReportArtifacts, fmt: str) -> Output:
+    """아직 렌더하지 않은 형식을 렌더 executor 에서 생성 (이미 있으면 그대로)"""
+    if (out := art.rendered().get(fmt)) is not None:
+        return out
+    await _arender(art, (fmt,))
+    return art.get(fmt)
+
+
+async def agenerate_report_artifacts(
+        p: PipelineRequest,
+        *,
+        persist_as: Optional[str] = None) -> ReportArtifacts:
+    """HTML + PDF 를 렌더해 둔 산출물"""
+    return await agenerate_report_formats(p, _DEFAULT_FORMATS, persist_as=persist_as)
+
+
+async def agenerate_report_html(p: PipelineRequest) -> str:
+    """HTML 만 생성 (WeasyPrint 호출 없음)"""
+    art = await agenerate_report_formats(p, (ReportFormat.HTML,))
+    return art.html
+
+
+_STREAM_MARK = Markup("<!--stream-->")
+
+
+async def astream_report_html(p: PipelineRequest) -> AsyncIterator[str]:
+    """
+    HTML 스트리밍 (PDF 생략)
+    1) 메타 표 · 목적 · 주요 논의(insights) → 즉시 전송
+    2) 요약 → streamGenerateContent 조각을 도착하는 대로 전송
+    3) 액션 · 통합 분석 → 동시에 시작해 두고 완료되는 대로 전송
+    4) 관련 문서 목록
+    섹션 단위 스트리밍을 위해 REPORT_MODE 와 무관하게 분리 호출을 사용한다.
+    이전 실행의 LLM 섹션을 모두 재사용할 수 있으면 완성된 HTML 을 한 번에 보낸다.
+    LLM 구간은 별도 태스크가 llm 슬롯을 잡고 생성해 버퍼에 쌓는다 – 슬롯은 생성이 끝나면 바로 반납되고
+    느린 클라이언트는 버퍼(보고서 1건 분량)를 제 속도로 읽어 간다.
+    """
+    key, art = await _offload(_cached, p)
+    if art is None:
+        hashes, prev, stale = await _offload(_reusable, p)
+        if not stale:
+            # LLM 섹션을 모두 재사용할 수 있으면 스트리밍할 것 없이 한 번에 렌더
+            art = _artifacts(p, _build_report_model(p, prev, hashes))
+    if art is not None:
+        yield await arender_format(art, ReportFormat.HTML)
+        _store(key, art)
+        return
+
+    builder = get_report_builder()
+
+    static = dict(
         meta=p.meeting_meta,
         purpose=p.meeting_purpose,
+        agenda=p.insights,
         docs=p.all_documents,
-        out_pdf=pdf_path,
-        out_html=html_path,
     )
+    yield builder.render_sections(("header", "purpose", "agenda"), **static)
+
+    # 헤더는 슬롯 없이 바로 보내고, LLM 섹션은 생성 태스크가 버퍼에 넣는 대로 이어 보낸다
+    buf: "asyncio.Queue[Optional[str]]" = asyncio.Queue()
+    producer = asyncio.create_task(_abuffer_llm_sections(buf, p, hashes, static))
+    try:
+        while (piece := await buf.get()) is not None:
+            yield piece
+        await producer  # 생성 중 오류 전파
+    finally:
+        producer.cancel()  # 클라이언트 연결 종료 시 남은 Gemini 호출 취소
+
+
+async def _abuffer_llm_sections(buf: "asyncio.Queue[Optional[str]]",
+                                p: PipelineRequest,
+                                hashes: Dict[str, str],
+                                static: Dict[str, Any]) -> None:
+    """llm 슬롯을 잡고 _astream_llm_sections 조각을 buf 에 넣는다 (끝 · 오류 시 None)"""
+    builder = get_report_builder()
+    try:
+        async with scheduler.slot("llm"), aclosing(_astream_llm_sections(p, hashes, static)) as pieces:
+            async for piece in pieces:
+                buf.put_nowait(piece)
+    except scheduler.DeadlineExceeded as e:
+        # 응답 상태(200)는 이미 나갔으므로 본문에 안내를 남기고 끝낸다
+        buf.put_nowait(builder.render_sections(("summary",), summary=f"⚠️ {e} – 잠시 후 다시 요청해 주세요."))
+        buf.put_nowait(builder.render_sections(("docs",), **static))
+    finally:
+        buf.put_nowait(None)
+
+
+async def _astream_llm_sections(p: PipelineRequest,
+                                hashes: Dict[str, str],
+                                static: Dict[str, Any]) -> AsyncIterator[str]:
+    """astream_report_html 의 요약 · 액션 · 통합 분석 · 문서 구간"""
+    builder = get_report_builder()
+    chunks = _transcript_chunks(p)
+    mr = dict(fanout=get_settings().MAP_FANOUT, group_chars=get_settings().MAP_CHUNK_CHARS,
+              sem=asyncio.Semaphore(get_settings().MAP_FANOUT))
+    actions_t = asyncio.create_task(
+        ActionProcessor(_agem()).arun_chunks(chunks, **mr) if chunks
+        else ActionProcessor(_agem()).arun(p.text_stt)
+    )
+    # 긴 회의록이면 통합 분석은 통합 요약이 나온 뒤에 시작
+    analysis_t: Optional["asyncio.Task[str]"] = None if chunks else asyncio.create_task(
+        IntegratedAnalysisProcessor(_agem()).arun(p.text_stt, _context_docs(p))
+    )
+    try:
+        head, tail = builder.render_sections(("summary",), summary=_STREAM_MARK).split(_STREAM_MARK)
+        yield head
+        if chunks:
+            summary = await SummaryProcessor(_agem()).arun_chunks(chunks, **mr)
+            analysis_t = asyncio.create_task(_aanalysis_of_summary(p, summary))
+            yield str(escape(summary))
+        else:
+            pieces: List[str] = []
+            async for piece in SummaryProcessor(_agem()).astream(p.text_stt):
+                if not pieces:
+                    piece = piece.lstrip()
+                pieces.append(piece)
+                yield str(escape(piece))
+            summary = "".join(pieces).strip()
+        yield tail
+
+        yield builder.render_sections(("actions",), actions=await actions_t)
+        yield builder.render_sections(("analysis",), analysis=await analysis_t)
+        yield builder.render_sections(("docs",), **static)
+
+        sections = {"summary": summary, "actions": actions_t.result(), "analysis": analysis_t.result()}
+        _background(_save_sections, p, _build_report_model(p, sections, hashes))
+    finally:
+        # 클라이언트 연결 종료 · 오류 시 남은 Gemini 호출 취소
+        for t in (actions_t, analysis_t):
+            if t is not None:
+                t.cancel()
+
+
+async def awarm_up() -> None:
+    """
+    서버 기동 시 템플릿 컴파일 · PDF 렌더 풀 · 폰트 예열 (+ 보관 산출물 GC)
+    PDF_WARMUP=false 면 예열 생략 – 기동이 빨라지는 대신 첫 PDF 요청이 렌더 풀 기동을 기다린다
+    """
+    if get_settings().PDF_WARMUP:
+        await _offload(lambda: get_report_builder().warm_up())
+    if (store := get_artifact_store()) is not None:
+        _background(store.gc)
+
 
-    return {"html": html_path, "pdf": pdf_path}
+async def aclose() -> None:
+    """서버 종료 시 남은 백그라운드 저장을 마치고 비동기 HTTP 세션 정리"""
+    if _pending:
+        await asyncio.gather(*_pending, return_exceptions=True)
+    if _agem.cache_info().currsize:
+        await _agem().aclose()
+    if _apipe.cache_info().currsize:
+        await _apipe().aclose()
+    if get_gemini_batcher.cache_info().currsize and (batcher := get_gemini_batcher()) is not None:
+        await asyncio.to_thread(batcher.close)
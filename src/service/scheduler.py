@@ -0,0 +1,301 @@
+"""
+src/service/scheduler.py
+────────────────────────────────────────────────────────────
+보고서 생성 스케줄러 – 우선순위 클래스 · 테넌트별 가중 공정 큐 · 자원별 동시 실행 상한 · 마감 기반 폐기
+
+· 자원 2개를 따로 제한한다 (워커 프로세스마다)
+  ─ llm : 보고서 1건의 ReportSchema 생성 단계 (Gemini 호출 1~N회) – SCHED_LLM_SLOTS
+  ─ pdf : PDF 렌더 – SCHED_PDF_SLOTS (기본 PDF_WORKERS, 렌더 풀 대기열이 차지 않도록)
+  → LLM 이 밀려도 캐시 적중 · PDF 만 필요한 요청은 막히지 않고, 그 반대도 마찬가지
+· 슬롯이 비어 있으면 바로 통과, 차 있으면 대기열에서 다음 순서로 배정
+  ─ 우선순위: interactive 가 batch 보다 항상 먼저
+    SCHED_INTERACTIVE_RESERVED 슬롯은 batch 가 쓰지 못한다 → 백필이 포화시켜도 interactive 는 바로 시작
+  ─ 같은 우선순위 안에서는 테넌트별 가중 공정 큐 (start-time fair queuing, SCHED_TENANT_WEIGHTS)
+    → 한 테넌트가 수천 건을 넣어도 다른 테넌트는 가중치 비율만큼 번갈아 슬롯을 받는다
+· 대기 중 마감이 지나거나, 지금 시작해도 최근 평균 점유 시간 안에 마감을 넘기면 폐기
+  → DeadlineExceeded (서버는 503 + Retry-After, 작업은 failed)
+· 요청 정보(Ticket: 테넌트 · 우선순위 · 마감)는 contextvar 로 전달
+  ─ 서버 미들웨어가 X-Tenant · X-Priority · X-Deadline 헤더로 설정, 작업 큐는 제출 시점 값을 보관
+  ─ 우선순위를 지정하지 않으면 동기 엔드포인트는 interactive, 작업 큐(POST /reports)는 batch
+· 이벤트 루프 전용 – CLI 동기 경로(generate_report_from_pipeline_json)는 거치지 않는다
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from typing import AsyncIterator, Dict, List, Mapping, Optional, Tuple
+
+from config.settings import get_settings
+from src.metrics import SCHED_DROPPED, SCHED_QUEUED, SCHED_WAIT
+from src.models.enums import Priority
+
+log = logging.getLogger(__name__)
+
+_RANK = {Priority.INTERACTIVE: 0, Priority.BATCH: 1}
+
+
+class DeadlineExceeded(RuntimeError):
+    """마감 안에 시작 · 완료할 수 없어 대기 중 폐기 – 클라이언트는 retry_after 초 뒤 재시도"""
+
+    def __init__(self, message: str, *, retry_after: int = 1) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+class Ticket:
+    tenant: str = "default"
+    priority: Optional[Priority] = None   # None → 호출 경로 기본값 (동기 = interactive, 작업 = batch)
+    deadline: Optional[float] = None      # time.monotonic() 기준 절대 시각, None → 클래스 기본 마감
+    created: float = field(default_factory=time.monotonic)
+
+    def with_default(self, priority: Priority) -> "Ticket":
+        return self if self.priority is not None else replace(self, priority=priority)
+
+
+_ticket: ContextVar[Optional[Ticket]] = ContextVar("sched_ticket", default=None)
+
+
+def current_ticket() -> Ticket:
+    return _ticket.get() or Ticket()
+
+
+def set_ticket(ticket: Ticket) -> Token:
+    return _ticket.set(ticket)
+
+
+def reset_ticket(token: Token) -> None:
+    _ticket.reset(token)
+
+
+def ticket_from_headers(headers: Mapping[str, str]) -> Ticket:
+    """X-Tenant · X-Priority(interactive|batch) · X-Deadline(초) → Ticket (잘못된 값은 ValueError)"""
+    tenant = headers.get("x-tenant", "").strip() or "default"
+    if len(tenant) > 64:
+        raise ValueError("X-Tenant 는 64자 이하여야 합니다.")
+    priority = headers.get("x-priority")
+    try:
+        prio = Priority(priority.strip().lower()) if priority else None
+    except ValueError:
+        raise ValueError(f"X-Priority 는 {' · '.join(Priority)} 중 하나여야 합니다.") from None
+    now = time.monotonic()
+    deadline = None
+    if (raw := headers.get("x-deadline")) is not None:
+        seconds = float(raw)  # 숫자가 아니면 ValueError
+        if not 0 < seconds < math.inf:
+            raise ValueError("X-Deadline 은 0 보다 큰 초 단위 값이어야 합니다.")
+        deadline = now + seconds
+    return Ticket(tenant=tenant, priority=prio, deadline=deadline, created=now)
+
+
+class FairTags:
+    """
+    start-time fair queuing 태그 – 작은 태그부터 처리하면 테넌트들이 가중치 비율로 번갈아 처리된다
+    · 같은 테넌트 안에서는 FIFO, 쉬던 테넌트는 현재 가상 시각에서 출발 (밀린 몫을 몰아 받지 않음)
+    """
+
+    def __init__(self, weights: Mapping[str, float]) -> None:
+        self._weights = weights
+        self._vtime = 0.0
+        self._last: Dict[str, float] = {}
+
+    def tag(self, tenant: str) -> float:
+        start = max(self._vtime, self._last.get(tenant, 0.0))
+        self._last[tenant] = start + 1.0 / self._weights.get(tenant, 1.0)
+        if len(self._last) > 4096:  # 지나간 테넌트 정리 (가상 시각보다 뒤처진 태그는 의미 없음)
+            self._last = {t: f for t, f in self._last.items() if f > self._vtime}
+        return start
+
+    def served(self, start: float) -> None:
+        self._vtime = max(self._vtime, start)
+
+
+class _Waiter:
+    __slots__ = ("priority", "start", "deadline", "fut", "queued")
+
+    def __init__(self, priority: Priority, start: float, deadline: Optional[float],
+                 fut: "asyncio.Future[None]") -> None:
+        self.priority = priority
+        self.start = start
+        self.deadline = deadline
+        self.fut = fut
+        self.queued = True
+
+
+class _Resource:
+    """슬롯 수가 정해진 자원 1개 – 대기열 = (우선순위, 공정 큐 태그, 도착 순서) 힙"""
+
+    def __init__(self, name: str, slots: int, reserved: int, weights: Mapping[str, float]) -> None:
+        self.name = name
+        self.limits = {Priority.INTERACTIVE: slots, Priority.BATCH: max(1, slots - reserved)}
+        self.busy = 0
+        self.hold = 0.0  # 최근 슬롯 점유 시간 EWMA(초) – 마감 안에 끝낼 수 있는지 판단
+        self._fair = {p: FairTags(weights) for p in Priority}
+        self._heap: List[Tuple[int, float, int, _Waiter]] = []
+        self._queued = {p: 0 for p in Priority}
+        self._seq = itertools.count()
+
+    def _blocked(self, prio: Priority) -> bool:
+        """슬롯이 없거나 앞설 대기자(같거나 높은 우선순위)가 있으면 대기열로"""
+        if self.busy >= self.limits[prio]:
+            return True
+        return any(self._queued[p] for p in Priority if _RANK[p] <= _RANK[prio])
+
+    async def acquire(self, prio: Priority, tenant: str, deadline: Optional[float]) -> None:
+        t0 = time.monotonic()
+        if not self._blocked(prio):
+            self.busy += 1
+            SCHED_WAIT.observe(0.0, resource=self.name, priority=prio)
+            return
+        if deadline is not None and deadline <= t0:
+            raise self._drop(prio)
+
+        loop = asyncio.get_running_loop()
+        w = _Waiter(prio, self._fair[prio].tag(tenant), deadline, loop.create_future())
+        heapq.heappush(self._heap, (_RANK[prio], w.start, next(self._seq), w))
+        self._queued[prio] += 1
+        SCHED_QUEUED.inc(resource=self.name, priority=prio)
+        timer = loop.call_later(deadline - t0, self._expire, w) if deadline is not None else None
+        try:
+            await w.fut
+        except asyncio.CancelledError:
+            if w.queued:
+                self._leave(w)
+                self._dispatch()
+            elif w.fut.done() and not w.fut.cancelled() and w.fut.exception() is None:
+                self._free()  # 배정 직후 취소 – 슬롯 반납
+            raise
+        finally:
+            if timer is not None:
+                timer.cancel()
+            SCHED_WAIT.observe(time.monotonic() - t0, resource=self.name, priority=prio)
+
+    def release(self, held: float) -> None:
+        self.hold = held if self.hold == 0 else 0.8 * self.hold + 0.2 * held
+        self._free()
+
+    # --------------------------------------------------
+    def _free(self) -> None:
+        self.busy -= 1
+        self._dispatch()
+
+    def _leave(self, w: _Waiter) -> None:
+        w.queued = False
+        self._queued[w.priority] -= 1
+        SCHED_QUEUED.dec(resource=self.name, priority=w.priority)
+
+    def _drop(self, prio: Priority) -> DeadlineExceeded:
+        SCHED_DROPPED.inc(resource=self.name, priority=prio)
+        log.warning("⏳ 마감 초과로 폐기 – %s · %s", self.name, prio)
+        return DeadlineExceeded(
+            f"서버가 혼잡해 마감 안에 처리할 수 없습니다 ({self.name})",
+            retry_after=max(1, math.ceil(self.hold)),
+        )
+
+    def _expire(self, w: _Waiter) -> None:
+        if w.queued and not w.fut.done():
+            self._leave(w)
+            w.fut.set_exception(self._drop(w.priority))
+            self._dispatch()  # 앞을 막던 interactive 대기자가 빠졌으면 batch 가 시작할 수 있다
+
+    def _dispatch(self) -> None:
+        now = time.monotonic()
+        while self._heap:
+            w = self._heap[0][-1]
+            if not w.queued or w.fut.done():  # 취소 · 폐기된 대기자
+                if w.queued:
+                    self._leave(w)
+                heapq.heappop(self._heap)
+                continue
+            if self.busy >= self.limits[w.priority]:
+                break
+            heapq.heappop(self._heap)
+            self._leave(w)
+            if w.deadline is not None and now + self.hold > w.deadline:
+                w.fut.set_exception(self._drop(w.priority))
+                continue
+            self._fair[w.priority].served(w.start)
+            self.busy += 1
+            w.fut.set_result(None)
+
+
+class Scheduler:
+    def __init__(
+        self,
+        *,
+        llm_slots: int,
+        pdf_slots: int,
+        reserved: int = 1,
+        weights: Optional[Mapping[str, float]] = None,
+        deadlines: Optional[Mapping[Priority, float]] = None,
+    ) -> None:
+        weights = dict(weights or {})
+        self.resources = {
+            "llm": _Resource("llm", llm_slots, reserved, weights),
+            "pdf": _Resource("pdf", pdf_slots, reserved, weights),
+        }
+        self.deadlines = dict(deadlines or {})
+
+    def _resolve(self, ticket: Ticket) -> Tuple[Priority, Optional[float]]:
+        prio = ticket.priority or Priority.INTERACTIVE
+        deadline = ticket.deadline
+        if deadline is None and (limit := self.deadlines.get(prio, 0.0)) > 0:
+            deadline = ticket.created + limit
+        return prio, deadline
+
+    @asynccontextmanager
+    async def slot(self, resource: str) -> AsyncIterator[None]:
+        """현재 Ticket 으로 자원 슬롯 1개를 잡고 블록이 끝나면 반납"""
+        res = self.resources[resource]
+        ticket = current_ticket()
+        prio, deadline = self._resolve(ticket)
+        await res.acquire(prio, ticket.tenant, deadline)
+        t0 = time.monotonic()
+        try:
+            yield
+        finally:
+            res.release(time.monotonic() - t0)
+
+
+@lru_cache
+def get_scheduler() -> Optional[Scheduler]:
+    """SCHED_ENABLED=false 면 None (슬롯 제한 없이 바로 실행)"""
+    cfg = get_settings()
+    if not cfg.SCHED_ENABLED:
+        return None
+    sched = Scheduler(
+        llm_slots=cfg.SCHED_LLM_SLOTS,
+        pdf_slots=cfg.SCHED_PDF_SLOTS or max(1, cfg.PDF_WORKERS),
+        reserved=cfg.SCHED_INTERACTIVE_RESERVED,
+        weights=cfg.SCHED_TENANT_WEIGHTS,
+        deadlines={
+            Priority.INTERACTIVE: cfg.SCHED_INTERACTIVE_DEADLINE,
+            Priority.BATCH: cfg.SCHED_BATCH_DEADLINE,
+        },
+    )
+    log.info(
+        "🚦 스케줄러 – llm %d · pdf %d 슬롯 (interactive 전용 %d)",
+        cfg.SCHED_LLM_SLOTS, sched.resources["pdf"].limits[Priority.INTERACTIVE],
+        cfg.SCHED_INTERACTIVE_RESERVED,
+    )
+    return sched
+
+
+@asynccontextmanager
+async def slot(resource: str) -> AsyncIterator[None]:
+    """get_scheduler().slot(resource) – 스케줄러를 끄면 아무것도 하지 않는다"""
+    sched = get_scheduler()
+    if sched is None:
+        yield
+        return
+    async with sched.slot(resource):
+        yield
@@ -6,37 +6,100 @@ STT 파일 유틸리티
     data/meeting.jsonl    →  {"text": "..."} JSON Lines
 
 두 형식을 모두 지원한다.
+
+· iter_lines / iter_sentences / iter_chunks → 제너레이터 (파일 · 원문을 한 줄씩 흘려 보냄)
+  ─ 몇 시간짜리 JSONL 도 리스트 사본 없이 처리, iter_lines(use_mmap=True) 는 mmap 으로 읽는다
+  ─ iter_chunks 는 글자 수 또는 토큰 수(approx_tokens) 기준 경계 + 겹침(overlap) 지원
+· load_lines / split_sentences / split_chunks → 위 제너레이터를 list 로 감싼 기존 API
 """
 
 import json
+import mmap
+import re
+from collections import deque
 from pathlib import Path
-from typing import List, Union
+from typing import Deque, Iterable, Iterator, List, Optional, Sequence
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+_LINE = re.compile(r"[^\r\n]+")
+
 
 # ──────────────────────────────────────────
+def _iter_raw(path: Path, use_mmap: bool) -> Iterator[str]:
+    if not use_mmap:
+        with path.open(encoding="utf-8") as f:
+            yield from f
+        return
+    if path.stat().st_size == 0:  # 빈 파일은 mmap 불가
+        return
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for raw in iter(mm.readline, b""):
+            yield raw.decode("utf-8")
+
+
+def iter_lines(path: Path, *, use_mmap: bool = False) -> Iterator[str]:
+    """
+    평문(.txt) 또는 JSONL(.jsonl) 파일을 한 줄씩 읽어
+    'text' 문자열을 차례로 내보낸다 (빈 줄 생략).
+    """
+    jsonl = path.suffix.lower() == ".jsonl"
+    for raw in _iter_raw(path, use_mmap):
+        ln = raw.strip()
+        if not ln:
+            continue
+        if not jsonl:
+            yield ln
+            continue
+        try:
+            yield json.loads(ln)["text"]
+        except (json.JSONDecodeError, KeyError):
+            # JSON 파싱 실패 시 그대로 문자열로 간주
+            yield ln
+
+
 def load_lines(path: Path) -> List[str]:
     """
     평문(.txt) 또는 JSONL(.jsonl) 파일을 읽어
     'text' 문자열 리스트로 반환한다.
     """
-    raw_lines = path.read_text(encoding="utf-8").splitlines()
+    return list(iter_lines(path))
 
-    # 확장자에 따라 파싱 분기
-    if path.suffix.lower() == ".jsonl":
-        lines: List[str] = []
-        for ln in raw_lines:
-            ln = ln.strip()
-            if not ln:
-                continue
-            try:
-                obj = json.loads(ln)
-                lines.append(obj["text"])
-            except (json.JSONDecodeError, KeyError):
-                # JSON 파싱 실패 시 그대로 문자열로 간주
-                lines.append(ln)
-        return lines
 
-    else:  # .txt 등
-        return [ln.strip() for ln in raw_lines if ln.strip()]
+def iter_chunks(
+    lines: Iterable[str],
+    max_chars: int = 1500,
+    *,
+    max_tokens: Optional[int] = None,
+    overlap: int = 0,
+) -> Iterator[str]:
+    """
+    줄 스트림을 max_chars(또는 max_tokens, approx_tokens 기준) 이하 청크로 병합해 내보낸다.
+    overlap > 0 이면 직전 청크 끝의 줄을 그 크기(같은 단위)까지 다음 청크 앞에 다시 싣는다.
+    한 줄이 상한보다 길면 그 줄 하나로 청크를 만든다.
+    """
+    measure = approx_tokens if max_tokens else len
+    limit = max_tokens or max_chars
+    buf: Deque[str] = deque()
+    sizes: Deque[int] = deque()
+    size = 0
+    fresh = 0  # 마지막 청크 이후 새로 들어온 줄 수
+
+    for text in lines:
+        n = measure(text)
+        if size + n > limit and fresh:
+            yield "\n".join(buf)
+            fresh = 0
+            # 겹침 구간만 남기되 다음 줄이 들어갈 자리는 확보
+            while buf and (size > overlap or size + n > limit):
+                size -= sizes.popleft()
+                buf.popleft()
+        buf.append(text)
+        sizes.append(n)
+        size += n
+        fresh += 1
+
+    if fresh:
+        yield "\n".join(buf)
 
 
 def split_chunks(
@@ -47,17 +110,48 @@ def split_chunks(
     문자열 리스트를 max_chars 기준으로 병합해
     한국어/영어 청크 리스트를 반환한다.
     """
-    chunks: List[str] = []
-    buf: List[str] = []
-    size = 0
+    return list(iter_chunks(lines, max_chars))
 
-    for text in lines:
-        if size + len(text) > max_chars and buf:
-            chunks.append("\n".join(buf))
-            buf, size = [], 0
-        buf.append(text)
-        size += len(text)
 
-    if buf:
-        chunks.append("\n".join(buf))
-    return chunks
+def approx_tokens(text: str) -> int:
+    """
+    Gemini 토큰 수 근사치 (≈ 글자 수 / 4).
+    프롬프트 예산 계산용 – 정확한 값은 usageMetadata 로 확인한다.
+    """
+    return (len(text) + 3) // 4
+
+
+def iter_sentences(text: str) -> Iterator[str]:
+    """
+    한 줄로 이어진 STT 원문(text_stt)을 문장 단위로 차례로 내보낸다.
+    줄바꿈이 있으면 줄 → 문장 순으로 나눈다 (splitlines 사본 없이).
+    """
+    for line in _LINE.finditer(text):
+        for sent in _SENTENCE_END.split(line.group()):
+            if sent.strip():
+                yield sent.strip()
+
+
+def split_sentences(text: str) -> List[str]:
+    """
+    한 줄로 이어진 STT 원문(text_stt)을 문장 단위로 분리한다.
+    줄바꿈이 있으면 줄 → 문장 순으로 나눈다.
+    """
+    return list(iter_sentences(text))
+
+
+def chunk_transcript(
+    text: str,
+    max_chars: int = 1500,
+    pipeline_chunks: Optional[Sequence[str]] = None,
+    *,
+    overlap: int = 0,
+) -> List[str]:
+    """
+    map-reduce 용 청크 목록.
+    파이프라인 청크(ChunkDoc.chunk_en)가 원문을 충분히(90%+) 덮으면 그대로
+    max_chars 기준으로 재병합하고, 아니면 원문을 문장 단위로 흘려 보내며 병합한다.
+    """
+    if pipeline_chunks and sum(map(len, pipeline_chunks)) >= 0.9 * len(text):
+        return list(iter_chunks(pipeline_chunks, max_chars, overlap=overlap))
+    return list(iter_chunks(iter_sentences(text), max_chars, overlap=overlap))
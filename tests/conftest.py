@@ -0,0 +1,42 @@
+"""
+tests/conftest.py
+────────────────────────────────────────────────────────────
+공통 픽스처
+
+· Settings 는 첫 임포트 때 환경 변수를 읽으므로 src 를 임포트하기 전에 더미 값을 넣는다
+  (외부 API 는 호출하지 않는다 – 키 · URL 은 검증만 통과하면 된다)
+· OUT_DIR 은 임시 디렉터리 – 캐시 · 보관소가 /opt 등에 쓰지 않도록
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_ROOT))
+
+os.environ.setdefault("PIPELINE_API", "http://pipeline.invalid/")
+os.environ.setdefault("LLM_API", "http://llm.invalid/v1beta/models/test")
+os.environ.setdefault("API_KEY", "test-api-key-0000")
+os.environ.setdefault("OUT_DIR", tempfile.mkdtemp(prefix="report-tests-"))
+
+from src.models.schemas import PipelineRequest  # noqa: E402
+
+SAMPLE_PIPELINE = _ROOT / "data" / "sample_pipeline.json"
+
+
+@pytest.fixture
+def pipeline_raw() -> dict:
+    """data/sample_pipeline.json 원본 dict (테스트에서 고쳐 쓴다)"""
+    return json.loads(SAMPLE_PIPELINE.read_text(encoding="utf-8"))
+
+
+@pytest.fixture
+def pipeline_request(pipeline_raw: dict) -> PipelineRequest:
+    return PipelineRequest.model_validate(pipeline_raw)
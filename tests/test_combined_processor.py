@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from src.api_clients.gemini_client import AsyncGeminiClient, CompletionCache, GeminiClient
+from src.processors.combined_processor import CombinedReportProcessor
+
+MODEL_URL = "http://llm.invalid/v1beta/models/test"
+VALID = json.dumps({
+    "executive_summary": "요약",
+    "action_items": ["할 일"],
+    "decisions": ["결정"],
+    "risks": ["리스크"],
+    "analysis": "분석",
+}, ensure_ascii=False)
+
+
+@pytest.fixture
+def cache(tmp_path) -> CompletionCache:
+    return CompletionCache(tmp_path / "completions.sqlite3", ttl=0, max_bytes=10 ** 6)
+
+
+def test_unparseable_reply_is_evicted(cache):
+    client = GeminiClient(base_url=MODEL_URL, api_key="test-api-key-0000", cache=cache)
+    proc = CombinedReportProcessor(client)
+    key = client.cache_key(**proc._request("meeting", []))
+    cache.put(key, "not json")  # 이전 호출이 남긴 잘못된 응답
+
+    with pytest.raises(ValueError):
+        proc.run("meeting", [])
+    assert cache.get(key) is None
+
+
+def test_async_unparseable_reply_is_evicted(cache):
+    client = AsyncGeminiClient(base_url=MODEL_URL, api_key="test-api-key-0000", cache=cache)
+    proc = CombinedReportProcessor(client)
+    key = client.cache_key(**proc._request("meeting", []))
+    cache.put(key, "{}")
+
+    async def scenario():
+        with pytest.raises(ValueError):
+            await proc.arun("meeting", [])
+        await client.aclose()
+
+    asyncio.run(scenario())
+    assert cache.get(key) is None
+
+
+def test_valid_reply_stays_cached(cache):
+    client = GeminiClient(base_url=MODEL_URL, api_key="test-api-key-0000", cache=cache)
+    proc = CombinedReportProcessor(client)
+    key = client.cache_key(**proc._request("meeting", []))
+    cache.put(key, VALID)
+
+    assert proc.run("meeting", [])
+    assert cache.get(key) == VALID
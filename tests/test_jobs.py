@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.service.artifact_store import ArtifactStore
+from src.service.jobs import JobManager, QueueFullError
+
+
+def _manager(store=None) -> JobManager:
+    # 워커 없이 – 제출한 작업이 대기열에 그대로 남는다
+    return JobManager(workers=0, queue_size=1, retention=60, store=store)
+
+
+def test_submit_raises_when_queue_is_full(pipeline_request):
+    async def scenario():
+        jobs = _manager()
+        first = await jobs.submit(pipeline_request)
+        with pytest.raises(QueueFullError):
+            await jobs.submit(pipeline_request)
+        return jobs, first
+
+    jobs, first = asyncio.run(scenario())
+    assert list(jobs._jobs) == [first.id]
+
+
+def test_lost_race_removes_the_queued_record(tmp_path, pipeline_request):
+    store = ArtifactStore(tmp_path, retention=60, max_bytes=10 ** 7)
+    jobs = _manager(store)
+    publish = jobs._publish
+
+    async def publish_then_fill(job):
+        # 기록하는 사이 다른 제출이 마지막 자리를 가져간 상황
+        await publish(job)
+        if not jobs._queue.full():
+            jobs._queue.put_nowait((0, 0.0, -1, job))
+
+    jobs._publish = publish_then_fill
+    with pytest.raises(QueueFullError):
+        asyncio.run(jobs.submit(pipeline_request))
+    assert list((tmp_path / ".jobs").iterdir()) == []
+    assert jobs._jobs == {}
+
+
+def test_post_reports_returns_429_when_queue_is_full(monkeypatch, pipeline_request):
+    from src.server import main
+
+    monkeypatch.setattr(main, "_jobs", _manager())
+    client = TestClient(main.app)  # lifespan 없이 – 실제 워커 · Gemini 클라이언트를 띄우지 않는다
+    body = pipeline_request.model_dump_json()
+    headers = {"content-type": "application/json"}
+
+    assert client.post("/reports", content=body, headers=headers).status_code == 202
+    resp = client.post("/reports", content=body, headers=headers)
+    assert resp.status_code == 429
+    assert resp.headers["Retry-After"] == "5"
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from src.api_clients.rate_limit import RetryPolicy, TokenBucket
+
+
+def _status_error(status: int, retry_after: str | None = None) -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "http://llm.invalid/")
+    headers = {"Retry-After": retry_after} if retry_after is not None else {}
+    response = httpx.Response(status, headers=headers, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+# ----------------------------------------------------------- TokenBucket
+def test_reserve_within_capacity_does_not_wait():
+    bucket = TokenBucket(rate=1.0, capacity=2.0)
+    assert bucket.reserve(1) == 0.0
+    assert bucket.reserve(1) == 0.0
+
+
+def test_reserve_queues_callers_in_order():
+    bucket = TokenBucket(rate=1.0, capacity=2.0)
+    bucket.reserve(2)
+    # 잔량을 미리 차감하므로 뒤에 온 호출일수록 오래 기다린다
+    assert bucket.reserve(1) == pytest.approx(1.0, abs=0.05)
+    assert bucket.reserve(1) == pytest.approx(2.0, abs=0.05)
+
+
+def test_reserve_larger_than_capacity_is_clamped():
+    bucket = TokenBucket(rate=1.0, capacity=2.0)
+    assert bucket.reserve(10) == 0.0
+    assert bucket.reserve(1) == pytest.approx(1.0, abs=0.05)
+
+
+def test_pause_blocks_new_reservations():
+    bucket = TokenBucket(rate=2.0, capacity=4.0)
+    bucket.pause(5.0)
+    # 5초 분량이 음수로 깎인 상태에서 1개 더 → 5.5초
+    assert bucket.reserve(1) == pytest.approx(5.5, abs=0.05)
+
+
+def test_pause_does_not_shorten_existing_deficit():
+    bucket = TokenBucket(rate=1.0, capacity=1.0)
+    bucket.reserve(1)
+    bucket.reserve(1)
+    bucket.reserve(1)  # 잔량 -2
+    bucket.pause(1.0)
+    assert bucket.reserve(1) == pytest.approx(3.0, abs=0.05)
+
+
+# ----------------------------------------------------------- RetryPolicy
+def test_retry_after_seconds_is_honoured():
+    policy = RetryPolicy(base=1.0, cap=30.0)
+    delay = policy.next_delay(0, _status_error(429, "3"))
+    assert 3.0 <= delay <= 3.1
+
+
+def test_retry_after_http_date_is_honoured():
+    policy = RetryPolicy(base=1.0, cap=30.0)
+    when = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=10), usegmt=True)
+    delay = policy.next_delay(0, _status_error(503, when))
+    assert 8.0 <= delay <= 10.1
+
+
+def test_retry_after_is_capped():
+    policy = RetryPolicy(base=1.0, cap=5.0)
+    assert policy.next_delay(0, _status_error(429, "120")) <= 5.1
+
+
+def test_without_retry_after_uses_jittered_backoff():
+    policy = RetryPolicy(base=1.0, cap=30.0)
+    for attempt in range(4):
+        assert 0.0 <= policy.next_delay(attempt, _status_error(500)) <= 2 ** attempt
+
+
+def test_non_retryable_status_and_exhausted_attempts():
+    policy = RetryPolicy(max_retries=2)
+    assert policy.next_delay(0, _status_error(400, "1")) is None
+    assert policy.next_delay(2, _status_error(429, "1")) is None
+    assert policy.next_delay(0, ValueError("bad json")) is None
+
+
+def test_transport_errors_are_retried():
+    policy = RetryPolicy(base=0.5)
+    assert policy.next_delay(0, httpx.ConnectError("refused")) is not None
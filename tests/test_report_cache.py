@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import os
+import time
+
+from src.models.schemas import PipelineRequest, ReportSchema
+from src.service.report_cache import ReportCache, cache_key, section_hashes, transcript_key
+
+
+def _report(summary: str = "요약") -> ReportSchema:
+    return ReportSchema(
+        meeting_title="주간 회의",
+        executive_summary=summary,
+        agenda_keypoints=["안건"],
+        decisions=["결정"],
+        action_items=["할 일"],
+        risks=["리스크"],
+        appendix=[],
+    )
+
+
+def _age(path, seconds: float) -> None:
+    t = time.time() - seconds
+    os.utime(path, (t, t))
+
+
+# ----------------------------------------------------------- 키
+def test_key_ignores_elapsed_time_and_error(pipeline_request: PipelineRequest):
+    other = pipeline_request.model_copy(update={"elapsed_time": 99.0, "error": "timeout"})
+    assert cache_key(other) == cache_key(pipeline_request)
+
+
+def test_key_changes_with_payload(pipeline_request: PipelineRequest):
+    other = pipeline_request.model_copy(update={"meeting_purpose": "다른 목적"})
+    assert cache_key(other) != cache_key(pipeline_request)
+
+
+def test_document_change_only_invalidates_analysis(pipeline_request: PipelineRequest):
+    doc = pipeline_request.all_documents[0].model_copy(update={"score": 0.01})
+    other = pipeline_request.model_copy(update={"all_documents": [doc]})
+    before, after = section_hashes(pipeline_request), section_hashes(other)
+    assert transcript_key(other) == transcript_key(pipeline_request)
+    assert [name for name in before if before[name] != after[name]] == ["analysis"]
+
+
+# ----------------------------------------------------------- 저장 · 조회
+def test_put_then_get(tmp_path):
+    cache = ReportCache(tmp_path, max_bytes=10 ** 6, ttl=0)
+    assert cache.get("k") is None
+    cache.put("k", _report(), {"html": "<p>hi</p>", "md": "# ignored"})
+    paths = cache.get("k")
+    assert set(paths) == {"json", "html"}
+    assert cache.load_report("k") == _report()
+
+
+def test_expired_entry_is_a_miss(tmp_path):
+    cache = ReportCache(tmp_path, max_bytes=10 ** 6, ttl=60)
+    cache.put("k", _report(), {})
+    _age(tmp_path / "k", 120)
+    assert cache.get("k") is None
+    assert not (tmp_path / "k").exists()
+
+
+def test_eviction_drops_least_recently_used(tmp_path):
+    body = "x" * 2000
+    probe = ReportCache(tmp_path / "probe", max_bytes=10 ** 6, ttl=0)
+    probe.put("p", _report(body), {})
+    entry_size = ReportCache._size(tmp_path / "probe" / "p")
+
+    cache = ReportCache(tmp_path / "c", max_bytes=int(entry_size * 2.5), ttl=0, gc_interval=3600)
+    cache.put("a", _report(body), {})
+    cache.put("b", _report(body), {})
+    _age(tmp_path / "c" / "a", 100)
+    _age(tmp_path / "c" / "b", 50)
+    assert cache.get("a") is not None  # a 를 최근 사용으로
+
+    cache.gc_interval = 0  # 다음 put 에서 정리
+    cache.put("c", _report(body), {})
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import pytest
+
+from config.settings import get_settings
+from src.models.schemas import PipelineRequest, ReportSchema
+from src.service import report_service
+from src.service.report_cache import ReportCache, section_hashes, transcript_key
+from src.service.report_service import _reusable, _stale_plan
+
+ALL = ["summary", "actions", "analysis"]
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch) -> ReportCache:
+    cache = ReportCache(tmp_path, max_bytes=10 ** 7, ttl=0)
+    monkeypatch.setattr(report_service, "get_report_cache", lambda: cache)
+    monkeypatch.setattr(get_settings(), "REPORT_INCREMENTAL", True)
+    return cache
+
+
+def _previous(p: PipelineRequest) -> ReportSchema:
+    return ReportSchema(
+        meeting_title=p.meeting_meta.title,
+        executive_summary="이전 요약",
+        agenda_keypoints=["안건"],
+        decisions=["이전 결정"],
+        action_items=["이전 할 일"],
+        risks=["이전 리스크"],
+        appendix=[],
+        input_hashes=section_hashes(p),
+    )
+
+
+# ----------------------------------------------------------- _reusable
+def test_no_previous_run_regenerates_everything(cache, pipeline_request):
+    hashes, prev, stale = _reusable(pipeline_request)
+    assert hashes == section_hashes(pipeline_request)
+    assert prev == {}
+    assert stale == ALL
+
+
+def test_unchanged_input_reuses_every_section(cache, pipeline_request):
+    cache.put_sections(transcript_key(pipeline_request), _previous(pipeline_request))
+    _, prev, stale = _reusable(pipeline_request)
+    assert stale == []
+    assert prev["summary"] == "이전 요약"
+    assert prev["actions"] == ["이전 할 일"]
+
+
+def test_document_change_regenerates_analysis_only(cache, pipeline_request):
+    cache.put_sections(transcript_key(pipeline_request), _previous(pipeline_request))
+    doc = pipeline_request.all_documents[0].model_copy(update={"page_content": "새 문서"})
+    changed = pipeline_request.model_copy(update={"all_documents": [doc]})
+    _, _, stale = _reusable(changed)
+    assert stale == ["analysis"]
+
+
+def test_incremental_disabled_ignores_previous_run(cache, pipeline_request, monkeypatch):
+    cache.put_sections(transcript_key(pipeline_request), _previous(pipeline_request))
+    monkeypatch.setattr(get_settings(), "REPORT_INCREMENTAL", False)
+    assert _reusable(pipeline_request)[2] == ALL
+
+
+# ----------------------------------------------------------- _stale_plan
+@pytest.mark.parametrize("mode", ["split", "combined"])
+def test_stale_plan_reuse_and_full(mode, monkeypatch):
+    monkeypatch.setattr(get_settings(), "REPORT_MODE", mode)
+    assert _stale_plan([]) == "reuse"
+    assert _stale_plan(ALL) == "full"
+    assert _stale_plan(["analysis"]) == "partial"
+
+
+def test_stale_plan_combined_mode_regenerates_together(monkeypatch):
+    monkeypatch.setattr(get_settings(), "REPORT_MODE", "combined")
+    assert _stale_plan(["summary", "actions"]) == "full"
+    monkeypatch.setattr(get_settings(), "REPORT_MODE", "split")
+    assert _stale_plan(["summary", "actions"]) == "partial"
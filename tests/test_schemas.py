@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from src.models.schemas import PipelineRequest
+
+
+def _doc(doc_id: str, text: str, score: float) -> dict:
+    return {"page_content": text, "metadata": {"doc_id": doc_id}, "score": score}
+
+
+@pytest.fixture
+def make_request(pipeline_raw: dict):
+    def make(all_documents: list, chunks: list | None = None) -> PipelineRequest:
+        raw = {**pipeline_raw, "all_documents": all_documents}
+        if chunks is not None:
+            raw["chunks"] = chunks
+        return PipelineRequest.model_validate(raw)
+    return make
+
+
+def test_duplicate_documents_keep_highest_score_at_first_position(make_request):
+    p = make_request([
+        _doc("A", "alpha", 0.5),
+        _doc("B", "beta", 0.4),
+        _doc("A", "alpha", 0.9),
+        _doc("B", "beta", 0.1),
+    ])
+    assert [(d.metadata["doc_id"], d.score) for d in p.all_documents] == [("A", 0.9), ("B", 0.4)]
+
+
+def test_same_text_from_different_sources_is_kept(make_request):
+    p = make_request([_doc("A", "same", 0.5), _doc("B", "same", 0.5)])
+    assert len(p.all_documents) == 2
+
+
+def test_identical_documents_across_lists_share_one_instance(make_request):
+    shared = _doc("A", "alpha", 0.7)
+    p = make_request(
+        [shared],
+        chunks=[
+            {"chunk_en": "one", "related_docs": [shared]},
+            {"chunk_en": "two", "related_docs": [shared, _doc("A", "alpha", 0.7)]},
+        ],
+    )
+    first = p.all_documents[0]
+    assert p.chunks[0].related_docs[0] is first
+    assert p.chunks[1].related_docs == [first]
+    assert p.chunks[1].related_docs[0] is first
+
+
+def test_from_json_bytes_matches_model_validate(pipeline_raw: dict):
+    body = json.dumps(pipeline_raw).encode("utf-8")
+    assert PipelineRequest.from_json_bytes(body) == PipelineRequest.model_validate_json(body)
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from src.utils import iter_chunks
+
+
+def _lines(n: int, width: int = 10) -> list[str]:
+    return [f"{i:0{width}d}" for i in range(n)]
+
+
+def test_chunks_respect_limit_without_overlap():
+    lines = _lines(10)
+    chunks = list(iter_chunks(lines, max_chars=25))
+    assert [c.split("\n") for c in chunks] == [lines[i:i + 2] for i in range(0, 10, 2)]
+
+
+def test_overlap_repeats_tail_of_previous_chunk():
+    lines = _lines(10)
+    chunks = [c.split("\n") for c in iter_chunks(lines, max_chars=35, overlap=10)]
+    for prev, cur in zip(chunks, chunks[1:]):
+        assert cur[0] == prev[-1]
+        assert sum(map(len, cur)) <= 35
+    # 겹침을 빼면 모든 줄이 순서대로 한 번씩
+    seen = chunks[0] + [line for c in chunks[1:] for line in c[1:]]
+    assert seen == lines
+
+
+def test_overlap_never_emits_a_chunk_without_new_lines():
+    lines = _lines(5)
+    chunks = [c.split("\n") for c in iter_chunks(lines, max_chars=25, overlap=20)]
+    for prev, cur in zip(chunks, chunks[1:]):
+        assert cur[-1] not in prev
+    assert chunks[-1][-1] == lines[-1]
+
+
+def test_overlong_line_becomes_its_own_chunk():
+    chunks = list(iter_chunks(["short", "x" * 50, "tail"], max_chars=20))
+    assert chunks == ["short", "x" * 50, "tail"]